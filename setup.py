@@ -30,7 +30,8 @@ install_requires = [
     'SpiNNaker_DataSpecification >= 1!5.1.1, < 1!6.0.0',
     'spalloc >= 2.0.2, < 3.0.0',
     'SpiNNFrontEndCommon >= 1!5.1.1, < 1!6.0.0',
-    'numpy', 'lxml', 'six']
+    'numpy', 'lxml', 'six',
+    'futures; python_version == "2.7"']
 if os.environ.get('READTHEDOCS', None) != 'True':
 
     # scipy must be added in config.py as a mock
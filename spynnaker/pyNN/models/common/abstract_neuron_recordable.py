@@ -15,6 +15,7 @@
 
 from six import add_metaclass
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+from spynnaker.pyNN.models.common import recording_export
 
 
 @add_metaclass(AbstractBase)
@@ -70,6 +71,32 @@ class AbstractNeuronRecordable(object):
         """
         # pylint: disable=too-many-arguments
 
+    def export_data(self, variable, n_machine_time_steps, placements,
+                    graph_mapper, buffer_manager, machine_time_step,
+                    directory):
+        """ Write the recorded data to a file in a directory.  By default,\
+            the data is got with :py:meth:`get_data` and then written.
+
+        :param variable:
+        :param n_machine_time_steps:
+        :param placements:
+        :param graph_mapper:
+        :param buffer_manager:
+        :param machine_time_step:
+        :param directory: the directory to write the file in
+        :return: the description of the data for the export index
+        :rtype: dict
+        """
+        # pylint: disable=too-many-arguments
+        data, indexes, sampling_interval = self.get_data(
+            variable, n_machine_time_steps, placements, graph_mapper,
+            buffer_manager, machine_time_step)
+        out = recording_export.open_matrix(directory, variable, data.shape)
+        out[:] = data
+        out.flush()
+        return recording_export.matrix_entry(
+            variable, indexes, sampling_interval)
+
     @abstractmethod
     def get_neuron_sampling_interval(self, variable):
         """ Returns the current sampling interval for this variable
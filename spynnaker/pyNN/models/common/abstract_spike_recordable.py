@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
 from six import add_metaclass
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 
@@ -70,6 +71,30 @@ class AbstractSpikeRecordable(object):
             ordered by time
         """
 
+    def iter_spikes(
+            self, placements, graph_mapper, buffer_manager, machine_time_step,
+            order=None):
+        """ Get the recorded spikes from the object a chunk at a time.\
+            By default, all the spikes are got at once as a single chunk.
+
+        :param placements: the placements object
+        :param graph_mapper: the graph mapper object
+        :param buffer_manager: the buffer manager object
+        :param machine_time_step: the time step of the simulation
+        :param order: \
+            None or "id" for spikes ordered by id and then time, or "time"\
+            for spikes ordered by time and then id; where the spikes are\
+            split into chunks, None gives the spikes of each core in turn
+        :type order: str or None
+        :return: chunks of the ids and times of the spikes
+        :rtype: iterable(tuple(~numpy.ndarray, ~numpy.ndarray))
+        """
+        spikes = self.get_spikes(
+            placements, graph_mapper, buffer_manager, machine_time_step)
+        if order == "time":
+            spikes = spikes[numpy.lexsort((spikes[:, 0], spikes[:, 1]))]
+        yield spikes[:, 0], spikes[:, 1]
+
     @abstractmethod
     def get_spikes_sampling_interval(self):
         """ Return the current sampling interval for spikes
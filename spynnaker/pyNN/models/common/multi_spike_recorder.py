@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
 import math
 import logging
 import struct
@@ -27,6 +28,9 @@ from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 logger = FormatAdapter(logging.getLogger(__name__))
 _TWO_WORDS = struct.Struct("<II")
 
+# The number of recorded times of spikes to decode at once
+_TIMES_PER_CHUNK = 1024
+
 
 class MultiSpikeRecorder(object):
     __slots__ = [
@@ -67,31 +71,17 @@ class MultiSpikeRecorder(object):
         # pylint: disable=too-many-arguments
         spike_times = list()
         spike_ids = list()
-        ms_per_tick = machine_time_step / 1000.0
-
-        vertices = graph_mapper.get_machine_vertices(application_vertex)
         missing = []
+        core_readers = self.__spike_core_readers(
+            buffer_manager, region, placements, graph_mapper,
+            application_vertex, machine_time_step, missing)
         progress = ProgressBar(
-            vertices, "Getting spikes for {}".format(label))
-        for vertex in progress.over(vertices):
-            placement = placements.get_placement_of_vertex(vertex)
-            vertex_slice = graph_mapper.get_slice(vertex)
-
-            # Read the spikes from the buffer manager
-            neuron_param_data, data_missing = \
-                buffer_manager.get_data_by_placement(placement, region)
-            if data_missing:
-                missing.append(placement)
-            self._process_spike_data(
-                vertex_slice, ms_per_tick,
-                int(math.ceil(vertex_slice.n_atoms / 32.0)),
-                neuron_param_data, spike_ids, spike_times)
-
-        if missing:
-            logger.warning(
-                "Population {} is missing spike data in region {} from the"
-                " following cores: {}", label, region,
-                recording_utils.make_missing_string(missing))
+            core_readers, "Getting spikes for {}".format(label))
+        for _, reader in progress.over(core_readers):
+            for ids, times in reader():
+                spike_ids.append(ids)
+                spike_times.append(times)
+        self.__warn_missing(label, region, missing)
 
         if not spike_ids:
             return numpy.zeros((0, 2))
@@ -101,11 +91,87 @@ class MultiSpikeRecorder(object):
         result = numpy.dstack((spike_ids, spike_times))[0]
         return result[numpy.lexsort((spike_times, spike_ids))]
 
+    def iter_spikes(
+            self, label, buffer_manager, region,
+            placements, graph_mapper, application_vertex, machine_time_step,
+            order=None):
+        """ Get the recorded spikes a chunk at a time, so that they don't\
+            all have to be held in memory at once.
+
+        :param order: \
+            None for the spikes of each core in turn, "id" for spikes\
+            ordered by id and then time, or "time" for spikes ordered by\
+            time and then id; with "time", the recorded data of every\
+            core is held until its spikes have all been returned
+        :type order: str or None
+        :return: chunks of the ids and times of the spikes
+        :rtype: iterable(tuple(~numpy.ndarray, ~numpy.ndarray))
+        """
+        # pylint: disable=too-many-arguments
+        missing = []
+        chunks = recording_utils.iter_spike_chunks(
+            self.__spike_core_readers(
+                buffer_manager, region, placements, graph_mapper,
+                application_vertex, machine_time_step, missing),
+            order)
+        return self.__iter_and_warn(chunks, label, region, missing)
+
+    def __iter_and_warn(self, chunks, label, region, missing):
+        for chunk in chunks:
+            yield chunk
+        self.__warn_missing(label, region, missing)
+
     @staticmethod
-    def _process_spike_data(
-            vertex_slice, ms_per_tick, n_words, raw_data, spike_ids,
-            spike_times):
+    def __warn_missing(label, region, missing):
+        if missing:
+            logger.warning(
+                "Population {} is missing spike data in region {} from the"
+                " following cores: {}", label, region,
+                recording_utils.make_missing_string(missing))
+
+    def __spike_core_readers(
+            self, buffer_manager, region, placements, graph_mapper,
+            application_vertex, machine_time_step, missing):
+        # pylint: disable=too-many-arguments
+        ms_per_tick = machine_time_step / 1000.0
+        return [
+            (graph_mapper.get_slice(vertex), functools.partial(
+                self.__read_core_spikes, buffer_manager, region,
+                placements.get_placement_of_vertex(vertex),
+                graph_mapper.get_slice(vertex), ms_per_tick, missing))
+            for vertex in graph_mapper.get_machine_vertices(
+                application_vertex)]
+
+    @classmethod
+    def __read_core_spikes(
+            cls, buffer_manager, region, placement, vertex_slice,
+            ms_per_tick, missing):
         # pylint: disable=too-many-arguments
+        # Read the spikes from the buffer manager
+        neuron_param_data, data_missing = \
+            buffer_manager.get_data_by_placement(placement, region)
+        if data_missing:
+            missing.append(placement)
+        spike_ids = list()
+        spike_times = list()
+        for ids, times in cls._process_spike_data(
+                vertex_slice, ms_per_tick,
+                int(math.ceil(vertex_slice.n_atoms / 32.0)),
+                neuron_param_data):
+            spike_ids.append(ids)
+            spike_times.append(times)
+            if len(spike_ids) >= _TIMES_PER_CHUNK:
+                yield numpy.hstack(spike_ids), numpy.hstack(spike_times)
+                spike_ids = list()
+                spike_times = list()
+        if spike_ids:
+            yield numpy.hstack(spike_ids), numpy.hstack(spike_times)
+
+    @staticmethod
+    def _process_spike_data(vertex_slice, ms_per_tick, n_words, raw_data):
+        """ Decode the ids and times of the spikes of a core, one recorded\
+            time at a time
+        """
         n_bytes_per_block = n_words * BYTES_PER_WORD
         offset = 0
         while offset < len(raw_data):
@@ -116,11 +182,8 @@ class MultiSpikeRecorder(object):
                 count=n_bytes_per_block * n_blocks, offset=offset)
             offset += n_bytes_per_block * n_blocks
 
-            spikes = spike_data.view("<i4").byteswap().view("uint8")
-            bits = numpy.fliplr(numpy.unpackbits(spikes).reshape(
-                (-1, 32))).reshape((-1, n_bytes_per_block * 8))
-            indices = numpy.nonzero(bits)[1]
+            indices = recording_utils.decode_spike_bits(
+                spike_data.reshape(n_blocks, n_bytes_per_block),
+                n_bytes_per_block * 8)[1]
             times = numpy.repeat([time * ms_per_tick], len(indices))
-            indices = indices + vertex_slice.lo_atom
-            spike_ids.append(indices)
-            spike_times.append(times)
+            yield indices + vertex_slice.lo_atom, times
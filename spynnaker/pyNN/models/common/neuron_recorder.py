@@ -15,6 +15,7 @@
 
 from __future__ import division
 from collections import OrderedDict
+import functools
 import logging
 import math
 import numpy
@@ -30,11 +31,16 @@ from spinn_front_end_common.utilities.constants import (
     BYTES_PER_WORD, MICRO_TO_MILLISECOND_CONVERSION, BITS_PER_WORD)
 from spinn_front_end_common.interface.buffer_management import \
     recording_utilities
+from spynnaker.pyNN.models.common import (
+    recording_export, recording_utils)
 from spynnaker.pyNN.models.neural_properties import NeuronParameter
 import itertools
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
+# The number of recorded times of spikes to decode at once
+_SPIKE_ROWS_PER_CHUNK = 1024
+
 
 class _ReadOnlyDict(dict):
     def __readonly__(self, *args, **kwargs):  # pylint: disable=unused-argument
@@ -143,58 +149,31 @@ class NeuronRecorder(object):
             n_rows, n_neurons)
         return placement_data
 
-    @staticmethod
-    def _process_missing_data(
-            missing_str, placement, expected_rows, n_neurons, times,
-            sampling_rate, label, placement_data):
-        missing_str += "({}, {}, {}); ".format(
-            placement.x, placement.y, placement.p)
-        # Start the fragment for this slice empty
-        fragment = numpy.empty((expected_rows, n_neurons))
-        for i in xrange(0, expected_rows):
-            time = i * sampling_rate
-            # Check if there is data for this time step
-            local_indexes = numpy.where(times == time)
-            if len(local_indexes[0]) == 1:
-                fragment[i] = placement_data[local_indexes[0]]
-            elif len(local_indexes[0]) > 1:
-                fragment[i] = placement_data[local_indexes[0], 1:]
-                logger.warning(
-                    "Population {} has multiple recorded data for time {}",
-                    label, time)
-            else:
-                # Set row to nan
-                fragment[i] = numpy.full(n_neurons, numpy.nan)
-        return fragment
-
     def _get_placement_matrix_data(
             self, variable, placements, vertex, sampling_interval,
-            indexes, region, graph_mapper,
-            buffer_manager, expected_rows, missing_str, sampling_rate, label):
+            neurons, region, graph_mapper,
+            buffer_manager, expected_rows, missing, sampling_rate, label):
         """ processes a placement for matrix data
 
         :param variable: the variable to read
         :param placements: the placements object
         :param vertex: the vertex to read from
         :param sampling_interval: the interval of sampling
-        :param indexes: the indexes of neurons to be added to
+        :param neurons: the indexes of the neurons recorded by the vertex
         :param region: the recording region id
         :param graph_mapper: the graph mapper
         :param buffer_manager: the buffer manager
         :param expected_rows: how many rows the tools think should be recorded
-        :param missing_str: string for reporting missing stuff
+        :param missing: \
+            list to add the placement to if it is missing data, along with\
+            the number of duplicated and missing rows
         :param sampling_rate: the rate of sampling
         :param label: the vertex label.
-        :return: placement data and sampling interval.
+        :return: placement data, with expected_rows rows and a column for\
+            each neuron
         """
-
         placement = placements.get_placement_of_vertex(vertex)
-        vertex_slice = graph_mapper.get_slice(vertex)
-        neurons = self._neurons_recording(variable, vertex_slice)
         n_neurons = len(neurons)
-        if n_neurons == 0:
-            return None, sampling_interval
-        indexes.extend(neurons)
 
         # for buffering output info is taken form the buffer manager
         record_raw, missing_data = buffer_manager.get_data_by_placement(
@@ -222,12 +201,13 @@ class NeuronRecorder(object):
         time_bytes = (
             row_data[:, 0: self.N_BYTES_FOR_TIMESTAMP].reshape(
                 n_rows * self.N_BYTES_FOR_TIMESTAMP))
-        times = time_bytes.view("<i4").reshape(n_rows, 1)
+        times = time_bytes.view("<i4")
 
         # process data from core for missing data
-        placement_data = self._process_missing_data(
-            missing_str, placement, expected_rows, n_neurons, times,
-            sampling_rate, label, placement_data)
+        placement_data, n_duplicates, n_missing = \
+            recording_utils.fill_missing_rows(
+                times, placement_data, expected_rows, sampling_rate)
+        missing.append((placement, n_duplicates, n_missing))
         return placement_data
 
     @staticmethod
@@ -242,7 +222,7 @@ class NeuronRecorder(object):
 
     def get_matrix_data(
             self, label, buffer_manager, region, placements, graph_mapper,
-            application_vertex, variable, n_machine_time_steps):
+            application_vertex, variable, n_machine_time_steps, out=None):
         """ Read a uint32 mapped to time and neuron IDs from the SpiNNaker\
             machine and converts to required data types with scaling if needed.
 
@@ -256,7 +236,13 @@ class NeuronRecorder(object):
         :param variable: PyNN name for the variable (V, gsy_inh etc.)
         :type variable: str
         :param n_machine_time_steps:
-        :return:
+        :param out: \
+            An array to write the data into, which can be memory-mapped to\
+            a file; it must have a row for each expected recording time and\
+            a column for each neuron recording the variable
+        :type out: ~numpy.ndarray or None
+        :return: the data, the indexes of the neurons of the columns, and\
+            the sampling interval
         """
         if variable in self.__bitfield_variables:
             msg = "Variable {} is not supported, use get_spikes".format(
@@ -266,106 +252,225 @@ class NeuronRecorder(object):
         progress = ProgressBar(
             vertices, "Getting {} for {}".format(variable, label))
         sampling_rate = self.__sampling_rates[variable]
-        missing_str = ""
-        pop_level_data = None
+        missing = list()
         sampling_interval = self.get_neuron_sampling_interval(variable)
+        expected_rows = self.expected_rows_for_a_run_time(
+            n_machine_time_steps, sampling_rate)
+
+        # Work out which columns each vertex fills so the population data
+        # can be made once at its full size
+        vertex_neurons = [
+            self._neurons_recording(variable, graph_mapper.get_slice(vertex))
+            for vertex in vertices]
+        indexes = list(itertools.chain.from_iterable(vertex_neurons))
+        if out is not None:
+            if out.shape != (expected_rows, len(indexes)):
+                raise ConfigurationException(
+                    "The array for {} of {} must have shape {}".format(
+                        variable, label, (expected_rows, len(indexes))))
+            pop_level_data = out
+        elif indexes:
+            pop_level_data = numpy.empty(
+                (expected_rows, len(indexes)), dtype="float64")
+        else:
+            pop_level_data = None
 
-        indexes = []
-        for vertex in progress.over(vertices):
-            expected_rows = self.expected_rows_for_a_run_time(
-                n_machine_time_steps, sampling_rate)
-
-            placement_data = self._get_placement_matrix_data(
-                variable, placements, vertex, sampling_interval, indexes,
-                region, graph_mapper, buffer_manager, expected_rows,
-                missing_str, sampling_rate, label)
-
-            if placement_data is not None:
-                # append to the population data
-                if pop_level_data is None:
-                    pop_level_data = placement_data
-                else:
-                    # Add the slice fragment on axis 1
-                    # which is IDs/channel_index
-                    pop_level_data = numpy.append(
-                        pop_level_data, placement_data, axis=1)
+        first_column = 0
+        for vertex, neurons in progress.over(zip(vertices, vertex_neurons)):
+            if not neurons:
+                continue
+            end_column = first_column + len(neurons)
+            pop_level_data[:, first_column:end_column] = \
+                self._get_placement_matrix_data(
+                    variable, placements, vertex, sampling_interval, neurons,
+                    region, graph_mapper, buffer_manager, expected_rows,
+                    missing, sampling_rate, label)
+            first_column = end_column
 
         # warn user of missing data
-        if len(missing_str) > 0:
+        if missing:
+            placements_missing, n_duplicates, n_missing = zip(*missing)
             logger.warning(
-                "Population {} is missing recorded data in region {} from the"
-                " following cores: {}", label, region, missing_str)
+                "Population {} is missing {} rows of recorded data and has {}"
+                " duplicated rows in region {} from the following cores: {}",
+                label, sum(n_missing), sum(n_duplicates), region,
+                recording_utils.make_missing_string(placements_missing))
 
         return pop_level_data, indexes, sampling_interval
 
-    def get_spikes(
+    def export_matrix_data(
             self, label, buffer_manager, region, placements, graph_mapper,
-            application_vertex, variable, machine_time_step):
-        if variable not in self.__bitfield_variables:
-            msg = "Variable {} is not supported, use get_matrix_data".format(
+            application_vertex, variable, n_machine_time_steps, directory):
+        """ Write the recorded data of a variable to a memory-mapped file\
+            as it is read, so that it is never all in memory at once.
+
+        :param label: vertex label
+        :param buffer_manager: the manager for buffered data
+        :param region: the DSG region ID used for this data
+        :param placements: the placements object
+        :param graph_mapper: \
+            the mapping between application and machine vertices
+        :param application_vertex:
+        :param variable: PyNN name for the variable (V, gsy_inh etc.)
+        :param n_machine_time_steps:
+        :param directory: the directory to write the file in
+        :return: the description of the data for the export index
+        :rtype: dict
+        """
+        if variable in self.__bitfield_variables:
+            msg = "Variable {} is not supported, use iter_spikes".format(
                 variable)
             raise ConfigurationException(msg)
+        n_neurons = sum(
+            len(self._neurons_recording(
+                variable, graph_mapper.get_slice(vertex)))
+            for vertex in graph_mapper.get_machine_vertices(
+                application_vertex))
+        out = recording_export.open_matrix(
+            directory, variable, (self.expected_rows_for_a_run_time(
+                n_machine_time_steps, self.__sampling_rates[variable]),
+                n_neurons))
+        _, indexes, sampling_interval = self.get_matrix_data(
+            label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, variable, n_machine_time_steps, out=out)
+        out.flush()
+        del out
+        return recording_export.matrix_entry(
+            variable, indexes, sampling_interval)
 
+    def get_spikes(
+            self, label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, variable, machine_time_step):
         spike_times = list()
         spike_ids = list()
+        missing = list()
+        core_readers = self.__spike_core_readers(
+            buffer_manager, region, placements, graph_mapper,
+            application_vertex, variable, machine_time_step, missing)
+        progress = ProgressBar(
+            core_readers, "Getting spikes for {}".format(label))
+        for _, reader in progress.over(core_readers):
+            for ids, times in reader():
+                spike_ids.append(ids)
+                spike_times.append(times)
+        self.__warn_missing_spikes(label, region, missing)
 
-        vertices = graph_mapper.get_machine_vertices(application_vertex)
-        missing_str = ""
-        progress = ProgressBar(vertices, "Getting spikes for {}".format(label))
-        for vertex in progress.over(vertices):
-            placement = placements.get_placement_of_vertex(vertex)
-            vertex_slice = graph_mapper.get_slice(vertex)
+        if len(spike_ids) == 0:
+            return numpy.zeros((0, 2), dtype="float")
 
-            ms_per_tick = machine_time_step / MICRO_TO_MILLISECOND_CONVERSION
-            neurons = self._neurons_recording(variable, vertex_slice)
-            neurons_recording = len(neurons)
-            if neurons_recording == 0:
-                continue
+        spike_ids = numpy.hstack(spike_ids)
+        spike_times = numpy.hstack(spike_times)
+        result = numpy.column_stack((spike_ids, spike_times))
+        return result[numpy.lexsort((spike_times, spike_ids))]
 
-            # Read the spikes
-            n_words = int(math.ceil(neurons_recording / BITS_PER_WORD))
-            n_bytes = n_words * BYTES_PER_WORD
-            n_words_with_timestamp = n_words + 1
+    def iter_spikes(
+            self, label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, variable, machine_time_step, order=None):
+        """ Get the recorded spikes a chunk at a time, so that they don't\
+            all have to be held in memory at once.
 
-            # for buffering output info is taken form the buffer manager
-            record_raw, data_missing = buffer_manager.get_data_by_placement(
-                    placement, region)
-            if data_missing:
-                missing_str += "({}, {}, {}); ".format(
-                    placement.x, placement.y, placement.p)
-            if len(record_raw) > 0:
-                raw_data = (
-                    numpy.asarray(record_raw, dtype="uint8").view(
-                        dtype="<i4")).reshape([-1, n_words_with_timestamp])
-            else:
-                raw_data = record_raw
-            if len(raw_data) > 0:
-                record_time = raw_data[:, 0] * float(ms_per_tick)
-                spikes = raw_data[:, 1:].byteswap().view("uint8")
-                bits = numpy.fliplr(numpy.unpackbits(spikes).reshape(
-                    (-1, 32))).reshape((-1, n_bytes * 8))
-                time_indices, local_indices = numpy.where(bits == 1)
-                if self.__indexes[variable] is None:
-                    indices = local_indices + vertex_slice.lo_atom
-                    times = record_time[time_indices].reshape((-1))
-                    spike_ids.extend(indices)
-                    spike_times.extend(times)
-                else:
-                    for time_indice, local in zip(time_indices, local_indices):
-                        if local < neurons_recording:
-                            spike_ids.append(neurons[local])
-                            spike_times.append(record_time[time_indice])
+        :param label: vertex label
+        :param buffer_manager: the manager for buffered data
+        :param region: the DSG region ID used for this data
+        :param placements: the placements object
+        :param graph_mapper: \
+            the mapping between application and machine vertices
+        :param application_vertex:
+        :param variable: the name of the spike variable
+        :param machine_time_step: the time step of the simulation
+        :param order: \
+            None for the spikes of each core in turn, "id" for spikes\
+            ordered by id and then time, or "time" for spikes ordered by\
+            time and then id; with "time", the recorded data of every\
+            core is held until its spikes have all been returned
+        :type order: str or None
+        :return: chunks of the ids and times of the spikes
+        :rtype: iterable(tuple(~numpy.ndarray, ~numpy.ndarray))
+        """
+        missing = list()
+        chunks = recording_utils.iter_spike_chunks(
+            self.__spike_core_readers(
+                buffer_manager, region, placements, graph_mapper,
+                application_vertex, variable, machine_time_step, missing),
+            order)
+        return self.__iter_and_warn(chunks, label, region, missing)
+
+    def __iter_and_warn(self, chunks, label, region, missing):
+        for chunk in chunks:
+            yield chunk
+        self.__warn_missing_spikes(label, region, missing)
 
-        if len(missing_str) > 0:
+    @staticmethod
+    def __warn_missing_spikes(label, region, missing):
+        if not missing:
+            return
+        placements_missing, n_duplicates = zip(*missing)
+        logger.warning(
+            "Population {} is missing spike data in region {} from the"
+            " following cores: {}", label, region,
+            recording_utils.make_missing_string(placements_missing))
+        if sum(n_duplicates):
             logger.warning(
-                "Population {} is missing spike data in region {} from the"
-                " following cores: {}", label, region, missing_str)
+                "Population {} has {} duplicated rows of spike data in region"
+                " {}", label, sum(n_duplicates), region)
 
-        if len(spike_ids) == 0:
-            return numpy.zeros((0, 2), dtype="float")
+    def __spike_core_readers(
+            self, buffer_manager, region, placements, graph_mapper,
+            application_vertex, variable, machine_time_step, missing):
+        if variable not in self.__bitfield_variables:
+            msg = "Variable {} is not supported, use get_matrix_data".format(
+                variable)
+            raise ConfigurationException(msg)
+        ms_per_tick = machine_time_step / MICRO_TO_MILLISECOND_CONVERSION
+        core_readers = list()
+        for vertex in graph_mapper.get_machine_vertices(application_vertex):
+            vertex_slice = graph_mapper.get_slice(vertex)
+            neurons = self._neurons_recording(variable, vertex_slice)
+            if len(neurons) == 0:
+                continue
+            core_readers.append((vertex_slice, functools.partial(
+                self.__read_core_spikes, buffer_manager, region,
+                placements.get_placement_of_vertex(vertex),
+                numpy.asarray(neurons, dtype="int64"), ms_per_tick,
+                missing)))
+        return core_readers
 
-        result = numpy.column_stack((spike_ids, spike_times))
-        return result[numpy.lexsort((spike_times, spike_ids))]
+    @staticmethod
+    def __read_core_spikes(
+            buffer_manager, region, placement, neurons, ms_per_tick,
+            missing):
+        """ Read the spikes of a core, a chunk of recorded times at a time
+        """
+        neurons_recording = len(neurons)
+        n_words = int(math.ceil(neurons_recording / BITS_PER_WORD))
+        n_words_with_timestamp = n_words + 1
+
+        # for buffering output info is taken form the buffer manager
+        record_raw, data_missing = buffer_manager.get_data_by_placement(
+                placement, region)
+        if len(record_raw) == 0:
+            if data_missing:
+                missing.append((placement, 0))
+            return
+        raw_data = (
+            numpy.asarray(record_raw, dtype="uint8").view(
+                dtype="<i4")).reshape([-1, n_words_with_timestamp])
+        if data_missing:
+            # Drop any time recorded more than once; times with no
+            # record have no spikes so are not filled in
+            filled, n_duplicates, _ = recording_utils.fill_missing_rows(
+                raw_data[:, 0], raw_data, int(raw_data[:, 0].max()) + 1, 1,
+                fill_value=-1)
+            raw_data = filled[filled[:, 0] >= 0]
+            missing.append((placement, n_duplicates))
+
+        for start in xrange(0, len(raw_data), _SPIKE_ROWS_PER_CHUNK):
+            rows = raw_data[start:start + _SPIKE_ROWS_PER_CHUNK]
+            time_indices, local_indices = recording_utils.decode_spike_bits(
+                numpy.ascontiguousarray(rows[:, 1:]).view("uint8"),
+                neurons_recording)
+            yield (neurons[local_indices],
+                   rows[time_indices, 0] * float(ms_per_tick))
 
     def get_recordable_variables(self):
         return self.__sampling_rates.keys()
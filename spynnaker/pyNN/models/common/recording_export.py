@@ -0,0 +1,136 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Export of recorded data to a directory of ``.npy`` files, described by\
+    a JSON index, which can be read back lazily by memory mapping.
+
+A recorded variable such as ``v`` is stored as a single matrix file, with a\
+row per recorded time and a column per neuron.  Spikes are stored as pairs\
+of ids and times files, one pair per chunk of the spikes of a core.
+"""
+
+import json
+import os
+import numpy
+from numpy.lib.format import open_memmap
+
+#: The name of the file describing the exported data
+INDEX_FILE = "index.json"
+
+
+def matrix_filename(variable):
+    """ Get the name of the file holding a recorded variable
+
+    :param str variable: The name of the variable
+    :rtype: str
+    """
+    return "{}.npy".format(variable)
+
+
+def open_matrix(directory, variable, shape):
+    """ Create a memory-mapped file to write a recorded variable into
+
+    :param str directory: The directory to write to
+    :param str variable: The name of the variable
+    :param tuple(int,int) shape: The number of rows and columns
+    :rtype: ~numpy.memmap
+    """
+    return open_memmap(
+        os.path.join(directory, matrix_filename(variable)), mode="w+",
+        dtype="float64", shape=shape)
+
+
+def matrix_entry(variable, indexes, sampling_interval):
+    """ Describe an exported recorded variable in the index
+
+    :param str variable: The name of the variable
+    :param list(int) indexes: The id of the neuron of each column
+    :param float sampling_interval: The time between rows
+    :rtype: dict
+    """
+    return {
+        "type": "matrix",
+        "file": matrix_filename(variable),
+        "indexes": [int(index) for index in indexes],
+        "sampling_interval": sampling_interval}
+
+
+def export_spikes(chunks, directory, variable, sampling_interval):
+    """ Write chunks of spikes to files as they are received
+
+    :param iterable(tuple(~numpy.ndarray,~numpy.ndarray)) chunks:
+        The ids and times of the spikes, a chunk at a time
+    :param str directory: The directory to write to
+    :param str variable: The name of the spike variable
+    :param float sampling_interval: The time between recordings
+    :return: The description of the spikes for the index
+    :rtype: dict
+    """
+    shards = list()
+    for ids, times in chunks:
+        if not len(ids):
+            continue
+        names = ["{}_{}_{}.npy".format(variable, len(shards), kind)
+                 for kind in ("ids", "times")]
+        numpy.save(os.path.join(directory, names[0]), ids)
+        numpy.save(os.path.join(directory, names[1]), times)
+        shards.append({
+            "ids": names[0], "times": names[1], "n_spikes": len(ids)})
+    return {
+        "type": "spikes",
+        "shards": shards,
+        "sampling_interval": sampling_interval}
+
+
+def write_index(directory, label, entries):
+    """ Write the index of the exported data
+
+    :param str directory: The directory holding the data
+    :param str label: The label of the population
+    :param dict(str,dict) entries: The description of each variable
+    """
+    with open(os.path.join(directory, INDEX_FILE), "w") as f:
+        json.dump({"label": label, "variables": entries}, f, indent=2,
+                  sort_keys=True)
+
+
+def load_recording(directory):
+    """ Read exported data, memory mapping the arrays so that nothing is\
+        read until it is used
+
+    :param str directory: The directory holding the data
+    :return: The label of the population, and for each variable, a\
+        dictionary holding its description from the index plus either\
+        ``data`` (the matrix of a variable) or ``shards`` (a list of\
+        (ids, times) of spikes)
+    :rtype: tuple(str, dict(str, dict))
+    """
+    with open(os.path.join(directory, INDEX_FILE)) as f:
+        index = json.load(f)
+
+    def load(filename):
+        return numpy.load(os.path.join(directory, filename), mmap_mode="r")
+
+    variables = dict()
+    for variable, entry in index["variables"].items():
+        loaded = dict(entry)
+        if entry["type"] == "matrix":
+            loaded["data"] = load(entry["file"])
+        else:
+            loaded["shards"] = [
+                (load(shard["ids"]), load(shard["times"]))
+                for shard in entry["shards"]]
+        variables[variable] = loaded
+    return index["label"], variables
@@ -17,6 +17,7 @@ from __future__ import division
 import logging
 import struct
 import numpy
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.helpful_functions import (
     locate_memory_region_for_placement)
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
@@ -26,6 +27,14 @@ logger = logging.getLogger(__name__)
 _RECORDING_COUNT = struct.Struct("<I")
 _SEEK_END = 2  # Define here for Py2.7 compatibility
 
+#: The orders in which spikes can be iterated
+SPIKE_ORDERS = (None, "id", "time")
+
+# The bits of each byte value, least significant first, for versions of
+# numpy whose unpackbits has no bitorder
+_LITTLE_BITS = numpy.unpackbits(
+    numpy.arange(256, dtype="uint8").reshape(-1, 1), axis=1)[:, ::-1].copy()
+
 
 def get_recording_region_size_in_bytes(
         n_machine_time_steps, bytes_per_timestep):
@@ -142,3 +151,193 @@ def make_missing_string(missing):
             separator, placement.x, placement.y, placement.p)
         separator = "; "
     return missing_str
+
+
+def fill_missing_rows(
+        times, data, n_rows, sampling_rate, fill_value=numpy.nan):
+    """ Put recorded rows into the row of their recording time, filling\
+        any rows that were not recorded.
+
+    Each timestamp maps directly to a row (``times // sampling_rate``), so\
+    this is linear in the number of rows.  Where a time was recorded more\
+    than once, the first recording is used.
+
+    :param ~numpy.ndarray times: The timestamp of each recorded row
+    :param ~numpy.ndarray data:
+        The recorded rows, one per timestamp in the first dimension
+    :param int n_rows: The number of rows that should have been recorded
+    :param int sampling_rate: The number of timesteps between recordings
+    :param fill_value: The value to put in the rows that are missing
+    :return: The rows, the number of duplicated recordings discarded, and\
+        the number of rows filled in
+    :rtype: tuple(~numpy.ndarray, int, int)
+    """
+    times = numpy.asarray(times).reshape(-1)
+    rows = times // sampling_rate
+    in_range = (rows >= 0) & (rows < n_rows) & (times % sampling_rate == 0)
+    valid_rows = rows[in_range]
+
+    # numpy.unique gives the first index of each value
+    unique_rows, first = numpy.unique(valid_rows, return_index=True)
+    filled = numpy.full(
+        (n_rows, ) + data.shape[1:], fill_value,
+        dtype=numpy.result_type(data.dtype, numpy.min_scalar_type(
+            fill_value)))
+    filled[unique_rows] = data[in_range][first]
+    return (filled, len(valid_rows) - len(unique_rows),
+            n_rows - len(unique_rows))
+
+
+def _unpack_bits_little(spike_bytes):
+    try:
+        return numpy.unpackbits(spike_bytes, axis=1, bitorder="little")
+    except TypeError:
+        return _LITTLE_BITS[spike_bytes].reshape(len(spike_bytes), -1)
+
+
+def decode_spike_bits(spike_bytes, n_neurons):
+    """ Find the spikes in rows of spike bitfields, where each bitfield is\
+        a sequence of little-endian words with bit ``n % 32`` of word\
+        ``n // 32`` set if neuron ``n`` spiked.
+
+    :param ~numpy.ndarray spike_bytes:
+        The bytes of the bitfields, one bitfield per row
+    :param int n_neurons:
+        The number of neurons in the bitfields; any bits beyond these are
+        ignored
+    :return: The row and the neuron index of each spike, ordered by row
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+    """
+    # In little-endian words, neuron n is bit n % 8 of byte n // 8, so the
+    # bytes can be unpacked directly with no reordering
+    bits = _unpack_bits_little(
+        numpy.ascontiguousarray(spike_bytes, dtype="uint8"))
+    return numpy.nonzero(bits[:, :n_neurons])
+
+
+def _sorted_spikes(ids, times, order):
+    if order == "time":
+        keys = (ids, times)
+    else:
+        keys = (times, ids)
+    sort_order = numpy.lexsort(keys)
+    return ids[sort_order], times[sort_order]
+
+
+def merge_spike_chunks(core_chunks):
+    """ Merge the spikes of several cores into chunks ordered by time and\
+        then by id, holding no more than a chunk of each core at a time\
+        (plus any more of its spikes at the same time as the end of the\
+        chunk).
+
+    :param list(iterable(tuple(~numpy.ndarray, ~numpy.ndarray))) core_chunks:
+        For each core, chunks of (ids, times) of its spikes; each chunk must
+        start no earlier than the end of the previous chunk of the core
+    :return: The merged (ids, times) chunks
+    :rtype: iterable(tuple(~numpy.ndarray, ~numpy.ndarray))
+    """
+    iterators = [iter(chunks) for chunks in core_chunks]
+    pending = [None] * len(iterators)
+    while True:
+        # Make sure every core that has spikes left has some pending
+        for i, iterator in enumerate(iterators):
+            while iterator is not None and (
+                    pending[i] is None or len(pending[i][1]) == 0):
+                chunk = next(iterator, None)
+                if chunk is None:
+                    iterators[i] = iterator = None
+                elif pending[i] is None:
+                    pending[i] = chunk
+                else:
+                    pending[i] = (
+                        numpy.concatenate((pending[i][0], chunk[0])),
+                        numpy.concatenate((pending[i][1], chunk[1])))
+        active = [i for i, iterator in enumerate(iterators)
+                  if iterator is not None]
+        if not active:
+            break
+
+        # Anything before the end of the first core to run out of pending
+        # spikes can't be followed by anything earlier
+        last = min(pending[i][1][-1] for i in active)
+        ids = list()
+        times = list()
+        for i, spikes in enumerate(pending):
+            if spikes is None:
+                continue
+            n_before = numpy.searchsorted(spikes[1], last, side="left")
+            ids.append(spikes[0][:n_before])
+            times.append(spikes[1][:n_before])
+            pending[i] = (spikes[0][n_before:], spikes[1][n_before:])
+        ids = numpy.concatenate(ids)
+        if len(ids):
+            yield _sorted_spikes(ids, numpy.concatenate(times), "time")
+        else:
+            # Everything pending at the earliest end is at that time, so get
+            # more of the spikes at that time to make progress
+            first = min(active, key=lambda i: pending[i][1][-1])
+            chunk = next(iterators[first], None)
+            if chunk is None:
+                iterators[first] = None
+            else:
+                pending[first] = (
+                    numpy.concatenate((pending[first][0], chunk[0])),
+                    numpy.concatenate((pending[first][1], chunk[1])))
+
+    # Only spikes from cores that have finished are left
+    remaining = [spikes for spikes in pending
+                 if spikes is not None and len(spikes[1])]
+    if remaining:
+        ids, times = zip(*remaining)
+        yield _sorted_spikes(
+            numpy.concatenate(ids), numpy.concatenate(times), "time")
+
+
+def iter_spike_chunks(core_readers, order=None):
+    """ Get the spikes of cores a chunk at a time.
+
+    :param list(tuple(~pacman.model.graphs.common.Slice,callable)) \
+            core_readers:
+        For each core, its slice and a function that returns chunks of
+        (ids, times) of its spikes in time order
+    :param order:
+        None for the chunks of each core in turn, "id" for the spikes of one
+        core at a time ordered by id and then time, or "time" for spikes
+        ordered by time and then id over all the cores
+    :type order: str or None
+    :rtype: iterable(tuple(~numpy.ndarray, ~numpy.ndarray))
+
+    .. note::
+        With order "time", the readers of all the cores are started at\
+        once, and each keeps the recorded data of its core until all its\
+        spikes have been merged, as the buffer manager only gives the whole\
+        of the data of a core.  Only about a chunk of the decoded spikes of\
+        each core is held at a time.
+    """
+    if order not in SPIKE_ORDERS:
+        raise ConfigurationException(
+            "Spikes cannot be ordered by {}; use one of {}".format(
+                order, SPIKE_ORDERS))
+    if order == "time":
+        return merge_spike_chunks(
+            [reader() for _, reader in core_readers])
+    if order == "id":
+        return _iter_cores_by_id(core_readers)
+    return _iter_cores(core_readers)
+
+
+def _iter_cores(core_readers):
+    for _, reader in core_readers:
+        for chunk in reader():
+            yield chunk
+
+
+def _iter_cores_by_id(core_readers):
+    # Cores have separate ranges of ids, so only one needs to be sorted at
+    # a time
+    for _, reader in sorted(core_readers, key=lambda core: core[0].lo_atom):
+        chunks = list(reader())
+        if chunks:
+            ids, times = zip(*chunks)
+            yield _sorted_spikes(
+                numpy.concatenate(ids), numpy.concatenate(times), "id")
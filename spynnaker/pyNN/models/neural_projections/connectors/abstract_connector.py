@@ -60,6 +60,14 @@ class AbstractConnector(with_metaclass(AbstractBase, object)):
         "_weights",
         "__param_seeds"]
 
+    # The slots of this class that are worked out from the others while making
+    # connections, so do not change the connections made; each subclass lists
+    # its own in the same way, and the rest identify the connections
+    # (see get_identifying_parameters)
+    _DERIVED_SLOTS = (
+        "__n_clipped_delays",
+        "__param_seeds")
+
     def __init__(self, safe=True, callback=None, verbose=False, rng=None):
         """
         :param bool safe: if True, check that weights and delays have valid
@@ -99,6 +107,26 @@ class AbstractConnector(with_metaclass(AbstractBase, object)):
         self._rng = (self._rng or NumpyRNG())
         self.__min_delay = machine_time_step / MICRO_TO_MILLISECOND_CONVERSION
 
+    def get_identifying_parameters(self):
+        """ Get the values that determine the connections made by this\
+            connector, as (name, value) pairs in a fixed order.  These are\
+            the slots of each class of the connector other than those in\
+            its _DERIVED_SLOTS, followed by any other attributes.
+
+        :rtype: iterable(tuple(str, object))
+        """
+        for cls in reversed(type(self).__mro__):
+            derived = cls.__dict__.get("_DERIVED_SLOTS", ())
+            for name in cls.__dict__.get("__slots__", ()):
+                if name in derived:
+                    continue
+                attribute = name
+                if name.startswith("__") and not name.endswith("__"):
+                    attribute = "_" + cls.__name__.lstrip("_") + name
+                yield cls.__name__ + name, getattr(self, attribute, None)
+        for name in sorted(getattr(self, "__dict__", ())):
+            yield name, self.__dict__[name]
+
     def _check_parameter(self, values, name, allow_lists):
         """ Check that the types of the values is supported.
 
@@ -359,8 +387,58 @@ class AbstractConnector(with_metaclass(AbstractBase, object)):
             return numpy.array([copy_rd.next(1)], dtype="float64")
         return copy_rd.next(n_connections)
 
+    def _get_slice_distances(
+            self, pre_slice, post_slice, expand_distances, synapse_info):
+        """ Get the distances between each pair of neurons of the slices.
+
+        :param ~pacman.model.graphs.common.Slice pre_slice:
+        :param ~pacman.model.graphs.common.Slice post_slice:
+        :param bool expand_distances:
+            Whether to get the distance along each axis separately
+        :param SynapseInformation synapse_info:
+        :return: The distances, indexed by axis (a single axis unless\
+            expanded), pre-neuron and then post-neuron within the slices
+        :rtype: ~numpy.ndarray
+        """
+        # Positions are (3, n_neurons), whereas distances wants (n, 3)
+        pre_positions = synapse_info.pre_population.positions.T[
+            pre_slice.lo_atom:pre_slice.hi_atom + 1]
+        post_positions = synapse_info.post_population.positions.T[
+            post_slice.lo_atom:post_slice.hi_atom + 1]
+        return self.__space.distances(
+            pre_positions, post_positions, expand_distances).reshape(
+                (-1, len(pre_positions), len(post_positions)))
+
+    def _get_distances(
+            self, pre_slice, post_slice, sources, targets, expand_distances,
+            synapse_info):
+        """ Get the distances between the neurons of each connection,\
+            working out only those between the neurons of the slices.
+
+        :param ~pacman.model.graphs.common.Slice pre_slice:
+        :param ~pacman.model.graphs.common.Slice post_slice:
+        :param ~numpy.ndarray sources: The pre-neuron of each connection
+        :param ~numpy.ndarray targets: The post-neuron of each connection
+        :param bool expand_distances:
+            Whether to get the distance along each axis separately
+        :param SynapseInformation synapse_info:
+        :return: The distance of each connection, or the distance along each\
+            axis of each connection if expanded
+        :rtype: ~numpy.ndarray
+        """
+        d = self._get_slice_distances(
+            pre_slice, post_slice, expand_distances, synapse_info)
+
+        # Pick out the distances of the connections
+        d = d[:, numpy.asarray(sources, dtype="int64") - pre_slice.lo_atom,
+              numpy.asarray(targets, dtype="int64") - post_slice.lo_atom]
+        if expand_distances:
+            return d
+        return d[0]
+
     def _generate_values(self, values, n_connections, connection_slices,
-                         pre_slice, post_slice, synapse_info):
+                         pre_slice, post_slice, synapse_info, sources=None,
+                         targets=None):
         """
         :param values:
         :type values: ~pyNN.random.NumpyRNG or int or float or list(int) or
@@ -370,17 +448,17 @@ class AbstractConnector(with_metaclass(AbstractBase, object)):
         :param ~pacman.model.graphs.common.Slice pre_slice:
         :param ~pacman.model.graphs.common.Slice post_slice:
         :param SynapseInformation synapse_info:
+        :param sources: The pre-neuron of each connection, or None if the\
+            connections are all those between the slices in pre-neuron order
+        :type sources: ~numpy.ndarray or None
+        :param targets: The post-neuron of each connection, or None if the\
+            connections are all those between the slices in pre-neuron order
+        :type targets: ~numpy.ndarray or None
         :rtype: ~numpy.ndarray
         """
         if isinstance(values, RandomDistribution):
             return self._generate_random_values(
                 values, n_connections, pre_slice, post_slice)
-        elif numpy.isscalar(values):
-            return numpy.repeat([values], n_connections).astype("float64")
-        elif hasattr(values, "__getitem__"):
-            return numpy.concatenate([
-                values[connection_slice]
-                for connection_slice in connection_slices]).astype("float64")
         elif isinstance(values, string_types) or callable(values):
             if self.__space is None:
                 raise Exception(
@@ -392,18 +470,32 @@ class AbstractConnector(with_metaclass(AbstractBase, object)):
             if isinstance(values, string_types):
                 expand_distances = self._expand_distances(values)
 
-            d = self.__space.distances(
-                synapse_info.pre_population.positions,
-                synapse_info.post_population.positions,
-                expand_distances)
+            if sources is None:
+                sources = numpy.repeat(
+                    numpy.arange(pre_slice.lo_atom, pre_slice.hi_atom + 1),
+                    post_slice.n_atoms)
+                targets = numpy.tile(
+                    numpy.arange(post_slice.lo_atom, post_slice.hi_atom + 1),
+                    pre_slice.n_atoms)
+            d = self._get_distances(
+                pre_slice, post_slice, sources, targets, expand_distances,
+                synapse_info)
 
             if isinstance(values, string_types):
-                return _expr_context.eval(values)
-            return values(d)
+                return numpy.asarray(
+                    _expr_context.eval(values, d=d), dtype="float64")
+            return numpy.asarray(values(d), dtype="float64")
+        elif numpy.isscalar(values):
+            return numpy.repeat([values], n_connections).astype("float64")
+        elif hasattr(values, "__getitem__"):
+            return numpy.concatenate([
+                values[connection_slice]
+                for connection_slice in connection_slices]).astype("float64")
         raise Exception("what on earth are you giving me?")
 
     def _generate_weights(self, n_connections, connection_slices,
-                          pre_slice, post_slice, synapse_info):
+                          pre_slice, post_slice, synapse_info,
+                          sources=None, targets=None):
         """ Generate weight values.
 
         :param int n_connections:
@@ -411,11 +503,15 @@ class AbstractConnector(with_metaclass(AbstractBase, object)):
         :param ~pacman.model.graphs.common.Slice pre_slice:
         :param ~pacman.model.graphs.common.Slice post_slice:
         :param SynapseInformation synapse_info:
+        :param sources: The pre-neuron of each connection, if known
+        :type sources: ~numpy.ndarray or None
+        :param targets: The post-neuron of each connection, if known
+        :type targets: ~numpy.ndarray or None
         :rtype: ~numpy.ndarray
         """
         weights = self._generate_values(
             synapse_info.weights, n_connections, connection_slices, pre_slice,
-            post_slice, synapse_info)
+            post_slice, synapse_info, sources, targets)
         if self.__safe:
             if not weights.size:
                 warn_once(logger, "No connection in " + str(self))
@@ -446,7 +542,8 @@ class AbstractConnector(with_metaclass(AbstractBase, object)):
         return delays
 
     def _generate_delays(self, n_connections, connection_slices,
-                         pre_slice, post_slice, synapse_info):
+                         pre_slice, post_slice, synapse_info,
+                         sources=None, targets=None):
         """ Generate valid delay values.
 
         :param int n_connections:
@@ -454,11 +551,15 @@ class AbstractConnector(with_metaclass(AbstractBase, object)):
         :param ~pacman.model.graphs.common.Slice pre_slice:
         :param ~pacman.model.graphs.common.Slice post_slice:
         :param SynapseInformation synapse_info:
+        :param sources: The pre-neuron of each connection, if known
+        :type sources: ~numpy.ndarray or None
+        :param targets: The post-neuron of each connection, if known
+        :type targets: ~numpy.ndarray or None
         :rtype: ~numpy.ndarray
         """
         delays = self._generate_values(
             synapse_info.delays, n_connections, connection_slices, pre_slice,
-            post_slice, synapse_info)
+            post_slice, synapse_info, sources, targets)
 
         return self._clip_delays(delays)
 
@@ -61,6 +61,12 @@ class AbstractGenerateConnectorOnMachine(with_metaclass(
         "__connector_seed"
     ]
 
+    # The seeds are drawn from the rng when generating on the machine
+    _DERIVED_SLOTS = (
+        "__connector_seed",
+        "__delay_seed",
+        "__weight_seed")
+
     def __init__(self, safe=True, callback=None, verbose=False):
         AbstractConnector.__init__(
             self, safe=safe, callback=callback, verbose=verbose)
@@ -126,10 +126,10 @@ class AllToAllConnector(AbstractGenerateConnectorOnMachine):
                 pre_vertex_slice.n_atoms)
         block["weight"] = self._generate_weights(
             n_connections, connection_slices, pre_vertex_slice,
-            post_vertex_slice, synapse_info)
+            post_vertex_slice, synapse_info, block["source"], block["target"])
         block["delay"] = self._generate_delays(
             n_connections, connection_slices, pre_vertex_slice,
-            post_vertex_slice, synapse_info)
+            post_vertex_slice, synapse_info, block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
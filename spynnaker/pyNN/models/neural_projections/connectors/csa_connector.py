@@ -134,10 +134,10 @@ class CSAConnector(AbstractConnector):
         block["target"] = [x[1] for x in pair_list]
         block["weight"] = self._generate_weights(
             n_connections, None, pre_vertex_slice, post_vertex_slice,
-            synapse_info)
+            synapse_info, block["source"], block["target"])
         block["delay"] = self._generate_delays(
             n_connections, None, pre_vertex_slice, post_vertex_slice,
-            synapse_info)
+            synapse_info, block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import OrderedDict
 import logging
 import math
 import numpy
@@ -22,6 +23,7 @@ from numpy import (
     minimum, e, pi)
 from spinn_utilities.overrides import overrides
 from spinn_utilities.safe_eval import SafeEval
+from pacman.model.graphs.common import Slice
 from spynnaker.pyNN.utilities import utility_calls
 from .abstract_connector import AbstractConnector
 
@@ -32,6 +34,13 @@ _d_expr_context = SafeEval(math, numpy, arccos, arcsin, arctan, arctan2, ceil,
                            log, log10, modf, power, sin, sinh, sqrt, tan, tanh,
                            maximum, minimum, e=e, pi=pi)
 
+# The maximum number of probabilities to work out at once when finding the
+# maximum probability over many neurons
+_MAX_PROBABILITIES_PER_BLOCK = 2 ** 20
+
+# The number of blocks of probabilities to keep, most recently used first
+_N_CACHED_BLOCKS = 16
+
 
 class DistanceDependentProbabilityConnector(AbstractConnector):
     """ Make connections using a distribution which varies with distance.
@@ -39,8 +48,14 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
 
     __slots__ = [
         "__allow_self_connections",
+        "__block_probs",
         "__d_expression",
-        "__probs"]
+        "__max_probs"]
+
+    # The probabilities are computed from the expression
+    _DERIVED_SLOTS = (
+        "__block_probs",
+        "__max_probs")
 
     def __init__(
             self, d_expression, allow_self_connections=True, safe=True,
@@ -74,6 +89,11 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         self.__d_expression = d_expression
         self.__allow_self_connections = allow_self_connections
         self._rng = rng
+
+        # Probabilities of recently used (pre-slice, post-slice) blocks, and
+        # the maximum probability of connecting to each post-slice
+        self.__block_probs = OrderedDict()
+        self.__max_probs = dict()
         if n_connections is not None:
             raise NotImplementedError(
                 "n_connections is not implemented for"
@@ -83,31 +103,83 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
     def set_projection_information(self, machine_time_step, synapse_info):
         AbstractConnector.set_projection_information(
             self, machine_time_step, synapse_info)
-        self._set_probabilities(synapse_info)
 
-    def _set_probabilities(self, synapse_info):
-        """
+        # Probabilities are worked out a block at a time when needed
+        self.__block_probs.clear()
+        self.__max_probs.clear()
+
+    def __compute_probabilities(
+            self, pre_vertex_slice, post_vertex_slice, synapse_info):
+        """ Work out the probability of connection between each pair of\
+            neurons of the slices.
+
+        :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
         :param SynapseInformation synapse_info:
+        :return: The probabilities, indexed by pre- and then post-neuron
+        :rtype: ~numpy.ndarray
         """
-        # Set the probabilities up-front for now
-        # TODO: Work out how this can be done statistically
         expand_distances = self._expand_distances(self.__d_expression)
-        pre_positions = synapse_info.pre_population.positions
-        post_positions = synapse_info.post_population.positions
+        d = self._get_slice_distances(
+            pre_vertex_slice, post_vertex_slice, expand_distances,
+            synapse_info)
+        if not expand_distances:
+            d = d[0]
+        probs = _d_expr_context.eval(self.__d_expression, d=d)
+        return numpy.broadcast_to(
+            numpy.asarray(probs, dtype="float64"),
+            (pre_vertex_slice.n_atoms, post_vertex_slice.n_atoms))
 
-        d1 = self.space.distances(
-            pre_positions, post_positions, expand_distances)
+    def _get_probabilities(
+            self, pre_vertex_slice, post_vertex_slice, synapse_info):
+        """ Get the probability of connection between each pair of neurons\
+            of the slices, keeping those of the most recently used blocks.
 
-        # PyNN 0.8 returns a flattened (C-style) array from space.distances,
-        # so the easiest thing to do here is to reshape back to the "expected"
-        # PyNN 0.7 shape; otherwise later code gets confusing and difficult
-        if (len(d1.shape) == 1):
-            d = numpy.reshape(d1, (pre_positions.shape[0],
-                                   post_positions.shape[0]))
-        else:
-            d = d1
+        :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        :param SynapseInformation synapse_info:
+        :return: The probabilities, indexed by pre- and then post-neuron
+        :rtype: ~numpy.ndarray
+        """
+        key = (pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom,
+               post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        probs = self.__block_probs.pop(key, None)
+        if probs is None:
+            probs = self.__compute_probabilities(
+                pre_vertex_slice, post_vertex_slice, synapse_info)
+            if len(self.__block_probs) >= _N_CACHED_BLOCKS:
+                self.__block_probs.popitem(last=False)
+        self.__block_probs[key] = probs
+        return probs
 
-        self.__probs = _d_expr_context.eval(self.__d_expression, d=d)
+    def _get_max_probability(self, post_vertex_slice, synapse_info):
+        """ Get the maximum probability of connection from any pre-neuron to\
+            a neuron of the post-slice, working through the pre-neurons a\
+            block at a time.
+
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        :param SynapseInformation synapse_info:
+        :rtype: float
+        """
+        key = (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        if key not in self.__max_probs:
+            n_pre = synapse_info.n_pre_neurons
+            n_rows = max(
+                1, _MAX_PROBABILITIES_PER_BLOCK // post_vertex_slice.n_atoms)
+            self.__max_probs[key] = max(
+                float(numpy.amax(self.__compute_probabilities(
+                    Slice(lo_atom, min(lo_atom + n_rows, n_pre) - 1),
+                    post_vertex_slice, synapse_info)))
+                for lo_atom in range(0, n_pre, n_rows))
+        return self.__max_probs[key]
+
+    def __get_overall_max_probability(self, synapse_info):
+        """
+        :param SynapseInformation synapse_info:
+        :rtype: float
+        """
+        return self._get_max_probability(
+            Slice(0, synapse_info.n_post_neurons - 1), synapse_info)
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self, synapse_info):
@@ -116,16 +188,14 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             utility_calls.get_probable_maximum_selected(
                 synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
                 synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-                numpy.amax(self.__probs)))
+                self.__get_overall_max_probability(synapse_info)))
 
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
             self, post_vertex_slice, synapse_info, min_delay=None,
             max_delay=None):
         # pylint: disable=too-many-arguments
-        max_prob = numpy.amax(
-            self.__probs[0:synapse_info.n_pre_neurons,
-                         post_vertex_slice.as_slice])
+        max_prob = self._get_max_probability(post_vertex_slice, synapse_info)
         n_connections = utility_calls.get_probable_maximum_selected(
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
             post_vertex_slice.n_atoms, max_prob)
@@ -144,7 +214,7 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         return utility_calls.get_probable_maximum_selected(
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
             synapse_info.n_post_neurons,
-            numpy.amax(self.__probs))
+            self.__get_overall_max_probability(synapse_info))
 
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self, synapse_info):
@@ -154,14 +224,14 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             utility_calls.get_probable_maximum_selected(
                 synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
                 synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-                numpy.amax(self.__probs)))
+                self.__get_overall_max_probability(synapse_info)))
 
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, pre_slice_index, post_slices, post_slice_index,
             pre_vertex_slice, post_vertex_slice, synapse_type, synapse_info):
-        probs = self.__probs[
-            pre_vertex_slice.as_slice, post_vertex_slice.as_slice].reshape(-1)
+        probs = self._get_probabilities(
+            pre_vertex_slice, post_vertex_slice, synapse_info).reshape(-1)
         n_items = pre_vertex_slice.n_atoms * post_vertex_slice.n_atoms
         items = self._rng.next(n_items)
 
@@ -182,10 +252,10 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             (ids % post_vertex_slice.n_atoms) + post_vertex_slice.lo_atom)
         block["weight"] = self._generate_weights(
             n_connections, None, pre_vertex_slice, post_vertex_slice,
-            synapse_info)
+            synapse_info, block["source"], block["target"])
         block["delay"] = self._generate_delays(
             n_connections, None, pre_vertex_slice, post_vertex_slice,
-            synapse_info)
+            synapse_info, block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
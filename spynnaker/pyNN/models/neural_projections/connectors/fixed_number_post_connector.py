@@ -41,6 +41,12 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine):
         "__with_replacement",
         "__post_connector_seed"]
 
+    # The post-neurons are chosen once, with their seed, from the rng
+    _DERIVED_SLOTS = (
+        "__post_connector_seed",
+        "__post_neurons",
+        "__post_neurons_set")
+
     def __init__(
             self, n, allow_self_connections=True, with_replacement=False,
             safe=True, callback=None, verbose=False, rng=None):
@@ -95,10 +101,21 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine):
     def _get_post_neurons(self, synapse_info):
         # If we haven't set the array up yet, do it now
         if not self.__post_neurons_set:
-            self.__post_neurons = [None] * synapse_info.n_pre_neurons
+
+            # Choose the post-neurons of all the pre-neurons at once; if the
+            # pre and post populations are the same then deal with
+            # allow_self_connections=False
+            self.__post_neurons = utility_calls.random_selections(
+                self._rng, synapse_info.n_pre_neurons,
+                synapse_info.n_post_neurons, self.__n_post,
+                self.__with_replacement, exclude_row_index=(
+                    synapse_info.pre_population is
+                    synapse_info.post_population and
+                    not self.__allow_self_connections))
             self.__post_neurons_set = True
 
-            # if verbose open a file to output the connectivity
+            # if verbose output the connectivity to a file, with the list
+            # connected to each pre-neuron on a line
             if self.verbose:
                 filename = synapse_info.pre_population.label + \
                     '_to_' + synapse_info.post_population.label + \
@@ -110,39 +127,9 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine):
                                     synapse_info.n_post_neurons,
                                     self.__n_post)],
                                   fmt="%u,%u,%u")
-
-            # Loop over all the pre neurons
-            for m in range(0, synapse_info.n_pre_neurons):
-                if self.__post_neurons[m] is None:
-
-                    # If the pre and post populations are the same
-                    # then deal with allow_self_connections=False
-                    if (synapse_info.pre_population is
-                            synapse_info.post_population and
-                            not self.__allow_self_connections):
-
-                        # Create a list without the pre_neuron in it
-                        no_self_post_neurons = numpy.concatenate(
-                            [numpy.arange(0, m),
-                             numpy.arange(m + 1,
-                                          synapse_info.n_post_neurons)])
-
-                        # Now use this list in the random choice
-                        self.__post_neurons[m] = self._rng.choice(
-                            no_self_post_neurons, self.__n_post,
-                            self.__with_replacement)
-                    else:
-                        self.__post_neurons[m] = self._rng.choice(
-                            synapse_info.n_post_neurons, self.__n_post,
-                            self.__with_replacement)
-
-                    # If verbose then output the list connected to this
-                    # pre-neuron
-                    if self.verbose:
-                        numpy.savetxt(
-                            file_handle,
-                            self.__post_neurons[m][None, :],
-                            fmt=("%u," * (self.__n_post - 1) + "%u"))
+                    numpy.savetxt(
+                        file_handle, self.__post_neurons,
+                        fmt=("%u," * (self.__n_post - 1) + "%u"))
 
         return self.__post_neurons
 
@@ -199,40 +186,28 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine):
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type, synapse_info):
         # pylint: disable=too-many-arguments
-        # Get lo and hi for the pre vertex
+        # Get the post-neurons of the pre-neurons of the slice that are in
+        # the post-vertex slice
         lo = pre_vertex_slice.lo_atom
         hi = pre_vertex_slice.hi_atom
-
-        # Get number of connections
-        n_connections = 0
-        for n in range(lo, hi + 1):
-            n_connections += len(
-                self._post_neurons_in_slice(post_vertex_slice, n,
-                                            synapse_info))
+        post_neurons = self._get_post_neurons(synapse_info)[lo:hi + 1]
+        in_slice = (
+            (post_neurons >= post_vertex_slice.lo_atom) &
+            (post_neurons <= post_vertex_slice.hi_atom))
+        pre_index, _ = numpy.nonzero(in_slice)
+        n_connections = len(pre_index)
 
         # Set up the block
         block = numpy.zeros(
             n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
-
-        # Set up source and target
-        pre_neurons_in_slice = []
-        post_neurons_in_slice = []
-        pre_vertex_array = numpy.arange(lo, hi + 1)
-        for n in range(lo, hi + 1):
-            post_neurons = self._post_neurons_in_slice(
-                post_vertex_slice, n, synapse_info)
-            for m in range(0, len(post_neurons)):
-                post_neurons_in_slice.append(post_neurons[m])
-                pre_neurons_in_slice.append(pre_vertex_array[n-lo])
-
-        block["source"] = pre_neurons_in_slice
-        block["target"] = post_neurons_in_slice
+        block["source"] = pre_index + lo
+        block["target"] = post_neurons[in_slice]
         block["weight"] = self._generate_weights(
             n_connections, None, pre_vertex_slice, post_vertex_slice,
-            synapse_info)
+            synapse_info, block["source"], block["target"])
         block["delay"] = self._generate_delays(
             n_connections, None, pre_vertex_slice, post_vertex_slice,
-            synapse_info)
+            synapse_info, block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
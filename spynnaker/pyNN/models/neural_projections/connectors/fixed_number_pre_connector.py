@@ -40,6 +40,12 @@ class FixedNumberPreConnector(AbstractGenerateConnectorOnMachine):
         "__with_replacement",
         "__pre_connector_seed"]
 
+    # The pre-neurons are chosen once, with their seed, from the rng
+    _DERIVED_SLOTS = (
+        "__pre_connector_seed",
+        "__pre_neurons",
+        "__pre_neurons_set")
+
     def __init__(
             self, n, allow_self_connections=True, with_replacement=False,
             safe=True, callback=None, verbose=False, rng=None):
@@ -100,10 +106,24 @@ class FixedNumberPreConnector(AbstractGenerateConnectorOnMachine):
     def _get_pre_neurons(self, synapse_info):
         # If we haven't set the array up yet, do it now
         if not self.__pre_neurons_set:
-            self.__pre_neurons = [None] * synapse_info.n_post_neurons
+
+            # Choose the pre-neurons of all the post-neurons at once; if the
+            # pre and post populations are the same then deal with
+            # allow_self_connections=False
+            self.__pre_neurons = utility_calls.random_selections(
+                self._rng, synapse_info.n_post_neurons,
+                synapse_info.n_pre_neurons, self.__n_pre,
+                self.__with_replacement, exclude_row_index=(
+                    synapse_info.pre_population is
+                    synapse_info.post_population and
+                    not self.__allow_self_connections))
+
+            # Sort the neurons now that we have them
+            self.__pre_neurons.sort(axis=1)
             self.__pre_neurons_set = True
 
-            # if verbose open a file to output the connectivity
+            # if verbose output the connectivity to a file, with the list
+            # connected to each post-neuron on a line
             if self.verbose:
                 filename = synapse_info.pre_population.label + \
                     '_to_' + synapse_info.post_population.label + \
@@ -114,39 +134,8 @@ class FixedNumberPreConnector(AbstractGenerateConnectorOnMachine):
                                     synapse_info.n_post_neurons,
                                     self.__n_pre)],
                                   fmt="%u,%u,%u")
-
-            # Loop over all the post neurons
-            for m in range(0, synapse_info.n_post_neurons):
-
-                # If the pre and post populations are the same
-                # then deal with allow_self_connections=False
-                if ((synapse_info.pre_population
-                        is synapse_info.post_population)
-                        and not self.__allow_self_connections):
-                    # Exclude the current pre-neuron from the post-neuron
-                    # list
-                    no_self_pre_neurons = [
-                        n for n in range(
-                            synapse_info.n_pre_neurons) if n != m]
-
-                    # Now use this list in the random choice
-                    self.__pre_neurons[m] = self._rng.choice(
-                        no_self_pre_neurons, self.__n_pre,
-                        self.__with_replacement)
-                else:
-                    self.__pre_neurons[m] = self._rng.choice(
-                        synapse_info.n_pre_neurons, self.__n_pre,
-                        self.__with_replacement)
-
-                # Sort the neurons now that we have them
-                self.__pre_neurons[m].sort()
-
-                # If verbose then output the list connected to this
-                # post-neuron
-                if self.verbose:
                     numpy.savetxt(
-                        file_handle,
-                        self.__pre_neurons[m][None, :],
+                        file_handle, self.__pre_neurons,
                         fmt=("%u," * (self.__n_pre - 1) + "%u"))
 
         return self.__pre_neurons
@@ -204,40 +193,29 @@ class FixedNumberPreConnector(AbstractGenerateConnectorOnMachine):
             synapse_type, synapse_info):
         # pylint: disable=too-many-arguments
 
-        # Get lo and hi for the post vertex
+        # Get the pre-neurons of the post-neurons of the slice that are in
+        # the pre-vertex slice
         lo = post_vertex_slice.lo_atom
         hi = post_vertex_slice.hi_atom
-
-        # Get number of connections
-        n_connections = 0
-        for n in range(lo, hi + 1):
-            n_connections += len(self._pre_neurons_in_slice(
-                pre_vertex_slice, n, synapse_info))
+        pre_neurons = self._get_pre_neurons(synapse_info)[lo:hi + 1]
+        in_slice = (
+            (pre_neurons >= pre_vertex_slice.lo_atom) &
+            (pre_neurons <= pre_vertex_slice.hi_atom))
+        post_index, _ = numpy.nonzero(in_slice)
+        n_connections = len(post_index)
 
         # Set up the block
         block = numpy.zeros(
             n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
-
-        # Set up source and target
-        pre_neurons_in_slice = []
-        post_neurons_in_slice = []
-        post_vertex_array = numpy.arange(lo, hi + 1)
-        for n in range(lo, hi + 1):
-            pre_neurons = self._pre_neurons_in_slice(
-                pre_vertex_slice, n, synapse_info)
-            for m in range(0, len(pre_neurons)):
-                pre_neurons_in_slice.append(pre_neurons[m])
-                post_neurons_in_slice.append(post_vertex_array[n-lo])
-
-        block["source"] = pre_neurons_in_slice
-        block["target"] = post_neurons_in_slice
+        block["source"] = pre_neurons[in_slice]
+        block["target"] = post_index + lo
 
         block["weight"] = self._generate_weights(
             n_connections, None, pre_vertex_slice, post_vertex_slice,
-            synapse_info)
+            synapse_info, block["source"], block["target"])
         block["delay"] = self._generate_delays(
             n_connections, None, pre_vertex_slice, post_vertex_slice,
-            synapse_info)
+            synapse_info, block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
@@ -47,6 +47,12 @@ class FromListConnector(AbstractConnector):
         "__split_pre_slices",
         "__split_post_slices"]
 
+    # The splits of the list cache it by slice
+    _DERIVED_SLOTS = (
+        "__split_conn_list",
+        "__split_post_slices",
+        "__split_pre_slices")
+
     def __init__(self, conn_list, safe=True, callback=None, verbose=False,
                  column_names=None):
         """
@@ -232,7 +238,8 @@ class FromListConnector(AbstractConnector):
             else:
                 block["weight"] = self._generate_weights(
                     len(indices), None, pre_vertex_slice,
-                    post_vertex_slice, synapse_info)
+                    post_vertex_slice, synapse_info, block["source"],
+                    block["target"])
         else:
             block["weight"] = self.__weights[indices]
         # check that conn_list has delays, if not then use the value passed in
@@ -242,7 +249,8 @@ class FromListConnector(AbstractConnector):
             else:
                 block["delay"] = self._generate_delays(
                     len(indices), None, pre_vertex_slice,
-                    post_vertex_slice, synapse_info)
+                    post_vertex_slice, synapse_info, block["source"],
+                    block["target"])
         else:
             block["delay"] = self._clip_delays(self.__delays[indices])
         block["synapse_type"] = synapse_type
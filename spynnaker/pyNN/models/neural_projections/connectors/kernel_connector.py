@@ -190,60 +190,46 @@ class KernelConnector(AbstractGenerateConnectorOnMachine):
         if self._krn_delays is None:
             self._krn_delays = self.get_kernel_vals(delays)
 
+        # Get the post-vertices that are in the common coordinate system,
+        # as coordinates in the pre-vertex sampling space
         post_as_pre_r, post_as_pre_c = self.post_as_pre(post_vertex_slice)
-        coords = {}
-        hh, hw = self._hlf_k_h, self._hlf_k_w
-        all_pre_ids = []
-        all_post_ids = []
-        all_delays = []
-        all_weights = []
-        count = 0
-        post_lo = post_vertex_slice.lo_atom
-
-        # Loop over pre-vertices
-        for pre_idx in range(
-                pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom + 1):
-            pre_r, pre_c = divmod(pre_idx, self._pre_w)
-            coords[pre_idx] = []
-            # Loop over post-vertices
-            for post_idx in range(
-                    post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1):
-
-                # convert to common coord system
-                r = post_as_pre_r[post_idx - post_lo]
-                c = post_as_pre_c[post_idx - post_lo]
-                if not (0 <= r < self._common_h and 0 <= c < self._common_w):
-                    continue
-
-                r, c = self.pre_as_post((r, c))
-
-                # Obtain coordinates to test against kernel sizes
-                dr = r - pre_r
-                kr = hh - dr
-                dc = c - pre_c
-                kc = hw - dc
-
-                if 0 <= kr < self._kernel_h and 0 <= kc < self._kernel_w:
-                    if post_idx in coords[pre_idx]:
-                        continue
-
-                    coords[pre_idx].append(post_idx)
-
-                    # Store weights, delays and pre/post ids
-                    w = self._krn_weights[kr, kc]
-                    d = self._krn_delays[kr, kc]
-
-                    count += 1
-
-                    all_pre_ids.append(pre_idx)
-                    all_post_ids.append(post_idx)
-                    all_delays.append(d)
-                    all_weights.append(w)
-
-        # Now the loop is complete, return relevant data
-        return (count, numpy.array(all_post_ids, dtype='uint32'),
-                numpy.array(all_pre_ids, dtype='uint32'),
-                numpy.array(all_delays), numpy.array(all_weights))
+        post_ids = numpy.arange(
+            post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1)
+        in_common = (
+            (0 <= post_as_pre_r) & (post_as_pre_r < self._common_h) &
+            (0 <= post_as_pre_c) & (post_as_pre_c < self._common_w))
+        post_ids = post_ids[in_common]
+        r, c = self.pre_as_post(
+            (post_as_pre_r[in_common], post_as_pre_c[in_common]))
+
+        # Each kernel position of each post-vertex gives a candidate
+        # pre-vertex; kernel position (kr, kc) connects to the pre-vertex at
+        # (r - half height + kr, c - half width + kc)
+        kr, kc = numpy.divmod(
+            numpy.arange(self._kernel_h * self._kernel_w), self._kernel_w)
+        pre_r = r[:, numpy.newaxis] - self._hlf_k_h + kr
+        pre_c = c[:, numpy.newaxis] - self._hlf_k_w + kc
+        pre_ids = pre_r * self._pre_w + pre_c
+        valid = (
+            (0 <= pre_c) & (pre_c < self._pre_w) &
+            (pre_vertex_slice.lo_atom <= pre_ids) &
+            (pre_ids <= pre_vertex_slice.hi_atom))
+        post_index, kernel_index = numpy.nonzero(valid)
+        all_pre_ids = pre_ids[post_index, kernel_index]
+        all_post_ids = post_ids[post_index]
+
+        # Order the connections by pre-vertex and then by post-vertex
+        order = numpy.lexsort((all_post_ids, all_pre_ids))
+        all_pre_ids = all_pre_ids[order]
+        all_post_ids = all_post_ids[order]
+        kr = kr[kernel_index[order]]
+        kc = kc[kernel_index[order]]
+
+        # Now the connections are found, return relevant data
+        return (len(all_pre_ids), all_post_ids.astype('uint32'),
+                all_pre_ids.astype('uint32'),
+                numpy.array(self._krn_delays[kr, kc]),
+                numpy.array(self._krn_weights[kr, kc]))
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self, synapse_info):
@@ -44,6 +44,12 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine):
         "__synapses_per_edge",
         "__with_replacement"]
 
+    # The synapses are shared between the edges using the rng
+    _DERIVED_SLOTS = (
+        "__post_slices",
+        "__pre_slices",
+        "__synapses_per_edge")
+
     def __init__(self, num_synapses, allow_self_connections=True,
                  with_replacement=True, safe=True, callback=None,
                  verbose=False, rng=None):
@@ -191,10 +197,10 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine):
         block["target"] = pairs[chosen, 1]
         block["weight"] = self._generate_weights(
             n_connections, [connection_slice], pre_vertex_slice,
-            post_vertex_slice, synapse_info)
+            post_vertex_slice, synapse_info, block["source"], block["target"])
         block["delay"] = self._generate_delays(
             n_connections, [connection_slice], pre_vertex_slice,
-            post_vertex_slice, synapse_info)
+            post_vertex_slice, synapse_info, block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
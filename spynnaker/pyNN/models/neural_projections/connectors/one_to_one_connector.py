@@ -99,10 +99,10 @@ class OneToOneConnector(AbstractGenerateConnectorOnMachine):
         block["target"] = numpy.arange(max_lo_atom, min_hi_atom + 1)
         block["weight"] = self._generate_weights(
             n_connections, [connection_slice], pre_vertex_slice,
-            post_vertex_slice, synapse_info)
+            post_vertex_slice, synapse_info, block["source"], block["target"])
         block["delay"] = self._generate_delays(
             n_connections, [connection_slice], pre_vertex_slice,
-            post_vertex_slice, synapse_info)
+            post_vertex_slice, synapse_info, block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
@@ -16,6 +16,7 @@
 import logging
 import os
 import math
+import numpy
 from spinn_utilities.overrides import overrides
 from pacman.model.constraints.key_allocator_constraints import (
     ContiguousKeyRangeContraint)
@@ -67,6 +68,11 @@ _C_MAIN_BASE_N_CPU_CYCLES = 0
 # The microseconds per timestep will be divided by this to get the max offset
 _MAX_OFFSET_DENOMINATOR = 10
 
+# The most ranges of changed neurons of a core that will be written
+# individually when parameters change; beyond this, the whole region is
+# rewritten
+_MAX_CHANGED_RANGES = 16
+
 
 class AbstractPopulationVertex(
         ApplicationVertex, AbstractGeneratesDataSpecification,
@@ -142,7 +148,7 @@ class AbstractPopulationVertex(
         self._state_variables = SpynnakerRangeDictionary(n_neurons)
         self.__neuron_impl.add_parameters(self._parameters)
         self.__neuron_impl.add_state_variables(self._state_variables)
-        self.__initial_state_variables = None
+        self.__initial_state_variables = dict()
         self.__updated_state_variables = set()
 
         # Set up for recording
@@ -310,37 +316,72 @@ class AbstractPopulationVertex(
             size=params_size, label='NeuronParams')
 
     @staticmethod
-    def __copy_ranged_dict(source, merge=None, merge_keys=None):
-        target = SpynnakerRangeDictionary(len(source))
-        for key in source.keys():
-            copy_list = SpynnakerRangedList(len(source))
-            if merge_keys is None or key not in merge_keys:
-                init_list = source.get_list(key)
-            else:
-                init_list = merge.get_list(key)
-            for start, stop, value in init_list.iter_ranges():
-                is_list = (hasattr(value, '__iter__') and
-                           not isinstance(value, str))
-                copy_list.set_value_by_slice(start, stop, value, is_list)
-            target[key] = copy_list
-        return target
+    def __copy_ranged_list(source):
+        copy_list = SpynnakerRangedList(len(source))
+        for start, stop, value in source.iter_ranges():
+            is_list = (hasattr(value, '__iter__') and
+                       not isinstance(value, str))
+            copy_list.set_value_by_slice(start, stop, value, is_list)
+        return copy_list
+
+    def __is_initial_state(self, key):
+        """ Determine if a state variable still has the values it had when\
+            its initial values were last copied
+
+        :param str key: The name of the state variable
+        :rtype: bool
+        """
+        if key not in self.__initial_state_variables:
+            return False
+        _, value_list, n_changes = self.__initial_state_variables[key]
+        return (self._state_variables.get_list(key) is value_list and
+                n_changes is not None and
+                getattr(value_list, "n_changes", None) == n_changes)
+
+    def __reset_state_variables(self):
+        """ Reset the state variables to their initial values, other than\
+            those that have been updated since the reset.  Variables which\
+            have not changed since the initial values were copied are kept\
+            as they are.
+        """
+        state_variables = SpynnakerRangeDictionary(self.__n_atoms)
+        for key in self._state_variables.keys():
+            value_list = self._state_variables.get_list(key)
+            if (key not in self.__updated_state_variables and
+                    not self.__is_initial_state(key)):
+                initial_list, _, _ = self.__initial_state_variables[key]
+                value_list = self.__copy_ranged_list(initial_list)
+                self.__initial_state_variables[key] = (
+                    initial_list, value_list, value_list.n_changes)
+            elif isinstance(value_list, SpynnakerRangedList):
+                # The machine has the state from the end of the last run
+                value_list.set_dirty(
+                    0, numpy.ones(self.__n_atoms, dtype="bool"))
+            state_variables[key] = value_list
+        self._state_variables = state_variables
+
+    def __copy_initial_state_variables(self):
+        """ Copy the initial values of any state variables which have\
+            changed since they were last copied
+        """
+        for key in self._state_variables.keys():
+            if not self.__is_initial_state(key):
+                value_list = self._state_variables.get_list(key)
+                self.__initial_state_variables[key] = (
+                    self.__copy_ranged_list(value_list), value_list,
+                    getattr(value_list, "n_changes", None))
 
     def _write_neuron_parameters(
             self, spec, key, vertex_slice, machine_time_step,
             time_scale_factor):
 
         # If resetting, reset any state variables that need to be reset
-        if (self.__has_reset_last and
-                self.__initial_state_variables is not None):
-            self._state_variables = self.__copy_ranged_dict(
-                self.__initial_state_variables, self._state_variables,
-                self.__updated_state_variables)
-            self.__initial_state_variables = None
-
-        # If no initial state variables, copy them now
+        if self.__has_reset_last and self.__initial_state_variables:
+            self.__reset_state_variables()
+
+        # Copy the initial values of the state variables if needed
         if self.__has_reset_last:
-            self.__initial_state_variables = self.__copy_ranged_dict(
-                self._state_variables)
+            self.__copy_initial_state_variables()
 
         # Reset things that need resetting
         self.__has_reset_last = False
@@ -391,22 +432,79 @@ class AbstractPopulationVertex(
             self._parameters, self._state_variables, vertex_slice)
         spec.write_array(neuron_data)
 
+        # The machine now has the current values of these neurons
+        self._parameters.mark_clean(
+            vertex_slice.lo_atom, vertex_slice.hi_atom + 1)
+        self._state_variables.mark_clean(
+            vertex_slice.lo_atom, vertex_slice.hi_atom + 1)
+
+    def _get_changed_neuron_parameters(self, vertex_slice):
+        """ Get the parts of the neuron parameters of a slice that have\
+            changed since they were last written
+
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The slice of atoms to get the changes of
+        :return: The offset of each part from the start of the neuron\
+            parameters region, and the data of the part, or None if the whole\
+            region must be rewritten
+        :rtype: list(tuple(int, bytes)) or None
+        """
+        # After a reset, the state of every neuron has to be written
+        if self.__has_reset_last:
+            return None
+        lo_atom = vertex_slice.lo_atom
+        hi_atom = vertex_slice.hi_atom + 1
+        ranges = sorted(
+            self._parameters.get_dirty_ranges(lo_atom, hi_atom) +
+            self._state_variables.get_dirty_ranges(lo_atom, hi_atom))
+        merged = list()
+        for start, stop in ranges:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+            else:
+                merged.append((start, stop))
+        if len(merged) > _MAX_CHANGED_RANGES:
+            return None
+        changes = self.__neuron_impl.get_data_by_ranges(
+            self._parameters, self._state_variables, vertex_slice, merged)
+        if changes is None:
+            return None
+        self._parameters.mark_clean(lo_atom, hi_atom)
+        self._state_variables.mark_clean(lo_atom, hi_atom)
+        return [(self.BYTES_TILL_START_OF_GLOBAL_PARAMETERS + offset, data)
+                for offset, data in changes]
+
     @inject_items({
         "machine_time_step": "MachineTimeStep",
         "time_scale_factor": "TimeScaleFactor",
         "graph_mapper": "MemoryGraphMapper",
-        "routing_info": "MemoryRoutingInfos"})
+        "routing_info": "MemoryRoutingInfos",
+        "transceiver": "MemoryTransceiver"})
     @overrides(
         AbstractRewritesDataSpecification.regenerate_data_specification,
         additional_arguments={
             "machine_time_step", "time_scale_factor", "graph_mapper",
-            "routing_info"})
+            "routing_info", "transceiver"})
     def regenerate_data_specification(
             self, spec, placement, machine_time_step, time_scale_factor,
-            graph_mapper, routing_info):
+            graph_mapper, routing_info, transceiver):
         # pylint: disable=too-many-arguments, arguments-differ
         vertex_slice = graph_mapper.get_slice(placement.vertex)
 
+        # If possible, write just the neurons that have changed directly, and
+        # leave the specification empty so that nothing else is rewritten
+        changes = self._get_changed_neuron_parameters(vertex_slice)
+        if changes is not None:
+            if changes:
+                address = helpful_functions.locate_memory_region_for_placement(
+                    placement, POPULATION_BASED_REGIONS.NEURON_PARAMS.value,
+                    transceiver)
+                for offset, data in changes:
+                    transceiver.write_memory(
+                        placement.x, placement.y, address + offset, data)
+            spec.end_specification()
+            return
+
         # reserve the neuron parameters data region
         self._reserve_neuron_params_data_region(
             spec, graph_mapper.get_slice(placement.vertex))
@@ -537,6 +635,16 @@ class AbstractPopulationVertex(
             placements, graph_mapper, self, NeuronRecorder.SPIKES,
             machine_time_step)
 
+    @overrides(AbstractSpikeRecordable.iter_spikes)
+    def iter_spikes(
+            self, placements, graph_mapper, buffer_manager, machine_time_step,
+            order=None):
+        return self.__neuron_recorder.iter_spikes(
+            self.label, buffer_manager,
+            len(self.__neuron_impl.get_recordable_variables()),
+            placements, graph_mapper, self, NeuronRecorder.SPIKES,
+            machine_time_step, order)
+
     @overrides(AbstractNeuronRecordable.get_recordable_variables)
     def get_recordable_variables(self):
         return self.__neuron_recorder.get_recordable_variables()
@@ -561,6 +669,17 @@ class AbstractPopulationVertex(
             self.__neuron_impl.get_recordable_variable_index(variable),
             placements, graph_mapper, self, variable, n_machine_time_steps)
 
+    @overrides(AbstractNeuronRecordable.export_data)
+    def export_data(self, variable, n_machine_time_steps, placements,
+                    graph_mapper, buffer_manager, machine_time_step,
+                    directory):
+        # pylint: disable=too-many-arguments
+        return self.__neuron_recorder.export_matrix_data(
+            self.label, buffer_manager,
+            self.__neuron_impl.get_recordable_variable_index(variable),
+            placements, graph_mapper, self, variable, n_machine_time_steps,
+            directory)
+
     @overrides(AbstractNeuronRecordable.get_neuron_sampling_interval)
     def get_neuron_sampling_interval(self, variable):
         return self.__neuron_recorder.get_neuron_sampling_interval(variable)
@@ -656,6 +775,12 @@ class AbstractPopulationVertex(
         self._parameters.set_value(key, value)
         self.__change_requires_neuron_parameters_reload = True
 
+    @overrides(AbstractPopulationSettable.set_value_by_selector)
+    def set_value_by_selector(self, selector, key, value):
+        super(AbstractPopulationVertex, self).set_value_by_selector(
+            selector, key, value)
+        self.__change_requires_neuron_parameters_reload = True
+
     @overrides(AbstractReadParametersBeforeSet.read_parameters_from_machine)
     def read_parameters_from_machine(
             self, transceiver, placement, vertex_slice):
@@ -681,10 +806,18 @@ class AbstractPopulationVertex(
             placement.x, placement.y, neuron_parameters_sdram_address,
             size_of_region)
 
-        # update python neuron parameters with the data
+        # update python neuron parameters with the data; this is what is on
+        # the machine already, so doesn't count as a change to be written
+        lo_atom = vertex_slice.lo_atom
+        hi_atom = vertex_slice.hi_atom + 1
+        parameters_dirty = self._parameters.get_dirty(lo_atom, hi_atom)
+        state_variables_dirty = self._state_variables.get_dirty(
+            lo_atom, hi_atom)
         self.__neuron_impl.read_data(
             byte_array, 0, vertex_slice, self._parameters,
             self._state_variables)
+        self._parameters.set_dirty(lo_atom, parameters_dirty)
+        self._state_variables.set_dirty(lo_atom, state_variables_dirty)
 
     @property
     def weight_scale(self):
@@ -160,6 +160,30 @@ class AbstractNeuronImpl(object):
         :rtype: ~numpy.ndarray(~numpy.uint32)
         """
 
+    def get_data_by_ranges(
+            self, parameters, state_variables, vertex_slice, ranges):
+        """ Get the data *to be written to the machine* for this model for\
+            just some ranges of the atoms of a slice, so that only those\
+            parts of the data need be written.  By default, this is not\
+            supported and all the data must be written with\
+            :py:meth:`get_data`.
+
+        :param ~spinn_utilities.ranged.RangeDictionary parameters:
+            The holder of the parameters
+        :param ~spinn_utilities.ranged.RangeDictionary state_variables:
+            The holder of the state variables
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The slice of the vertex that the data is part of
+        :param list(tuple(int,int)) ranges:
+            The start and exclusive end of each range of atoms
+        :return: The offset in bytes of each part of the data from the start\
+            of the data of the slice, and the part of the data, or None if\
+            not supported
+        :rtype: list(tuple(int, bytes)) or None
+        """
+        # pylint: disable=unused-argument
+        return None
+
     @abstractmethod
     def read_data(
             self, data, offset, vertex_slice, parameters, state_variables):
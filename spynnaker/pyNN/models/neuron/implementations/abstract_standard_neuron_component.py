@@ -115,6 +115,31 @@ class AbstractStandardNeuronComponent(with_metaclass(AbstractBase, object)):
         return self.struct.get_data(
             values, vertex_slice.lo_atom, vertex_slice.n_atoms)
 
+    def get_data_by_ranges(
+            self, parameters, state_variables, vertex_slice, ranges):
+        """ Get the data *to be written to the machine* for this model for\
+            just some ranges of the atoms of a slice
+
+        :param ~spinn_utilities.ranged.RangeDictionary parameters:
+            The holder of the parameters
+        :param ~spinn_utilities.ranged.RangeDictionary state_variables:
+            The holder of the state variables
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The slice of the vertex that the data is part of
+        :param list(tuple(int,int)) ranges:
+            The start and exclusive end of each range of atoms
+        :return: The offset in bytes of the data of each range from the start\
+            of the data of the slice, and the data itself
+        :rtype: list(tuple(int, bytes))
+        """
+        values = self.get_values(parameters, state_variables, vertex_slice)
+        item_size = self.struct.numpy_dtype.itemsize
+        return [
+            ((start - vertex_slice.lo_atom) * item_size,
+             self.struct.get_data(values, start, stop - start).tobytes()[
+                 :(stop - start) * item_size])
+            for start, stop in ranges]
+
     @abstractmethod
     def update_values(self, values, parameters, state_variables):
         """ Update the parameters and state variables with the given struct\
@@ -171,6 +171,21 @@ class NeuronImplStandard(AbstractNeuronImpl):
             for component in self.__components
         ])
 
+    @overrides(AbstractNeuronImpl.get_data_by_ranges)
+    def get_data_by_ranges(
+            self, parameters, state_variables, vertex_slice, ranges):
+        # The data of each component follows that of the previous one
+        component_offset = 0
+        data_by_ranges = list()
+        for component in self.__components:
+            data_by_ranges.extend(
+                (component_offset + offset, data)
+                for offset, data in component.get_data_by_ranges(
+                    parameters, state_variables, vertex_slice, ranges))
+            component_offset += component.get_sdram_usage_in_bytes(
+                vertex_slice.n_atoms)
+        return data_by_ranges
+
     @overrides(AbstractNeuronImpl.read_data)
     def read_data(
             self, data, offset, vertex_slice, parameters, state_variables):
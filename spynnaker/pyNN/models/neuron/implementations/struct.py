@@ -17,7 +17,8 @@ import numpy
 from pyNN.random import RandomDistribution
 from spinn_utilities.helpful_functions import is_singleton
 from spinn_utilities.ranged.ranged_list import RangedList
-from spynnaker.pyNN.utilities.utility_calls import convert_to
+from spynnaker.pyNN.utilities.utility_calls import (
+    convert_to, convert_to_array)
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 
 
@@ -25,7 +26,13 @@ class Struct(object):
     """ Represents a C code structure
     """
 
-    __slots__ = ["__field_types"]
+    __slots__ = [
+        # The types of the fields
+        "__field_types",
+        # The names of the fields in the numpy data type
+        "__field_names",
+        # The numpy data type of the struct
+        "__numpy_dtype"]
 
     def __init__(self, field_types):
         """
@@ -35,6 +42,12 @@ class Struct(object):
             list of :py:class:`data_specification.enums.data_type.DataType`
         """
         self.__field_types = field_types
+        self.__field_names = [
+            "f" + str(i) for i in range(len(field_types))]
+        self.__numpy_dtype = numpy.dtype(
+            [(name, numpy.dtype(data_type.struct_encoding))
+             for name, data_type in zip(self.__field_names, field_types)],
+            align=True)
 
     @property
     def field_types(self):
@@ -50,10 +63,7 @@ class Struct(object):
 
         :rtype: :py:class:`numpy.dtype`
         """
-        return numpy.dtype(
-            [("f" + str(i), numpy.dtype(data_type.struct_encoding))
-             for i, data_type in enumerate(self.field_types)],
-            align=True)
+        return self.__numpy_dtype
 
     def get_size_in_whole_words(self, array_size=1):
         """ Get the size of the struct in whole words in an array of given\
@@ -79,39 +89,55 @@ class Struct(object):
         :rtype: numpy.array(dtype="uint32")
         """
         # Create an array to store values in
-        data = numpy.zeros(array_size, dtype=self.numpy_dtype)
+        data = numpy.zeros(array_size, dtype=self.__numpy_dtype)
 
         # Go through and get the values and put them in the array
-        for i, (values, data_type) in enumerate(zip(values, self.field_types)):
+        for name, values, data_type in zip(
+                self.__field_names, values, self.__field_types):
 
             if is_singleton(values):
-                data_value = convert_to(values, data_type)
-                data["f" + str(i)] = data_value
+                data[name] = convert_to(values, data_type)
             elif not isinstance(values, RangedList):
-                data_value = [convert_to(v, data_type)
-                              for v in values[offset:(offset + array_size)]]
-                data["f" + str(i)] = data_value
+                data[name] = convert_to_array(
+                    values[offset:(offset + array_size)], data_type)
             else:
-                for start, end, value in values.iter_ranges_by_slice(
-                        offset, offset + array_size):
-
-                    # Get the values and get them into the correct data type
-                    if isinstance(value, RandomDistribution):
-                        values = value.next(end - start)
-                        data_value = [convert_to(v, data_type) for v in values]
-                    else:
-                        data_value = convert_to(value, data_type)
-                    data["f" + str(i)][
-                        start - offset:end - offset] = data_value
+                self.__set_ranges(
+                    data[name], values, offset, array_size, data_type)
 
         # Pad to whole number of uint32s
-        overflow = (array_size * self.numpy_dtype.itemsize) % BYTES_PER_WORD
+        overflow = (
+            array_size * self.__numpy_dtype.itemsize) % BYTES_PER_WORD
         if overflow != 0:
             data = numpy.pad(
                 data.view("uint8"), (0, BYTES_PER_WORD - overflow), "constant")
 
         return data.view("uint32")
 
+    @staticmethod
+    def __set_ranges(field, values, offset, array_size, data_type):
+        """ Set a field of an array of structs from the ranges of a\
+            RangedList, converting the values of all the ranges together
+
+        :param ~numpy.ndarray field: The field of the structs to set
+        :param RangedList values: The values of the field
+        :param int offset: The index in the values of the first struct
+        :param int array_size: The number of structs
+        :param DataType data_type: The type of the field
+        """
+        slices = list()
+        range_values = list()
+        for start, end, value in values.iter_ranges_by_slice(
+                offset, offset + array_size):
+            if isinstance(value, RandomDistribution):
+                field[start - offset:end - offset] = convert_to_array(
+                    value.next(end - start), data_type)
+            else:
+                slices.append(slice(start - offset, end - offset))
+                range_values.append(value)
+        for range_slice, data_value in zip(
+                slices, convert_to_array(range_values, data_type)):
+            field[range_slice] = data_value
+
     def read_data(self, data, offset=0, array_size=1):
         """ Read a bytearray of data and convert to struct values
 
@@ -80,7 +80,8 @@ class MasterPopTableAsBinarySearch(object):
     __slots__ = [
         "__entries",
         "__n_addresses",
-        "__n_single_entries"]
+        "__n_single_entries",
+        "__read_tables"]
 
     # Switched ordering of count and start as numpy will switch them back
     # when asked for view("<4")
@@ -100,6 +101,7 @@ class MasterPopTableAsBinarySearch(object):
         self.__entries = None
         self.__n_addresses = 0
         self.__n_single_entries = None
+        self.__read_tables = dict()
 
     def get_master_population_table_size(self, in_edges):
         """ Get the size of the master population table in SDRAM
@@ -287,7 +289,31 @@ class MasterPopTableAsBinarySearch(object):
         :type txrx: :py:class:`spinnman.transceiver.Transceiver`
         :return: a synaptic matrix memory position.
         """
-        # pylint: disable=too-many-arguments, too-many-locals, arguments-differ
+        # pylint: disable=too-many-arguments, arguments-differ
+        entry_list, row_lengths, addresses, is_single = self.__read_table(
+            master_pop_base_mem_address, txrx, chip_x, chip_y)
+
+        index = self._locate_entry(entry_list, incoming_key)
+        if index is None:
+            return []
+        start = entry_list[index]["start"]
+        end = start + entry_list[index]["count"]
+        return list(zip(
+            row_lengths[start:end], addresses[start:end],
+            is_single[start:end]))
+
+    def __read_table(self, master_pop_base_mem_address, txrx, chip_x, chip_y):
+        """ Read the master population table from the machine, or get it\
+            from the cache if it has already been read
+
+        :return: The entries, and the row lengths, addresses and single flags\
+            of the address list
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray,\
+            ~numpy.ndarray)
+        """
+        table_key = (chip_x, chip_y, master_pop_base_mem_address)
+        if table_key in self.__read_tables:
+            return self.__read_tables[table_key]
 
         # get entries in master pop
         n_entries, n_addresses = _TWO_WORDS.unpack(txrx.read_memory(
@@ -310,50 +336,38 @@ class MasterPopTableAsBinarySearch(object):
             full_data, 'uint8', n_address_bytes, n_entry_bytes).view(
                 dtype=self.ADDRESS_LIST_DTYPE)
 
-        entry = self._locate_entry(entry_list, incoming_key)
-        if entry is None:
-            return []
-        addresses = list()
-        for i in range(entry["start"], entry["start"] + entry["count"]):
-            address_and_row_length = address_list[i]
-            is_single = (
-                address_and_row_length &
-                MasterPopTableAsBinarySearch.SINGLE_BIT_FLAG_BIT) > 0
-            address = (
-                address_and_row_length &
-                MasterPopTableAsBinarySearch.ADDRESS_MASK)
-            row_length = (
-                address_and_row_length &
-                MasterPopTableAsBinarySearch.ROW_LENGTH_MASK)
-            if is_single:
-                address = address >> 8
-            else:
-                address = address >> self.ADDRESS_SCALED_SHIFT
-
-            addresses.append((row_length, address, is_single))
-        return addresses
+        # decode the whole address list
+        is_single = (address_list & self.SINGLE_BIT_FLAG_BIT) > 0
+        addresses = address_list & self.ADDRESS_MASK
+        addresses = numpy.where(
+            is_single, addresses >> 8, addresses >> self.ADDRESS_SCALED_SHIFT)
+        row_lengths = address_list & self.ROW_LENGTH_MASK
+
+        table = (entry_list, row_lengths, addresses, is_single)
+        self.__read_tables[table_key] = table
+        return table
+
+    def clear_cache(self):
+        """ Forget any master population tables read from the machine, so\
+            that they are read again when next needed
+        """
+        self.__read_tables = dict()
 
     @staticmethod
     def _locate_entry(entries, key):
-        """ Search the binary tree structure for the correct entry.
+        """ Search the sorted entries for the entry that matches the key.
 
+        :param entries: the entries of the table
         :param key: the key to search the master pop table for a given entry
-        :return: the entry for this given key
-        :rtype: :py:class:`_MasterPopEntry`
+        :return: the index of the entry for this given key, or None if none
+        :rtype: int or None
         """
-        imin = 0
-        imax = len(entries)
-
-        while imin < imax:
-            imid = (imax + imin) // 2
-            entry = entries[imid]
-            if key & entry["mask"] == entry["key"]:
-                return entry
-            if key > entry["key"]:
-                imin = imid + 1
-            else:
-                imax = imid
-        return None
+        index = numpy.searchsorted(entries["key"], key, side="right") - 1
+        if index < 0:
+            return None
+        if key & entries[index]["mask"] != entries[index]["key"]:
+            return None
+        return index
 
     def get_edge_constraints(self):
         """ Gets the constraints for this table on edges coming in to a vertex.
@@ -84,6 +84,18 @@ class AbstractNeuronModel(
         global_data = self.__global_struct.get_data(values)
         return numpy.concatenate([global_data, super_data])
 
+    @overrides(AbstractStandardNeuronComponent.get_data_by_ranges)
+    def get_data_by_ranges(
+            self, parameters, state_variables, vertex_slice, ranges):
+        # The neuron data follows the global data
+        global_size = (
+            self.__global_struct.get_size_in_whole_words() * BYTES_PER_WORD)
+        return [
+            (offset + global_size, data)
+            for offset, data in super(
+                AbstractNeuronModel, self).get_data_by_ranges(
+                    parameters, state_variables, vertex_slice, ranges)]
+
     @overrides(AbstractStandardNeuronComponent.read_data)
     def read_data(
             self, data, offset, vertex_slice, parameters, state_variables):
@@ -25,6 +25,7 @@ from .synapse_dynamics_stdp import SynapseDynamicsSTDP
 from .synapse_dynamics_structural_common import SynapseDynamicsStructuralCommon
 from .synapse_dynamics_structural_static import SynapseDynamicsStructuralStatic
 from .synapse_dynamics_structural_stdp import SynapseDynamicsStructuralSTDP
+from .synaptic_rows import SynapticRows
 
 __all__ = ["AbstractSynapseDynamics", "AbstractGenerateOnMachine",
            "AbstractStaticSynapseDynamics",
@@ -34,4 +35,5 @@ __all__ = ["AbstractSynapseDynamics", "AbstractGenerateOnMachine",
            # Structural plasticity
            "SynapseDynamicsStructuralCommon",
            "SynapseDynamicsStructuralStatic",
-           "SynapseDynamicsStructuralSTDP"]
+           "SynapseDynamicsStructuralSTDP",
+           "SynapticRows"]
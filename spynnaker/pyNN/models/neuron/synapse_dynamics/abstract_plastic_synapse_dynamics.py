@@ -42,11 +42,10 @@ class AbstractPlasticSynapseDynamics(AbstractSynapseDynamics):
             and lengths for the fixed_plastic and plastic-plastic parts of\
             each row.
 
-        Data is returned as an array made up of an array of 32-bit words for\
-        each row, for each of the fixed-plastic and plastic-plastic data\
-        regions.  The row into which connection should go is given by\
-        `connection_row_indices`, and the total number of rows is given by\
-        `n_rows`.
+        Data is returned as rows of 32-bit words for each of the\
+        fixed-plastic and plastic-plastic data regions.  The row into which\
+        connection should go is given by `connection_row_indices`, and the\
+        total number of rows is given by `n_rows`.
 
         Lengths are returned as an array made up of an integer for each row,\
         for each of the fixed-plastic and plastic-plastic regions.
@@ -58,8 +57,7 @@ class AbstractPlasticSynapseDynamics(AbstractSynapseDynamics):
         :param int n_synapse_types:
         :return: (fp_data, pp_data, fp_size, pp_size)
         :rtype:
-            tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray,
-            ~numpy.ndarray)
+            tuple(SynapticRows, SynapticRows, ~numpy.ndarray, ~numpy.ndarray)
         """
 
     @abstractmethod
@@ -95,9 +93,9 @@ class AbstractPlasticSynapseDynamics(AbstractSynapseDynamics):
         :param ~pacman.model.graphs.common.Slice post_vertex_slice:
         :param int n_synapse_types:
         :param ~numpy.ndarray pp_size: 1D
-        :param ~numpy.ndarray pp_data: 2D
+        :param SynapticRows pp_data:
         :param ~numpy.ndarray fp_size: 1D
-        :param ~numpy.ndarray fp_data: 2D
+        :param SynapticRows fp_data:
         :return:
             array with columns ``source``, ``target``, ``weight``, ``delay``
         :rtype: ~numpy.ndarray
@@ -41,10 +41,10 @@ class AbstractStaticSynapseDynamics(AbstractSynapseDynamics):
         """ Get the fixed-fixed data for each row, and lengths for the\
             fixed-fixed parts of each row.
 
-        Data is returned as an array made up of an array of 32-bit words for\
-        each row for the fixed-fixed region. The row into which connection\
-        should go is given by `connection_row_indices`, and the total number\
-        of rows is given by `n_rows`.
+        Data is returned as rows of 32-bit words for the fixed-fixed region.\
+        The row into which connection should go is given by\
+        `connection_row_indices`, and the total number of rows is given by\
+        `n_rows`.
 
         Lengths are returned as an array made up of an integer for each row,\
         for the fixed-fixed region.
@@ -55,7 +55,7 @@ class AbstractStaticSynapseDynamics(AbstractSynapseDynamics):
         :param ~pacman.model.graphs.common.Slice post_vertex_slice:
         :param int n_synapse_types:
         :return: (ff_data, ff_size)
-        :rtype: tuple(list(~numpy.ndarray), ~numpy.ndarray)
+        :rtype: tuple(SynapticRows, ~numpy.ndarray)
         """
 
     @abstractmethod
@@ -83,5 +83,5 @@ class AbstractStaticSynapseDynamics(AbstractSynapseDynamics):
         :param ~pacman.model.graphs.common.Slice post_vertex_slice:
         :param int n_synapse_types:
         :param ~numpy.ndarray ff_size:
-        :param list(~numpy.ndarray) ff_data:
+        :param SynapticRows ff_data:
         """
@@ -13,11 +13,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import math
-import numpy
 from six import add_metaclass
 from spinn_utilities.abstract_base import (
     AbstractBase, abstractmethod, abstractproperty)
+from .synaptic_rows import SynapticRows
 
 
 @add_metaclass(AbstractBase)
@@ -181,31 +180,26 @@ class AbstractSynapseDynamics(object):
         :param ~numpy.ndarray connection_row_indices:
         :param int n_rows:
         :param ~numpy.ndarray data:
-        :rtype: list(~numpy.ndarray)
+        :rtype: SynapticRows
         """
-        return [
-            data[connection_row_indices == i].reshape(-1)
-            for i in range(n_rows)]
+        return SynapticRows.from_connections(
+            connection_row_indices, n_rows, data)
 
     def get_n_items(self, rows, item_size):
         """ Get the number of items in each row as 4-byte values, given the\
             item size
 
-        :param ~numpy.ndarray rows:
+        :param SynapticRows rows:
         :param int item_size:
         :rtype: ~numpy.ndarray
         """
-        return numpy.array([
-            int(math.ceil(float(row.size) / float(item_size)))
-            for row in rows], dtype="uint32").reshape((-1, 1))
+        return ((rows.lengths + (item_size - 1)) // item_size).astype(
+            "uint32").reshape((-1, 1))
 
     def get_words(self, rows):
         """ Convert the row data to words
 
-        :param ~numpy.ndarray rows:
-        :rtype: ~numpy.ndarray
+        :param SynapticRows rows:
+        :rtype: SynapticRows
         """
-        words = [numpy.pad(
-            row, (0, (4 - (row.size % 4)) & 0x3), mode="constant",
-            constant_values=0).view("uint32") for row in rows]
-        return words
+        return rows.pad((rows.lengths + 3) & ~0x3).view("uint32")
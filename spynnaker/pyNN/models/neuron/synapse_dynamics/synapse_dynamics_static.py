@@ -112,26 +112,19 @@ class SynapseDynamicsStatic(
         if self.__pad_to_length is not None:
             # Pad the data
             fixed_fixed_rows = self._pad_row(fixed_fixed_rows, 4)
-        ff_data = [fixed_row.view("uint32") for fixed_row in fixed_fixed_rows]
+        ff_data = fixed_fixed_rows.view("uint32")
 
         return ff_data, ff_size
 
     def _pad_row(self, rows, no_bytes_per_connection):
         """
-        :param list(~numpy.ndarray) rows:
+        :param SynapticRows rows:
         :param int no_bytes_per_connection:
-        :rtype: list(~numpy.ndarray)
+        :rtype: SynapticRows
         """
-        padded_rows = []
-        for row in rows:  # Row elements are (individual) bytes
-            padded_rows.append(
-                numpy.concatenate((
-                    row, numpy.zeros(numpy.clip(
-                        no_bytes_per_connection * self.__pad_to_length -
-                        row.size, 0, None)).astype(
-                            dtype="uint8"))).view(dtype="uint8"))
-
-        return padded_rows
+        # Row elements are (individual) bytes
+        return rows.pad(numpy.maximum(
+            rows.lengths, no_bytes_per_connection * self.__pad_to_length))
 
     @overrides(AbstractStaticSynapseDynamics.get_n_static_words_per_row)
     def get_n_static_words_per_row(self, ff_size):
@@ -153,10 +146,10 @@ class SynapseDynamicsStatic(
         n_neuron_id_bits = get_n_bits(post_vertex_slice.n_atoms)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
 
-        data = numpy.concatenate(ff_data)
+        data = ff_data.data
         connections = numpy.zeros(data.size, dtype=self.NUMPY_CONNECTORS_DTYPE)
-        connections["source"] = numpy.concatenate(
-            [numpy.repeat(i, ff_size[i]) for i in range(len(ff_size))])
+        connections["source"] = numpy.repeat(
+            numpy.arange(len(ff_size)), ff_size)
         connections["target"] = (
             (data & neuron_id_mask) + post_vertex_slice.lo_atom)
         connections["weight"] = (data >> 16) & 0xFFFF
@@ -361,12 +361,9 @@ class SynapseDynamicsSTDP(
             # Pad the data
             plastic_plastic_row_data = self._pad_row(
                 plastic_plastic_row_data, n_half_words * BYTES_PER_SHORT)
-        plastic_headers = numpy.zeros(
-            (n_rows, self._n_header_bytes), dtype="uint8")
-        plastic_plastic_rows = [
-            numpy.concatenate((
-                plastic_headers[i], plastic_plastic_row_data[i]))
-            for i in range(n_rows)]
+        plastic_plastic_rows = plastic_plastic_row_data.pad(
+            plastic_plastic_row_data.lengths + self._n_header_bytes,
+            prefix=self._n_header_bytes)
         pp_size = self.get_n_items(plastic_plastic_rows, BYTES_PER_WORD)
         pp_data = self.get_words(plastic_plastic_rows)
 
@@ -374,20 +371,13 @@ class SynapseDynamicsSTDP(
 
     def _pad_row(self, rows, no_bytes_per_connection):
         """
-        :param list(~numpy.ndarray) rows:
+        :param SynapticRows rows:
         :param int no_bytes_per_connection:
-        :rtype: list(~numpy.ndarray)
+        :rtype: SynapticRows
         """
         # Row elements are (individual) bytes
-        return [
-            numpy.concatenate((
-                row, numpy.zeros(
-                    numpy.clip(
-                        (no_bytes_per_connection * self.__pad_to_length -
-                         row.size),
-                        0, None)).astype(dtype="uint8"))
-                ).view(dtype="uint8")
-            for row in rows]
+        return rows.pad(numpy.maximum(
+            rows.lengths, no_bytes_per_connection * self.__pad_to_length))
 
     @overrides(
         AbstractPlasticSynapseDynamics.get_n_plastic_plastic_words_per_row)
@@ -418,23 +408,20 @@ class SynapseDynamicsSTDP(
         n_neuron_id_bits = get_n_bits(post_vertex_slice.n_atoms)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
 
-        data_fixed = numpy.concatenate([
-            fp_data[i].view(dtype="uint16")[0:fp_size[i]]
-            for i in range(n_rows)])
-        pp_without_headers = [
-            row.view(dtype="uint8")[self._n_header_bytes:] for row in pp_data]
+        data_fixed = fp_data.view("uint16").select(fp_size).data
+
+        # The weights are every n_half_words half-words after the header,
+        # starting at the weight half-word
         synapse_structure = self.__timing_dependence.synaptic_structure
         n_half_words = synapse_structure.get_n_half_words_per_connection()
         half_word = synapse_structure.get_weight_half_word()
-        pp_half_words = numpy.concatenate([
-            pp[:size * n_half_words * BYTES_PER_SHORT].view("uint16")[
-                half_word::n_half_words]
-            for pp, size in zip(pp_without_headers, fp_size)])
+        pp_half_words = pp_data.view("uint16").select(
+            fp_size, (self._n_header_bytes // BYTES_PER_SHORT) + half_word,
+            n_half_words).data
 
         connections = numpy.zeros(
             data_fixed.size, dtype=self.NUMPY_CONNECTORS_DTYPE)
-        connections["source"] = numpy.concatenate(
-            [numpy.repeat(i, fp_size[i]) for i in range(len(fp_size))])
+        connections["source"] = numpy.repeat(numpy.arange(n_rows), fp_size)
         connections["target"] = (
             (data_fixed & neuron_id_mask) + post_vertex_slice.lo_atom)
         connections["weight"] = pp_half_words
@@ -0,0 +1,160 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+
+
+class SynapticRows(object):
+    """ A set of variable length rows of data stored compactly as a single\
+        flat array plus an array of row offsets (in the style of the row\
+        pointers of a CSR sparse matrix).
+    """
+
+    __slots__ = [
+        # The flat array of the data of all the rows, one after the other
+        "__data",
+        # The number of items of the data in each row
+        "__lengths",
+        # The index into the data of the start of each row, plus the end
+        "__offsets"]
+
+    def __init__(self, data, lengths):
+        """
+        :param ~numpy.ndarray data: The data of all the rows concatenated
+        :param ~numpy.ndarray lengths: The number of items in each row
+        """
+        self.__data = data
+        self.__lengths = numpy.asarray(lengths, dtype="int64")
+        self.__offsets = numpy.zeros(
+            len(self.__lengths) + 1, dtype="int64")
+        numpy.cumsum(self.__lengths, out=self.__offsets[1:])
+
+    @staticmethod
+    def from_connections(connection_row_indices, n_rows, data):
+        """ Group per-connection data into rows in linear time.
+
+        :param ~numpy.ndarray connection_row_indices:
+            The row into which each connection goes
+        :param int n_rows: The number of rows to create
+        :param ~numpy.ndarray data:
+            The data of each connection, one connection per item of the first
+            dimension
+        :rtype: SynapticRows
+        """
+        n_items_per_connection = int(numpy.prod(data.shape[1:]))
+
+        # A stable sort keeps the connections in the same order within a row;
+        # any out-of-range rows sort to the end and are then dropped
+        order = numpy.argsort(connection_row_indices, kind="stable")
+        counts = numpy.bincount(
+            connection_row_indices, minlength=n_rows)[:n_rows]
+        n_used = int(counts.sum())
+        rows_data = data[order[:n_used]].reshape(-1)
+        return SynapticRows(rows_data, counts * n_items_per_connection)
+
+    @property
+    def data(self):
+        """ The data of all the rows, concatenated
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__data
+
+    @property
+    def lengths(self):
+        """ The number of items in each row
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__lengths
+
+    @property
+    def offsets(self):
+        """ The index of the start of each row in the data, followed by the\
+            total length of the data
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__offsets
+
+    @property
+    def n_rows(self):
+        """
+        :rtype: int
+        """
+        return len(self.__lengths)
+
+    def __len__(self):
+        return len(self.__lengths)
+
+    def __getitem__(self, row):
+        return self.__data[self.__offsets[row]:self.__offsets[row + 1]]
+
+    def __iter__(self):
+        return iter(numpy.split(self.__data, self.__offsets[1:-1]))
+
+    def pad(self, lengths, prefix=0):
+        """ Get a copy of the rows with each row moved into a row of the\
+            given length, after `prefix` zero items, with the remaining\
+            space filled with zeros.
+
+        :param ~numpy.ndarray lengths:
+            The new length of each row; must be at least the current length
+            plus the prefix
+        :param int prefix: The number of zero items to put before each row
+        :rtype: SynapticRows
+        """
+        padded = SynapticRows(
+            numpy.zeros(int(numpy.sum(lengths)), dtype=self.__data.dtype),
+            lengths)
+
+        # Each item moves by the difference in where its row starts
+        shift = padded.offsets[:-1] - self.__offsets[:-1] + prefix
+        positions = numpy.arange(len(self.__data)) + numpy.repeat(
+            shift, self.__lengths)
+        padded.data[positions] = self.__data
+        return padded
+
+    def select(self, lengths, start=0, step=1):
+        """ Get new rows made from `lengths` items of each row, taking every\
+            `step` items from index `start` in the row.
+
+        :param ~numpy.ndarray lengths: The number of items to take per row
+        :param start: The index within each row of the first item to take
+        :type start: int or ~numpy.ndarray
+        :param int step: The distance between items to take
+        :rtype: SynapticRows
+        """
+        lengths = numpy.asarray(lengths, dtype="int64").reshape(-1)
+        selected = numpy.zeros(len(lengths) + 1, dtype="int64")
+        numpy.cumsum(lengths, out=selected[1:])
+
+        # The position of each item in the row, and the start of the row
+        index_in_row = numpy.arange(selected[-1]) - numpy.repeat(
+            selected[:-1], lengths)
+        row_starts = numpy.repeat(self.__offsets[:-1] + start, lengths)
+        return SynapticRows(
+            self.__data[row_starts + index_in_row * step], lengths)
+
+    def view(self, dtype):
+        """ Reinterpret the data of the rows as a different type; each row\
+            must be a whole number of items of the new type.
+
+        :param dtype: The new type of the data
+        :rtype: SynapticRows
+        """
+        data = self.__data.view(dtype)
+        return SynapticRows(
+            data, (self.__lengths * self.__data.itemsize) // data.itemsize)
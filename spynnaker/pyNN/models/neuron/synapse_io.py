@@ -25,7 +25,7 @@ from spynnaker.pyNN.utilities.constants import MAX_SUPPORTED_DELAY_TICS
 from spynnaker.pyNN.exceptions import SynapseRowTooBigException
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     AbstractStaticSynapseDynamics, AbstractSynapseDynamicsStructural,
-    AbstractSynapseDynamics)
+    AbstractSynapseDynamics, SynapticRows)
 
 _N_HEADER_WORDS = 3
 # There are 16 slots, one per time step
@@ -249,7 +249,6 @@ class SynapseIORowBased(object):
         :rtype: tuple(int, ~numpy.ndarray)
         """
         # pylint: disable=too-many-arguments, too-many-locals
-        row_ids = range(n_rows)
         ff_data, ff_size = None, None
         fp_data, pp_data, fp_size, pp_size = None, None, None, None
         if isinstance(synapse_dynamics, AbstractStaticSynapseDynamics):
@@ -260,15 +259,15 @@ class SynapseIORowBased(object):
                 n_synapse_types)
 
             # Blank the plastic data
-            fp_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
-            pp_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
-            fp_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
-            pp_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
+            fp_data = SynapseIORowBased._empty_rows(n_rows)
+            pp_data = SynapseIORowBased._empty_rows(n_rows)
+            fp_size = numpy.zeros(n_rows, dtype="uint32")
+            pp_size = numpy.zeros(n_rows, dtype="uint32")
         else:
 
             # Blank the static data
-            ff_data = [numpy.zeros(0, dtype="uint32") for _ in row_ids]
-            ff_size = [numpy.zeros(1, dtype="uint32") for _ in row_ids]
+            ff_data = SynapseIORowBased._empty_rows(n_rows)
+            ff_size = numpy.zeros(n_rows, dtype="uint32")
 
             # Get the plastic data
             fp_data, pp_data, fp_size, pp_size = \
@@ -276,26 +275,56 @@ class SynapseIORowBased(object):
                     connections, row_indices, n_rows, post_vertex_slice,
                     n_synapse_types)
 
-        # Add some padding
-        row_lengths = [
-            _N_HEADER_WORDS + pp_data[i].size + fp_data[i].size +
-            ff_data[i].size for i in row_ids]
-        max_length = max(row_lengths) - _N_HEADER_WORDS
+        # Work out the padded row length from the longest row
+        row_lengths = pp_data.lengths + ff_data.lengths + fp_data.lengths
+        max_length = int(numpy.max(row_lengths))
         max_row_length = population_table.get_allowed_row_length(max_length)
-        padding = [
-            numpy.zeros(
-                max_row_length - (row_length - _N_HEADER_WORDS),
-                dtype="uint32")
-            for row_length in row_lengths]
-
-        # Join the bits into rows
-        items_to_join = [
-            pp_size, pp_data, ff_size, fp_size, ff_data, fp_data, padding]
-        rows = [numpy.concatenate(items) for items in zip(*items_to_join)]
-        row_data = numpy.concatenate(rows)
+
+        # Write the bits into a single zeroed matrix, which provides the
+        # padding; each row is pp_size, pp_data, ff_size, fp_size, ff_data,
+        # fp_data
+        row_data = numpy.zeros(
+            (n_rows, _N_HEADER_WORDS + max_row_length), dtype="uint32")
+        row_ids = numpy.arange(n_rows)
+        pp_end = 1 + pp_data.lengths
+        row_data[:, 0] = numpy.reshape(pp_size, -1)
+        SynapseIORowBased._scatter_rows(row_data, pp_data, 1)
+        row_data[row_ids, pp_end] = numpy.reshape(ff_size, -1)
+        row_data[row_ids, pp_end + 1] = numpy.reshape(fp_size, -1)
+        ff_start = pp_end + 2
+        SynapseIORowBased._scatter_rows(row_data, ff_data, ff_start)
+        SynapseIORowBased._scatter_rows(
+            row_data, fp_data, ff_start + ff_data.lengths)
 
         # Return the data
-        return max_row_length, row_data
+        return max_row_length, row_data.reshape(-1)
+
+    @staticmethod
+    def _empty_rows(n_rows):
+        """
+        :param int n_rows:
+        :rtype: SynapticRows
+        """
+        return SynapticRows(
+            numpy.zeros(0, dtype="uint32"), numpy.zeros(n_rows, dtype="int64"))
+
+    @staticmethod
+    def _scatter_rows(row_data, rows, first_column):
+        """ Copy rows into a matrix, with each row starting at the given\
+            column of the matching row of the matrix
+
+        :param ~numpy.ndarray row_data: The 2D matrix to copy into
+        :param SynapticRows rows: The rows to copy
+        :param first_column: The column at which each row starts
+        :type first_column: int or ~numpy.ndarray
+        """
+        if not rows.data.size:
+            return
+        row_starts = (
+            numpy.arange(rows.n_rows) * row_data.shape[1] + first_column)
+        positions = numpy.arange(rows.data.size) + numpy.repeat(
+            row_starts - rows.offsets[:-1], rows.lengths)
+        row_data.reshape(-1)[positions] = rows.data
 
     def get_synapses(
             self, synapse_info, pre_slices, pre_slice_index,
@@ -481,43 +510,42 @@ class SynapseIORowBased(object):
         # Return the connections
         return connections
 
+    @staticmethod
+    def _as_rows(row_data):
+        """ Wrap a matrix of rows so that parts of each row can be selected.
+
+        :param ~numpy.ndarray row_data:
+        :rtype: SynapticRows
+        """
+        n_rows, row_length = row_data.shape
+        return SynapticRows(
+            row_data.reshape(-1), numpy.full(n_rows, row_length))
+
     @staticmethod
     def _parse_static_data(row_data, dynamics):
         """
         :param ~numpy.ndarray row_data:
         :param AbstractStaticSynapseDynamics dynamics:
-        :rtype: tuple(int, list(~numpy.ndarray))
+        :rtype: tuple(~numpy.ndarray, SynapticRows)
         """
-        n_rows = row_data.shape[0]
         ff_size = row_data[:, 1]
         ff_words = dynamics.get_n_static_words_per_row(ff_size)
-        ff_start = _N_HEADER_WORDS
-        ff_end = ff_start + ff_words
-        return (
-            ff_size,
-            [row_data[row, ff_start:ff_end[row]] for row in range(n_rows)])
+        rows = SynapseIORowBased._as_rows(row_data)
+        return ff_size, rows.select(ff_words, _N_HEADER_WORDS)
 
     def __convert_delayed_data(
             self, n_synapses, pre_vertex_slice, delayed_connections):
         """ Take the delayed_connections and convert the source ids and delay\
             values
         """
-        synapse_ids = range(len(n_synapses))
-        row_stage = numpy.array([
-            i // pre_vertex_slice.n_atoms
-            for i in synapse_ids], dtype="uint32")
-        row_min_delay = (row_stage + 1) * 16
-        connection_min_delay = numpy.concatenate([
-            numpy.repeat(row_min_delay[i], n_synapses[i])
-            for i in synapse_ids])
-        connection_source_extra = numpy.concatenate([
-            numpy.repeat(
-                row_stage[i] * numpy.uint32(pre_vertex_slice.n_atoms),
-                n_synapses[i])
-            for i in synapse_ids])
-        delayed_connections["source"] -= connection_source_extra
+        row_stage = (
+            numpy.arange(len(n_synapses), dtype="uint32") //
+            numpy.uint32(pre_vertex_slice.n_atoms))
+        connection_stage = numpy.repeat(row_stage, n_synapses)
+        delayed_connections["source"] -= (
+            connection_stage * numpy.uint32(pre_vertex_slice.n_atoms))
         delayed_connections["source"] += pre_vertex_slice.lo_atom
-        delayed_connections["delay"] += connection_min_delay
+        delayed_connections["delay"] += (connection_stage + 1) * 16
         return delayed_connections
 
     def _read_static_data(self, dynamics, pre_vertex_slice, post_vertex_slice,
@@ -561,7 +589,8 @@ class SynapseIORowBased(object):
         """
         :param ~numpy.ndarray row_data:
         :param AbstractPlasticSynapseDynamics dynamics:
-        :rtype: tuple(int, list(~numpy.ndarray))
+        :rtype: tuple(~numpy.ndarray, SynapticRows, ~numpy.ndarray,\
+            SynapticRows)
         """
         n_rows = row_data.shape[0]
         pp_size = row_data[:, 0]
@@ -569,13 +598,10 @@ class SynapseIORowBased(object):
         fp_size = row_data[numpy.arange(n_rows), pp_words + 2]
         fp_words = dynamics.get_n_fixed_plastic_words_per_row(fp_size)
         fp_start = pp_size + _N_HEADER_WORDS
-        fp_end = fp_start + fp_words
-        row_ids = range(n_rows)
+        rows = SynapseIORowBased._as_rows(row_data)
         return (
-            pp_size,
-            [row_data[row, 1:pp_words[row] + 1] for row in row_ids],
-            fp_size,
-            [row_data[row, fp_start[row]:fp_end[row]] for row in row_ids])
+            pp_size, rows.select(pp_words, 1),
+            fp_size, rows.select(fp_words, fp_start))
 
     def _read_plastic_data(
             self, dynamics, pre_vertex_slice, post_vertex_slice,
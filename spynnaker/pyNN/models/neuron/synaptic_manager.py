@@ -16,6 +16,7 @@ from spinn_front_end_common.utilities.constants import \
     MICRO_TO_SECOND_CONVERSION
 
 from collections import defaultdict
+import hashlib
 import math
 import struct
 import numpy
@@ -66,26 +67,79 @@ _SYNAPSE_SDRAM_OVERSCALE = 1.1
 _ONE_WORD = struct.Struct("<I")
 
 
+def _update_digest(digest, value):
+    """ Add a value to a digest, by content where it is a known container
+
+    :param digest: The hashlib digest to update
+    :param value: The value to add
+    """
+    if isinstance(value, numpy.ndarray):
+        digest.update(str((value.dtype, value.shape)).encode("ascii"))
+        digest.update(numpy.ascontiguousarray(value).tobytes())
+    elif isinstance(value, RandomDistribution):
+        digest.update(repr((
+            value.name, sorted(value.parameters.items()))).encode())
+    elif isinstance(value, (list, tuple)):
+        digest.update(repr((type(value).__name__, len(value))).encode())
+        for item in value:
+            _update_digest(digest, item)
+    elif isinstance(value, dict):
+        digest.update(repr(("dict", len(value))).encode())
+        for key in sorted(value, key=repr):
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+    else:
+        # Other objects (such as random number generators) are the same if\
+        # they are the same object
+        digest.update(repr(value).encode())
+
+
+def _synaptic_block_digest(
+        synapse_info, n_delay_stages, n_synapse_types, weight_scales,
+        machine_time_step):
+    """ Compute a digest of the values that the synaptic rows of a block are\
+        generated from, other than the vertex slices
+
+    :rtype: str
+    """
+    digest = hashlib.sha1()
+    _update_digest(digest, type(synapse_info.connector).__name__)
+    for name, value in synapse_info.connector.get_identifying_parameters():
+        _update_digest(digest, name)
+        _update_digest(digest, value)
+    for value in (
+            type(synapse_info.synapse_dynamics).__name__,
+            synapse_info.synapse_type, n_delay_stages, n_synapse_types,
+            weight_scales[synapse_info.synapse_type], machine_time_step,
+            synapse_info.weights, synapse_info.delays):
+        _update_digest(digest, value)
+    return digest.hexdigest()
+
+
 class SynapticManager(object):
     """ Deals with synapses
     """
     # pylint: disable=too-many-arguments, too-many-locals
     __slots__ = [
+        "__cache_synaptic_matrices",
         "__delay_key_index",
         "__n_synapse_types",
         "__one_to_one_connection_dtcm_max_bytes",
         "__poptable_type",
         "__pre_run_connection_holders",
+        "__region_addresses",
         "__retrieved_blocks",
         "__ring_buffer_sigma",
         "__spikes_per_second",
         "__synapse_dynamics",
         "__synapse_io",
+        "__synaptic_matrix_cache",
         "__weight_scales",
         "__ring_buffer_shifts",
         "__gen_on_machine",
         "__max_row_info",
-        "__synapse_indices"]
+        "__synapse_indices",
+        "__synapse_info_stats"]
 
     def __init__(self, n_synapse_types, ring_buffer_sigma, spikes_per_second,
                  config, population_table_type=None, synapse_io=None):
@@ -120,6 +174,7 @@ class SynapticManager(object):
         self.__ring_buffer_shifts = None
         self.__delay_key_index = dict()
         self.__retrieved_blocks = dict()
+        self.__region_addresses = dict()
 
         # A list of connection holders to be filled in pre-run, indexed by
         # the edge the connection is for
@@ -139,6 +194,19 @@ class SynapticManager(object):
         # A map of synapse information for each machine pre vertex to index
         self.__synapse_indices = dict()
 
+        # Whether to reuse synaptic matrices generated by a previous run when
+        # nothing they are generated from has changed
+        self.__cache_synaptic_matrices = config.getboolean(
+            "Simulation", "cache_synaptic_matrices")
+
+        # A map of post-vertex slice to a map of synapse information and
+        # pre-vertex slice to the digest of the inputs and the generated rows
+        self.__synaptic_matrix_cache = dict()
+
+        # A map of synapse information to the inputs to and statistics of the
+        # projection used to compute the ring buffer shifts
+        self.__synapse_info_stats = dict()
+
     @property
     def synapse_dynamics(self):
         return self.__synapse_dynamics
@@ -444,62 +512,34 @@ class SynapticManager(object):
         biggest_weight = numpy.zeros(n_synapse_types)
         weights_signed = False
         rate_stats = [RunningStats() for _ in range(n_synapse_types)]
-        steps_per_second = MICRO_TO_SECOND_CONVERSION / machine_timestep
 
         for app_edge in application_graph.get_edges_ending_at_vertex(
                 application_vertex):
             if isinstance(app_edge, ProjectionApplicationEdge):
                 for synapse_info in app_edge.synapse_information:
-                    synapse_type = synapse_info.synapse_type
-                    synapse_dynamics = synapse_info.synapse_dynamics
-                    connector = synapse_info.connector
+                    (synapse_type, weight_mean, weight_variance,
+                     delay_variance, weight_max, n_connections,
+                     spikes_per_second, spikes_per_tick, signed) = \
+                        self.__get_synapse_info_stats(
+                            app_edge, synapse_info, machine_timestep)
 
-                    weight_mean = (
-                        synapse_dynamics.get_weight_mean(
-                            connector, synapse_info) * weight_scale)
-                    n_connections = \
-                        connector.get_n_connections_to_post_vertex_maximum(
-                            synapse_info)
-                    weight_variance = synapse_dynamics.get_weight_variance(
-                        connector, synapse_info.weights) * weight_scale_squared
                     running_totals[synapse_type].add_items(
-                        weight_mean, weight_variance, n_connections)
-
-                    delay_variance = synapse_dynamics.get_delay_variance(
-                        connector, synapse_info.delays)
+                        weight_mean * weight_scale,
+                        weight_variance * weight_scale_squared,
+                        n_connections)
                     delay_running_totals[synapse_type].add_items(
                         0.0, delay_variance, n_connections)
 
-                    weight_max = (synapse_dynamics.get_weight_maximum(
-                        connector, synapse_info) * weight_scale)
+                    weight_max = weight_max * weight_scale
                     biggest_weight[synapse_type] = max(
                         biggest_weight[synapse_type], weight_max)
 
-                    spikes_per_tick = max(
-                        1.0, self.__spikes_per_second / steps_per_second)
-                    spikes_per_second = self.__spikes_per_second
-                    if isinstance(app_edge.pre_vertex,
-                                  SpikeSourcePoissonVertex):
-                        rate = app_edge.pre_vertex.max_rate
-                        # If non-zero rate then use it; otherwise keep default
-                        if rate != 0:
-                            spikes_per_second = rate
-                        if hasattr(spikes_per_second, "__getitem__"):
-                            spikes_per_second = numpy.max(spikes_per_second)
-                        elif isinstance(spikes_per_second, RandomDistribution):
-                            spikes_per_second = get_maximum_probable_value(
-                                spikes_per_second, app_edge.pre_vertex.n_atoms)
-                        prob = 1.0 - (
-                            (1.0 / 100.0) / app_edge.pre_vertex.n_atoms)
-                        spikes_per_tick = spikes_per_second / steps_per_second
-                        spikes_per_tick = scipy.stats.poisson.ppf(
-                            prob, spikes_per_tick)
                     rate_stats[synapse_type].add_items(
                         spikes_per_second, 0, n_connections)
                     total_weights[synapse_type] += spikes_per_tick * (
                         weight_max * n_connections)
 
-                    if synapse_dynamics.are_weights_signed():
+                    if signed:
                         weights_signed = True
 
         max_weights = numpy.zeros(n_synapse_types)
@@ -537,6 +577,65 @@ class SynapticManager(object):
 
         return list(max_weight_powers)
 
+    def __get_synapse_info_stats(
+            self, app_edge, synapse_info, machine_timestep):
+        """ Get the statistics of a projection needed to work out the ring\
+            buffer shifts, before weight scaling.  These are kept until the\
+            rate of the source or the time step changes, so that only new\
+            projections are examined when the shifts are recomputed.
+
+        :return: The synapse type, weight mean, weight variance, delay\
+            variance, maximum weight, number of connections, spikes per\
+            second, spikes per tick and whether the weights are signed
+        :rtype: tuple
+        """
+        pre_vertex = app_edge.pre_vertex
+        rate = None
+        if isinstance(pre_vertex, SpikeSourcePoissonVertex):
+            rate = pre_vertex.max_rate
+        key = None
+        if not (hasattr(rate, "__getitem__") or
+                isinstance(rate, RandomDistribution)):
+            key = (rate, self.__spikes_per_second, machine_timestep)
+            cached = self.__synapse_info_stats.get(synapse_info)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
+        synapse_dynamics = synapse_info.synapse_dynamics
+        connector = synapse_info.connector
+        steps_per_second = MICRO_TO_SECOND_CONVERSION / machine_timestep
+
+        spikes_per_tick = max(
+            1.0, self.__spikes_per_second / steps_per_second)
+        spikes_per_second = self.__spikes_per_second
+        if rate is not None:
+            # If non-zero rate then use it; otherwise keep default
+            if rate != 0:
+                spikes_per_second = rate
+            if hasattr(spikes_per_second, "__getitem__"):
+                spikes_per_second = numpy.max(spikes_per_second)
+            elif isinstance(spikes_per_second, RandomDistribution):
+                spikes_per_second = get_maximum_probable_value(
+                    spikes_per_second, pre_vertex.n_atoms)
+            prob = 1.0 - ((1.0 / 100.0) / pre_vertex.n_atoms)
+            spikes_per_tick = spikes_per_second / steps_per_second
+            spikes_per_tick = scipy.stats.poisson.ppf(prob, spikes_per_tick)
+
+        stats = (
+            synapse_info.synapse_type,
+            synapse_dynamics.get_weight_mean(connector, synapse_info),
+            synapse_dynamics.get_weight_variance(
+                connector, synapse_info.weights),
+            synapse_dynamics.get_delay_variance(
+                connector, synapse_info.delays),
+            synapse_dynamics.get_weight_maximum(connector, synapse_info),
+            connector.get_n_connections_to_post_vertex_maximum(synapse_info),
+            spikes_per_second, spikes_per_tick,
+            synapse_dynamics.are_weights_signed())
+        if key is not None:
+            self.__synapse_info_stats[synapse_info] = (key, stats)
+        return stats
+
     @staticmethod
     def _get_weight_scale(ring_buffer_to_input_left_shift):
         """ Return the amount to scale the weights by to convert them from \
@@ -607,6 +706,11 @@ class SynapticManager(object):
         # Store a list of synapse info to be generated on the machine
         generate_on_machine = list()
 
+        # Blocks generated for this slice last time, and those generated now
+        post_key = (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        cached_blocks = (
+            self.__synaptic_matrix_cache.pop(post_key, dict()), dict())
+
         # For each machine edge in the vertex, create a synaptic list
         for machine_edge in in_edges:
             app_edge = graph_mapper.get_application_edge(machine_edge)
@@ -652,7 +756,8 @@ class SynapticManager(object):
                             self.__n_synapse_types, single_synapses,
                             weight_scales, machine_time_step, rinfo,
                             all_syn_block_sz, block_addr, single_addr,
-                            machine_edge=machine_edge)
+                            machine_edge=machine_edge,
+                            cached_blocks=cached_blocks)
                         key = (synapse_info, pre_vertex_slice.lo_atom,
                                post_vertex_slice.lo_atom)
                         self.__synapse_indices[key] = index
@@ -672,6 +777,9 @@ class SynapticManager(object):
                    post_vertex_slice.lo_atom)
             self.__synapse_indices[key] = index
 
+        if self.__cache_synaptic_matrices:
+            self.__synaptic_matrix_cache[post_key] = cached_blocks[1]
+
         self.__poptable_type.finish_master_pop_table(
             spec, master_pop_table_region)
 
@@ -801,14 +909,13 @@ class SynapticManager(object):
             pre_slice_index, post_slices, post_slice_index, pre_vertex_slice,
             post_vertex_slice, app_edge, n_synapse_types, single_synapses,
             weight_scales, machine_time_step, rinfo, all_syn_block_sz,
-            block_addr, single_addr, machine_edge):
+            block_addr, single_addr, machine_edge, cached_blocks):
         (row_data, row_length, delayed_row_data, delayed_row_length,
-         delayed_source_ids, delay_stages) = self.__synapse_io.get_synapses(
+         delayed_source_ids, delay_stages) = self.__get_synapses(
              synapse_info, pre_slices, pre_slice_index, post_slices,
-             post_slice_index, pre_vertex_slice, post_vertex_slice,
-             app_edge.n_delay_stages, self.__poptable_type, n_synapse_types,
-             weight_scales, machine_time_step,
-             app_edge=app_edge, machine_edge=machine_edge)
+             post_slice_index, pre_vertex_slice, post_vertex_slice, app_edge,
+             n_synapse_types, weight_scales, machine_time_step, machine_edge,
+             cached_blocks)
 
         if app_edge.delay_edge is not None:
             app_edge.delay_edge.pre_vertex.add_delays(
@@ -872,6 +979,51 @@ class SynapticManager(object):
                     d_index, index))
         return block_addr, single_addr, index
 
+    def __get_synapses(
+            self, synapse_info, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice, app_edge,
+            n_synapse_types, weight_scales, machine_time_step, machine_edge,
+            cached_blocks):
+        """ Get the synaptic rows of a block, reusing those generated by the\
+            previous run if nothing they are generated from has changed
+
+        :param cached_blocks: The blocks generated for the post-vertex slice\
+            by the previous run, and the map to add the blocks of this run to
+        :type cached_blocks: tuple(dict, dict)
+        """
+        # Structural connections are created as the rows are generated, so
+        # they cannot be reused
+        if (not self.__cache_synaptic_matrices or isinstance(
+                synapse_info.synapse_dynamics,
+                AbstractSynapseDynamicsStructural)):
+            return self.__synapse_io.get_synapses(
+                synapse_info, pre_slices, pre_slice_index, post_slices,
+                post_slice_index, pre_vertex_slice, post_vertex_slice,
+                app_edge.n_delay_stages, self.__poptable_type,
+                n_synapse_types, weight_scales, machine_time_step,
+                app_edge=app_edge, machine_edge=machine_edge)
+
+        previous_blocks, blocks = cached_blocks
+        block_key = (
+            synapse_info, pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom)
+        digest = _synaptic_block_digest(
+            synapse_info, app_edge.n_delay_stages, n_synapse_types,
+            weight_scales, machine_time_step)
+        if block_key in previous_blocks:
+            previous_digest, synapses = previous_blocks[block_key]
+            if previous_digest == digest:
+                blocks[block_key] = (digest, synapses)
+                return synapses
+
+        synapses = self.__synapse_io.get_synapses(
+            synapse_info, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice,
+            app_edge.n_delay_stages, self.__poptable_type, n_synapse_types,
+            weight_scales, machine_time_step,
+            app_edge=app_edge, machine_edge=machine_edge)
+        blocks[block_key] = (digest, synapses)
+        return synapses
+
     def __is_direct(
             self, single_addr, connector, pre_vertex_slice, post_vertex_slice,
             app_edge, synapse_info):
@@ -939,6 +1091,14 @@ class SynapticManager(object):
         post_slices = graph_mapper.get_slices(application_vertex)
         post_slice_idx = graph_mapper.get_machine_vertex_index(machine_vertex)
 
+        # Forget blocks of slices that no longer exist after re-partitioning
+        post_keys = set(
+            (post_slice.lo_atom, post_slice.hi_atom)
+            for post_slice in post_slices)
+        for post_key in list(self.__synaptic_matrix_cache):
+            if post_key not in post_keys:
+                del self.__synaptic_matrix_cache[post_key]
+
         # Reserve the memory
         in_edges = application_graph.get_edges_ending_at_vertex(
             application_vertex)
@@ -984,6 +1144,8 @@ class SynapticManager(object):
 
     def clear_connection_cache(self):
         self.__retrieved_blocks = dict()
+        self.__region_addresses = dict()
+        self.__poptable_type.clear_cache()
 
     def get_connections_from_machine(
             self, transceiver, placement, machine_edge, graph_mapper,
@@ -1019,7 +1181,8 @@ class SynapticManager(object):
             transceiver, placement, master_pop_table, indirect_synapses,
             direct_synapses, key, pre_vertex_slice.n_atoms, index,
             using_extra_monitor_cores, placements, monitor_api,
-            extra_monitor, monitor_cores, fixed_routes=fixed_routes)
+            extra_monitor, monitor_cores, handle_time_out_configuration,
+            fixed_routes=fixed_routes)
 
         # Get the block for the connections from the delayed pre_vertex
         delayed_data = None
@@ -1044,6 +1207,8 @@ class SynapticManager(object):
         """ Helper for computing the addresses of the master pop table and\
             synaptic-matrix-related bits.
         """
+        if placement in self.__region_addresses:
+            return self.__region_addresses[placement]
         master_pop_table = locate_memory_region_for_placement(
             placement, POPULATION_BASED_REGIONS.POPULATION_TABLE.value,
             transceiver)
@@ -1053,7 +1218,9 @@ class SynapticManager(object):
         direct_synapses = locate_memory_region_for_placement(
             placement, POPULATION_BASED_REGIONS.DIRECT_MATRIX.value,
             transceiver) + BYTES_PER_WORD
-        return master_pop_table, direct_synapses, synaptic_matrix
+        addresses = (master_pop_table, direct_synapses, synaptic_matrix)
+        self.__region_addresses[placement] = addresses
+        return addresses
 
     def _extract_synaptic_matrix_data_location(
             self, key, master_pop_table_address, transceiver, placement):
@@ -13,9 +13,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 import math
 import numpy
+from six import itervalues
 from pyNN.random import RandomDistribution
 from spinn_front_end_common.utilities.constants import \
     MICRO_TO_MILLISECOND_CONVERSION
@@ -344,7 +347,10 @@ class PyNNProjectionCommon(object):
         progress = ProgressBar(
             edges, "Getting {}s for projection between {} and {}".format(
                 data_to_get, pre_vertex.label, post_vertex.label))
-        for edge in progress.over(edges):
+
+        # Work out where each edge is to be read from
+        reads = list()
+        for edge in edges:
             placement = ctl.placements.get_placement_of_vertex(
                 edge.post_vertex)
 
@@ -359,18 +365,99 @@ class PyNNProjectionCommon(object):
             else:
                 receiver = None
                 sender_extra_monitor_core = None
-
-            connections = post_vertex.get_connections_from_machine(
-                ctl.transceiver, placement, edge, ctl.graph_mapper,
-                ctl.routing_infos, self.__synapse_information,
-                ctl.machine_time_step, extra_monitors is not None,
-                ctl.placements, receiver, extra_monitors,
-                handle_time_out_configuration,
-                ctl.fixed_routes, sender_extra_monitor_core)
+            reads.append(
+                (edge, placement, receiver, sender_extra_monitor_core))
+
+        n_threads = helpful_functions.read_config_int(
+            ctl.config, "Simulation", "n_projection_extraction_threads")
+        if n_threads is not None and n_threads > 1 and len(reads) > 1:
+            all_connections = self.__read_connections_in_parallel(
+                reads, post_vertex, extra_monitors,
+                handle_time_out_configuration, n_threads, progress)
+        else:
+            all_connections = (
+                self.__read_connections(
+                    read, post_vertex, extra_monitors,
+                    handle_time_out_configuration)
+                for read in progress.over(reads))
+        for connections in all_connections:
             if connections is not None:
                 connection_holder.add_connections(connections)
         connection_holder.finish()
 
+    def __read_connections(
+            self, read, post_vertex, extra_monitors,
+            handle_time_out_configuration):
+        """ Read the connections of a single machine edge.
+        """
+        ctl = self.__spinnaker_control
+        edge, placement, receiver, sender_extra_monitor_core = read
+        return post_vertex.get_connections_from_machine(
+            ctl.transceiver, placement, edge, ctl.graph_mapper,
+            ctl.routing_infos, self.__synapse_information,
+            ctl.machine_time_step, extra_monitors is not None,
+            ctl.placements, receiver, extra_monitors,
+            handle_time_out_configuration,
+            ctl.fixed_routes, sender_extra_monitor_core)
+
+    def __read_connections_in_parallel(
+            self, reads, post_vertex, extra_monitors,
+            handle_time_out_configuration, n_threads, progress):
+        """ Read the connections of several machine edges using a pool of\
+            threads, one board at a time in each thread, returning the\
+            connections in the order of the edges.
+        """
+        # pylint: disable=too-many-arguments
+        ctl = self.__spinnaker_control
+
+        # Batch the reads for each board, as the reads of a board all go
+        # through the same connection to its Ethernet chip (and the same
+        # receiver when using the extra monitors), which can only be used by
+        # one thread at a time
+        batches = OrderedDict()
+        for index, read in enumerate(reads):
+            placement = read[1]
+            chip = ctl.machine.get_chip_at(placement.x, placement.y)
+            batch_key = (chip.nearest_ethernet_x, chip.nearest_ethernet_y)
+            batches.setdefault(batch_key, list()).append((index, read))
+
+        def read_batch(batch):
+            return [
+                (index, self.__read_connections(
+                    read, post_vertex, extra_monitors, False))
+                for index, read in batch]
+
+        # Configure the extra monitors once for all the reads, rather than
+        # once per block
+        configure_monitors = (
+            extra_monitors is not None and handle_time_out_configuration)
+        receiver = reads[0][2]
+        if configure_monitors:
+            receiver.load_system_routing_tables(
+                ctl.transceiver, extra_monitors, ctl.placements)
+            receiver.set_cores_for_data_streaming(
+                ctl.transceiver, extra_monitors, ctl.placements)
+
+        all_connections = [None] * len(reads)
+        try:
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                futures = [
+                    executor.submit(read_batch, batch)
+                    for batch in itervalues(batches)]
+                for future in as_completed(futures):
+                    batch_connections = future.result()
+                    for index, connections in batch_connections:
+                        all_connections[index] = connections
+                    progress.update(len(batch_connections))
+        finally:
+            if configure_monitors:
+                receiver.unset_cores_for_data_streaming(
+                    ctl.transceiver, extra_monitors, ctl.placements)
+                receiver.load_application_routing_tables(
+                    ctl.transceiver, extra_monitors, ctl.placements)
+        progress.end()
+        return all_connections
+
     def _clear_cache(self):
         post_vertex = self.__projection_edge.post_vertex
         if isinstance(post_vertex, AbstractAcceptsIncomingSynapses):
@@ -14,6 +14,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import logging
+import os
 import numpy
 from six.moves import xrange
 from spinn_utilities import logger_utils
@@ -22,7 +23,7 @@ from spinn_utilities.timer import Timer
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.globals_variables import get_simulator
 from spynnaker.pyNN.models.common import (
-    AbstractSpikeRecordable, AbstractNeuronRecordable)
+    AbstractSpikeRecordable, AbstractNeuronRecordable, recording_export)
 # pylint: disable=protected-access
 
 logger = FormatAdapter(logging.getLogger(__name__))
@@ -208,6 +209,96 @@ class RecordingCommon(object):
             sim.placements, sim.graph_mapper, sim.buffer_manager,
             sim.machine_time_step)
 
+    def _iter_spikes(self, order=None):
+        """ How to get spikes from a vertex a chunk at a time, without\
+            holding all of them in memory.
+
+        :param order: None, "id" or "time"; see\
+            :py:meth:`AbstractSpikeRecordable.iter_spikes`
+        :return: chunks of the ids and times of the spikes from a vertex
+        """
+
+        # check we're in a state where we can get spikes
+        if not isinstance(self.__population._vertex, AbstractSpikeRecordable):
+            raise ConfigurationException(
+                "This population has not got the capability to record spikes")
+        if not self.__population._vertex.is_recording_spikes():
+            raise ConfigurationException(
+                "This population has not been set to record spikes")
+
+        sim = get_simulator()
+        if not sim.has_ran:
+            logger.warning(
+                "The simulation has not yet run, therefore spikes cannot "
+                "be retrieved, hence there will be no chunks")
+            return iter(())
+
+        if sim.use_virtual_board:
+            logger.warning(
+                "The simulation is using a virtual machine and so has not "
+                "truly ran, hence there will be no chunks")
+            return iter(())
+
+        return self.__population._vertex.iter_spikes(
+            sim.placements, sim.graph_mapper, sim.buffer_manager,
+            sim.machine_time_step, order)
+
+    def _export_recorded(self, directory, variables):
+        """ Write recorded variables and spikes to a directory of ``.npy``\
+            files with a JSON index, writing each as it is read from the\
+            machine; the result can be read back lazily with\
+            :py:func:`~spynnaker.pyNN.models.common.recording_export.load_recording`
+
+        :param str directory: the directory to write to, which is created if\
+            it doesn't exist
+        :param list(str) variables: the variables to write, which may\
+            include 'spikes'
+        :rtype: None
+        """
+        timer = Timer()
+        timer.start_timing()
+        sim = get_simulator()
+        sim.verify_not_running()
+        vertex = self.__population._vertex
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        entries = dict()
+        for variable in variables:
+            if variable == "spikes":
+                entries[variable] = recording_export.export_spikes(
+                    self._iter_spikes(), directory, variable,
+                    vertex.get_spikes_sampling_interval())
+                continue
+
+            # check that we're in a state to get the variable
+            if not isinstance(vertex, AbstractNeuronRecordable):
+                raise ConfigurationException(
+                    "This population has not got the capability to record {}"
+                    .format(variable))
+            if not vertex.is_recording(variable):
+                raise ConfigurationException(
+                    "This population has not been set to record {}"
+                    .format(variable))
+            if not sim.has_ran or sim.use_virtual_board:
+                logger.warning(
+                    "The simulation has not truly run, therefore {} cannot"
+                    " be retrieved, hence it will be empty".format(variable))
+                entries[variable] = recording_export.matrix_entry(
+                    variable, [], vertex.get_neuron_sampling_interval(
+                        variable))
+                recording_export.open_matrix(directory, variable, (0, 0))
+                continue
+            entries[variable] = vertex.export_data(
+                variable, sim.no_machine_time_steps, sim.placements,
+                sim.graph_mapper, sim.buffer_manager, sim.machine_time_step,
+                directory)
+
+        recording_export.write_index(
+            directory, self.__population.label, entries)
+        get_simulator().add_extraction_timing(
+            timer.take_sample())
+
     def _turn_off_all_recording(self, indexes=None):
         """ Turns off recording, is used by a pop saying `.record()`
 
@@ -17,6 +17,7 @@ from .spike_source_array import SpikeSourceArray
 from .spike_source_from_file import SpikeSourceFromFile
 from .spike_source_poisson import SpikeSourcePoisson
 from .spike_source_poisson_variable import SpikeSourcePoissonVariable
+from .spike_trains import SpikeTrains
 
 __all__ = ["SpikeSourceArray", "SpikeSourceFromFile", "SpikeSourcePoisson",
-           "SpikeSourcePoissonVariable"]
+           "SpikeSourcePoissonVariable", "SpikeTrains"]
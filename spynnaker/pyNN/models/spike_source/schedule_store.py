@@ -0,0 +1,275 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+
+
+class ScheduleStore(object):
+    """ A variable-length array of values (such as a schedule of rates) for\
+        each of a number of neurons.  The values are stored as a single\
+        array shared by all the neurons while they all have the same\
+        values, and otherwise as a flat array of the values of all the\
+        neurons plus an array of the offset of each neuron in it (in the\
+        style of the row pointers of a CSR sparse matrix).
+    """
+
+    __slots__ = [
+        # The number of neurons
+        "__n_neurons",
+        # The type of the values
+        "__dtype",
+        # The values of every neuron, or None if the neurons differ
+        "__shared",
+        # The values of all the neurons, one after the other
+        "__data",
+        # The index of the start of each neuron in the data, plus the end
+        "__offsets"]
+
+    def __init__(self, n_neurons, values, dtype="float64"):
+        """
+        :param int n_neurons: The number of neurons
+        :param values:
+            The values of all the neurons, or a list of the values of each
+            neuron
+        :type values: ~numpy.ndarray or list(~numpy.ndarray)
+        :param dtype: The type of the values
+        """
+        self.__n_neurons = n_neurons
+        self.__dtype = numpy.dtype(dtype)
+        self.__shared = None
+        self.__data = None
+        self.__offsets = None
+        self.set_value(values)
+
+    @staticmethod
+    def is_per_neuron(values):
+        """ Determine if values are a list of values per neuron rather than\
+            values shared by all neurons
+
+        :rtype: bool
+        """
+        return len(values) > 0 and hasattr(values[0], "__len__")
+
+    def __as_values(self, values):
+        # Values of None (e.g. no duration) are stored as NaN
+        return numpy.array(values, dtype="float64").astype(self.__dtype)
+
+    def set_value(self, values):
+        """ Set the values of all the neurons
+
+        :param values:
+            The values of all the neurons, or a list of the values of each
+            neuron
+        :type values: ~numpy.ndarray or list(~numpy.ndarray)
+        """
+        if not self.is_per_neuron(values):
+            self.__shared = self.__as_values(values)
+            self.__data = None
+            self.__offsets = None
+            return
+        if len(values) != self.__n_neurons:
+            raise Exception("There must be one set of values per neuron")
+        lengths = numpy.array([len(v) for v in values], dtype="int64")
+        self.__set_flat(lengths, numpy.concatenate(
+            [numpy.asarray(v, dtype="float64") for v in values]).astype(
+                self.__dtype))
+
+    def set_flat(self, lengths, data):
+        """ Set the values of all the neurons from a flat array of values
+
+        :param ~numpy.ndarray lengths: The number of values of each neuron
+        :param ~numpy.ndarray data: The values, one neuron after the other
+        """
+        self.__set_flat(
+            numpy.asarray(lengths, dtype="int64"),
+            numpy.asarray(data, dtype=self.__dtype))
+
+    def __set_flat(self, lengths, data):
+        self.__shared = None
+        self.__data = data
+        self.__offsets = numpy.zeros(self.__n_neurons + 1, dtype="int64")
+        numpy.cumsum(lengths, out=self.__offsets[1:])
+
+    def __unshare(self):
+        if self.__shared is not None:
+            self.__set_flat(
+                numpy.full(self.__n_neurons, len(self.__shared)),
+                numpy.tile(self.__shared, self.__n_neurons))
+
+    def set_neurons(self, lo_atom, lengths, data):
+        """ Set the values of a range of neurons
+
+        :param int lo_atom: The first neuron to set
+        :param ~numpy.ndarray lengths:
+            The number of values of each neuron in the range
+        :param ~numpy.ndarray data:
+            The values of the neurons in the range, one after the other
+        """
+        lengths = numpy.asarray(lengths, dtype="int64")
+        data = numpy.asarray(data, dtype=self.__dtype)
+        hi_atom = lo_atom + len(lengths)
+
+        # Setting every neuron to the shared values changes nothing
+        if (self.__shared is not None and
+                numpy.all(lengths == len(self.__shared)) and
+                numpy.array_equal(
+                    data, numpy.tile(self.__shared, len(lengths)))):
+            return
+
+        self.__unshare()
+        start = self.__offsets[lo_atom]
+        end = self.__offsets[hi_atom]
+        if numpy.array_equal(
+                lengths, numpy.diff(self.__offsets[lo_atom:hi_atom + 1])):
+            self.__data[start:end] = data
+            return
+        all_lengths = numpy.diff(self.__offsets)
+        all_lengths[lo_atom:hi_atom] = lengths
+        self.__set_flat(all_lengths, numpy.concatenate((
+            self.__data[:start], data, self.__data[end:])))
+
+    def zeros_like(self, dtype=None):
+        """ Make a store with the same number of values for each neuron,\
+            all zero
+
+        :param dtype: The type of the values, or None for the same type
+        :rtype: ScheduleStore
+        """
+        if dtype is None:
+            dtype = self.__dtype
+        if self.__shared is not None:
+            return ScheduleStore(
+                self.__n_neurons, numpy.zeros(len(self.__shared)), dtype)
+        store = ScheduleStore(self.__n_neurons, [], dtype)
+        store.set_flat(numpy.diff(self.__offsets), numpy.zeros(
+            len(self.__data), dtype=dtype))
+        return store
+
+    def lengths(self, lo_atom=0, hi_atom=None):
+        """ Get the number of values of each of a range of neurons
+
+        :param int lo_atom: The first neuron
+        :param hi_atom: The last neuron, or None for the last of all
+        :type hi_atom: int or None
+        :rtype: ~numpy.ndarray
+        """
+        if hi_atom is None:
+            hi_atom = self.__n_neurons - 1
+        if self.__shared is not None:
+            return numpy.full(
+                hi_atom + 1 - lo_atom, len(self.__shared), dtype="int64")
+        return numpy.diff(self.__offsets[lo_atom:hi_atom + 2])
+
+    def n_values(self, lo_atom=0, hi_atom=None):
+        """ Get the total number of values of a range of neurons
+
+        :param int lo_atom: The first neuron
+        :param hi_atom: The last neuron, or None for the last of all
+        :type hi_atom: int or None
+        :rtype: int
+        """
+        if hi_atom is None:
+            hi_atom = self.__n_neurons - 1
+        if self.__shared is not None:
+            return (hi_atom + 1 - lo_atom) * len(self.__shared)
+        return int(self.__offsets[hi_atom + 1] - self.__offsets[lo_atom])
+
+    @staticmethod
+    def __read_only(values):
+        # Views of the stored values must not be used to change them
+        values = values.view()
+        values.flags.writeable = False
+        return values
+
+    def flat(self, lo_atom=0, hi_atom=None):
+        """ Get the values of a range of neurons, one after the other
+
+        :param int lo_atom: The first neuron
+        :param hi_atom: The last neuron, or None for the last of all
+        :type hi_atom: int or None
+        :return: A read-only array of the values
+        :rtype: ~numpy.ndarray
+        """
+        if hi_atom is None:
+            hi_atom = self.__n_neurons - 1
+        if self.__shared is not None:
+            return self.__read_only(
+                numpy.tile(self.__shared, hi_atom + 1 - lo_atom))
+        return self.__read_only(self.__data[
+            self.__offsets[lo_atom]:self.__offsets[hi_atom + 1]])
+
+    def max(self):
+        """ Get the largest value of any neuron, or 0 if there are none
+
+        :rtype: float
+        """
+        values = self.__shared if self.__shared is not None else self.__data
+        if len(values) == 0:
+            return 0
+        return numpy.amax(values)
+
+    def max_per_neuron(self):
+        """ Get the largest value of each neuron, or 0 for a neuron with no\
+            values
+
+        :rtype: ~numpy.ndarray
+        """
+        if self.__shared is not None:
+            return numpy.full(self.__n_neurons, self.max())
+        maxima = numpy.zeros(self.__n_neurons, dtype=self.__dtype)
+        # reduceat gives the value at the offset for an empty neuron, so only
+        # the neurons with values are reduced
+        has_values = numpy.diff(self.__offsets) > 0
+        if numpy.any(has_values):
+            maxima[has_values] = numpy.maximum.reduceat(
+                self.__data, self.__offsets[:-1][has_values])
+        return maxima
+
+    @property
+    def is_shared(self):
+        """ Whether all the neurons share the same values
+
+        :rtype: bool
+        """
+        return self.__shared is not None
+
+    @property
+    def nbytes(self):
+        """ The number of bytes used to store the values
+
+        :rtype: int
+        """
+        if self.__shared is not None:
+            return self.__shared.nbytes
+        return self.__data.nbytes + self.__offsets.nbytes
+
+    def __len__(self):
+        return self.__n_neurons
+
+    def __getitem__(self, neuron):
+        if isinstance(neuron, slice):
+            return [self[i] for i in range(*neuron.indices(len(self)))]
+        if neuron < 0:
+            neuron += self.__n_neurons
+        if not 0 <= neuron < self.__n_neurons:
+            raise IndexError("Neuron {} is out of range".format(neuron))
+        if self.__shared is not None:
+            return self.__read_only(self.__shared)
+        return self.__read_only(
+            self.__data[self.__offsets[neuron]:self.__offsets[neuron + 1]])
+
+    def __iter__(self):
+        for i in range(self.__n_neurons):
+            yield self[i]
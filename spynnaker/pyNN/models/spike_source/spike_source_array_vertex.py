@@ -24,6 +24,7 @@ from spinn_front_end_common.utilities import globals_variables
 from spynnaker.pyNN.models.common import (
     AbstractSpikeRecordable, EIEIOSpikeRecorder, SimplePopulationSettable)
 from spynnaker.pyNN.utilities import constants
+from .spike_trains import SpikeTrains
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +35,11 @@ def _as_numpy_ticks(times, time_step):
 
 
 def _send_buffer_times(spike_times, time_step):
-    # Convert to ticks
+    # Convert to ticks, keeping the times of each neuron in one flat array
+    if isinstance(spike_times, SpikeTrains):
+        return spike_times.as_ticks(time_step)
     if len(spike_times) and hasattr(spike_times[0], "__len__"):
-        return [_as_numpy_ticks(times, time_step) for times in spike_times]
+        return SpikeTrains.from_lists(spike_times).as_ticks(time_step)
     else:
         return _as_numpy_ticks(spike_times, time_step)
 
@@ -33,34 +33,44 @@ class SpikeSourceFromFile(SpikeSourceArray):
 
     @staticmethod
     def _subsample_spikes_by_time(spike_array, start, stop, step):
-        sub_sampled_array = {}
-        for neuron in spike_array:
-            times = [t for t in spike_array[neuron] if start <= t < stop]
-            interval = step // 2
-            t_start = times[0]
-            t_last = len(times)
-            t_index = 0
-            spikes_in_interval = 0
-            subsampled_times = []
-            while t_index < t_last:
-                spikes_in_interval = 0
-                while (t_index < t_last and
-                        times[t_index] <= t_start + interval):
-                    spikes_in_interval += 1
-                    if spikes_in_interval >= interval:
-                        t_start = times[t_index] + interval
-                        subsampled_times.append(times[t_index])
-                        try:
-                            t_index = next(i for i in range(t_index, t_last)
-                                           if times[i] >= t_start)
-                        except StopIteration:
-                            t_index = t_last
-                            break
-                        t_index += 1
-                    else:
-                        t_start = t_index
-            sub_sampled_array[neuron] = subsampled_times
-        return sub_sampled_array
+        """ Reduce the spikes of each neuron to the first spike of each\
+            interval of length ``step`` from ``start`` that holds at least\
+            ``step // 2`` spikes, ignoring spikes not in ``[start, stop)``
+
+        :param dict(int,list(float)) spike_array:
+            The spike times of each neuron
+        :param float start: The time to start from
+        :param float stop: The time to stop at
+        :param int step: The length of each interval
+        :rtype: dict(int,list(float))
+        """
+        neurons = list(spike_array)
+        n_spikes = [len(spike_array[neuron]) for neuron in neurons]
+        times = numpy.concatenate(
+            [numpy.asarray(spike_array[neuron], dtype="float")
+             for neuron in neurons] + [numpy.zeros(0)])
+        indices = numpy.repeat(numpy.arange(len(neurons)), n_spikes)
+        in_range = (start <= times) & (times < stop)
+        times = times[in_range]
+        indices = indices[in_range]
+        intervals = ((times - start) // step).astype("int64")
+        order = numpy.lexsort((times, intervals, indices))
+        times = times[order]
+        indices = indices[order]
+        intervals = intervals[order]
+
+        # Find the first spike of each interval of each neuron, and keep it
+        # if the interval has enough spikes
+        first = numpy.ones(len(times), dtype="bool")
+        first[1:] = ((indices[1:] != indices[:-1]) |
+                     (intervals[1:] != intervals[:-1]))
+        firsts = numpy.flatnonzero(first)
+        n_in_interval = numpy.diff(numpy.append(firsts, len(times)))
+        keep = firsts[n_in_interval >= max(step // 2, 1)]
+        kept = numpy.split(times[keep], numpy.searchsorted(
+            indices[keep], numpy.arange(1, len(neurons))))
+        return {neuron: neuron_times.tolist()
+                for neuron, neuron_times in zip(neurons, kept)}
 
     @staticmethod
     def _convert_spike_list_to_timed_spikes(
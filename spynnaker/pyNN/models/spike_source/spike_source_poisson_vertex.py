@@ -49,13 +49,10 @@ from spynnaker.pyNN.utilities import constants
 from spynnaker.pyNN.models.abstract_models import (
     AbstractReadParametersBeforeSet)
 from spynnaker.pyNN.models.neuron.implementations import Struct
+from .schedule_store import ScheduleStore
 from .spike_source_poisson_machine_vertex import (
     SpikeSourcePoissonMachineVertex)
 from spynnaker.pyNN.utilities.utility_calls import validate_mars_kiss_64_seed
-from spynnaker.pyNN.utilities.ranged.spynnaker_ranged_dict \
-    import SpynnakerRangeDictionary
-from spynnaker.pyNN.utilities.ranged.spynnaker_ranged_list \
-    import SpynnakerRangedList
 
 logger = logging.getLogger(__name__)
 
@@ -100,13 +97,189 @@ _PoissonStruct = Struct([
     DataType.UINT32])  # timesteps to next spike
 
 
-def _flatten(alist):
-    for item in alist:
-        if hasattr(item, "__iter__"):
-            for subitem in _flatten(item):
-                yield subitem
-        else:
-            yield item
+def _poisson_rate_data(
+        n_rates, rates, starts, durations, time_to_spike, rate_changed,
+        machine_time_step, first_machine_time_step):
+    """ Get the rate region data of a set of Poisson sources, computing\
+        the values of all the rates of all the sources at once.
+
+    :param ~numpy.ndarray n_rates: The number of rates of each source
+    :param ~numpy.ndarray rates: The rates of the sources, one source after\
+        the other
+    :param ~numpy.ndarray starts: The start time of each rate
+    :param ~numpy.ndarray durations:
+        The duration of each rate, or NaN if it doesn't end
+    :param ~numpy.ndarray time_to_spike:
+        The time to the next spike of each rate
+    :param ~numpy.ndarray rate_changed:
+        Whether the rate of each source has changed, so that its time to
+        spike is reset
+    :param int machine_time_step: the time between timer tick updates
+    :param int first_machine_time_step:
+        First machine time step to start from the correct index
+    :return: For each source, the number of rates, the index of the rate to\
+        start at, and then the parameters of each rate
+    :rtype: ~numpy.ndarray
+    """
+    # pylint: disable=too-many-arguments
+    n_rates = numpy.asarray(n_rates, dtype="int64")
+    n_sources = len(n_rates)
+
+    # The start index of a source with no rates would be taken from the
+    # rates of the next source
+    if numpy.any(n_rates < 1):
+        raise Exception("Each Poisson source must have at least one rate")
+    offsets = numpy.zeros(n_sources + 1, dtype="int64")
+    numpy.cumsum(n_rates, out=offsets[1:])
+    source_starts = offsets[:-1]
+    is_last = offsets[1:] - 1
+
+    # Convert start times to start time steps
+    starts = numpy.asarray(starts, dtype="float")
+    starts_scaled = numpy.round(starts * (
+        MICROSECONDS_PER_MILLISECOND / float(machine_time_step)))
+
+    # Convert durations to end time steps
+    durations = numpy.asarray(durations, dtype="float")
+    ends_scaled = numpy.full(len(durations), 0xFFFFFFFF, dtype="uint32")
+    positions = numpy.invert(numpy.isnan(durations))
+    ends_scaled[positions] = numpy.round(
+        (starts[positions] + durations[positions]) * (
+            MICROSECONDS_PER_MILLISECOND / float(machine_time_step)))
+
+    # Convert start times to next steps, adding max uint to the end of each
+    # source
+    next_scaled = numpy.empty(len(starts_scaled), dtype="uint32")
+    next_scaled[:-1] = starts_scaled[1:]
+    next_scaled[is_last] = 0xFFFFFFFF
+
+    # Compute the spikes per tick for each rate
+    spikes_per_tick = numpy.asarray(rates, dtype="float") * (
+        float(machine_time_step) / MICROSECONDS_PER_SECOND)
+
+    # Determine which sources are fast and which are slow
+    is_fast_source = spikes_per_tick >= SLOW_RATE_PER_TICK_CUTOFF
+    is_faster_source = spikes_per_tick >= FAST_RATE_PER_TICK_CUTOFF
+
+    # Compute the e^-(spikes_per_tick) for fast sources to allow fast
+    # computation of the Poisson distribution to get the number of spikes
+    # per timestep
+    exp_minus_lambda = numpy.zeros(len(spikes_per_tick), dtype="float")
+    exp_minus_lambda[is_fast_source] = numpy.exp(
+        -1.0 * spikes_per_tick[is_fast_source])
+
+    # Compute sqrt(lambda) for "faster" sources to allow Gaussian
+    # approximation of the Poisson distribution to get the number of spikes
+    # per timestep
+    sqrt_lambda = numpy.zeros(len(spikes_per_tick), dtype="float")
+    sqrt_lambda[is_faster_source] = numpy.sqrt(
+        spikes_per_tick[is_faster_source])
+
+    # Compute the inter-spike-interval for slow sources to get the average
+    # number of timesteps between spikes
+    isi_val = numpy.zeros(len(spikes_per_tick), dtype="uint32")
+    elements = numpy.logical_not(is_fast_source) & (spikes_per_tick > 0)
+    isi_val[elements] = (1.0 / spikes_per_tick[elements]).astype(int)
+
+    # Get the time to spike value, which restarts if the rate has changed
+    time_to_spike = numpy.asarray(time_to_spike).astype("uint32")
+    time_to_spike[numpy.repeat(rate_changed, n_rates)] = 0
+
+    # The index to start at is the first rate that hasn't ended, or the last
+    # rate of the source if they have all ended
+    rate_index = numpy.arange(offsets[-1]) - numpy.repeat(
+        source_starts, n_rates)
+    candidates = numpy.where(
+        ends_scaled >= first_machine_time_step, rate_index,
+        numpy.repeat(n_rates - 1, n_rates))
+    start_index = numpy.minimum.reduceat(candidates, source_starts)
+
+    # Each source has two header words followed by the words of its rates
+    data = numpy.empty(
+        n_sources * PARAMS_WORDS_PER_NEURON +
+        offsets[-1] * PARAMS_WORDS_PER_RATE, dtype="uint32")
+    headers = (source_starts * PARAMS_WORDS_PER_RATE +
+               numpy.arange(n_sources) * PARAMS_WORDS_PER_NEURON)
+    data[headers] = n_rates
+    data[headers + 1] = start_index
+    rate_words = numpy.repeat(headers + PARAMS_WORDS_PER_NEURON, n_rates) + (
+        rate_index * PARAMS_WORDS_PER_RATE)
+    data[rate_words.reshape(-1, 1) + numpy.arange(
+        PARAMS_WORDS_PER_RATE)] = numpy.column_stack((
+            starts_scaled.astype("uint32"),
+            ends_scaled,
+            next_scaled,
+            is_fast_source.astype("uint32"),
+            DataType.U032.encode_as_numpy_int_array(
+                exp_minus_lambda).astype("uint32"),
+            DataType.S1615.encode_as_numpy_int_array(
+                sqrt_lambda).astype("uint32"),
+            isi_val,
+            time_to_spike))
+    return data
+
+
+def _read_poisson_rate_data(byte_array, n_sources, machine_time_step):
+    """ Read the rates and times to spike of a set of Poisson sources from\
+        their rate region data, decoding all the rates at once.
+
+    :param bytearray byte_array: The data of the rate region
+    :param int n_sources: The number of sources in the region
+    :param int machine_time_step: the time between timer tick updates
+    :return: The number of rates of each source, and the rates and times\
+        to the next spike of all the sources, one source after the other
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray)
+    """
+    words = numpy.frombuffer(
+        byte_array, dtype="<u4", count=len(byte_array) // BYTES_PER_WORD)
+
+    # Each source has a header of its number of rates and its start index
+    # (which is recalculated on data write) followed by its rates.  Usually
+    # every source has the same number of rates, which can be checked in
+    # one go, as each header being right puts the next in the right place
+    n_first = int(words[0])
+    headers = numpy.arange(n_sources) * (
+        PARAMS_WORDS_PER_NEURON + n_first * PARAMS_WORDS_PER_RATE)
+    if headers[-1] < len(words) and numpy.all(words[headers] == n_first):
+        n_rates = numpy.full(n_sources, n_first, dtype="int64")
+    else:
+        n_rates = numpy.empty(n_sources, dtype="int64")
+        header = 0
+        for i in range(n_sources):
+            headers[i] = header
+            n_rates[i] = words[header]
+            header += PARAMS_WORDS_PER_NEURON + (
+                n_rates[i] * PARAMS_WORDS_PER_RATE)
+
+    # Gather the words of all the rates, then view them as structs
+    rate_index = numpy.arange(n_rates.sum()) - numpy.repeat(
+        numpy.cumsum(n_rates) - n_rates, n_rates)
+    rate_words = numpy.repeat(headers + PARAMS_WORDS_PER_NEURON, n_rates) + (
+        rate_index * PARAMS_WORDS_PER_RATE)
+    params = words[rate_words.reshape(-1, 1) + numpy.arange(
+        PARAMS_WORDS_PER_RATE)].view(_PoissonStruct.numpy_dtype).reshape(-1)
+    (_start, _end, _next, is_fast_source, exp_minus_lambda, sqrt_lambda,
+     isi, time_to_next_spike) = [
+        params["f" + str(i)] / float(data_type.scale)
+        for i, data_type in enumerate(_PoissonStruct.field_types)]
+
+    # Work out the spikes per tick depending on if the source is slow (isi),
+    # fast (exp) or faster (sqrt)
+    is_fast_source = is_fast_source == 1.0
+    spikes_per_tick = numpy.zeros(len(is_fast_source), dtype="float")
+    spikes_per_tick[is_fast_source] = numpy.log(
+        exp_minus_lambda[is_fast_source]) * -1.0
+    is_faster_source = sqrt_lambda > 0
+    # pylint: disable=assignment-from-no-return
+    spikes_per_tick[is_faster_source] = numpy.square(
+        sqrt_lambda[is_faster_source])
+    slow_elements = isi > 0
+    spikes_per_tick[slow_elements] = 1.0 / isi[slow_elements]
+
+    # Convert spikes per tick to rates
+    rates = spikes_per_tick * (
+        MICROSECONDS_PER_SECOND / float(machine_time_step))
+    return n_rates, rates, time_to_next_spike
 
 
 class SpikeSourcePoissonVertex(
@@ -189,6 +362,8 @@ class SpikeSourcePoissonVertex(
                 # Single rate for all neurons for whole simulation
                 rates = numpy.array([rate])
         elif hasattr(rates[0], "__len__"):
+            if not all(hasattr(rate_set, "__len__") for rate_set in rates):
+                raise Exception("Multiple rates must be a list")
             # Convert each list to numpy array
             rates = [numpy.array(r) for r in rates]
         else:
@@ -234,54 +409,29 @@ class SpikeSourcePoissonVertex(
             raise Exception(
                 "Must specify one duration for all neurons or one per neuron")
 
-        # Check that for each rate there is a start and duration if needed
-        # TODO: Could be more efficient for case where parameters are not one
-        #       per neuron
-        for i in range(n_neurons):
-            rate_set = rates
-            if hasattr(rates[0], "__len__"):
-                rate_set = rates[i]
-            if not hasattr(rate_set, "__len__"):
-                raise Exception("Multiple rates must be a list")
-            if starts is None and len(rate_set) > 1:
+        self.__data = dict()
+        self.__data["rates"] = ScheduleStore(n_neurons, rates)
+        if starts is None:
+            if self.__data["rates"].lengths().max() > 1:
                 raise Exception(
                     "When multiple rates are specified,"
                     " each must have a start")
-            elif starts is not None:
-                start_set = starts
-                if hasattr(starts[0], "__len__"):
-                    start_set = starts[i]
-                if len(start_set) != len(rate_set):
-                    raise Exception("Each rate must have a start")
-                if any(s is None for s in start_set):
-                    raise Exception("Start must not be None")
-            if durations is not None:
-                duration_set = durations
-                if hasattr(durations[0], "__len__"):
-                    duration_set = durations[i]
-                if len(duration_set) != len(rate_set):
-                    raise Exception("Each rate must have its own duration")
-
-        if hasattr(rates[0], "__len__"):
-            time_to_spike = [
-                numpy.array([0 for _ in range(len(rates[i]))])
-                for i in range(len(rates))]
-        else:
-            time_to_spike = numpy.array([0 for _ in range(len(rates))])
-
-        self.__data = SpynnakerRangeDictionary(n_neurons)
-        self.__data["rates"] = SpynnakerRangedList(
-            n_neurons, rates,
-            use_list_as_value=not hasattr(rates[0], "__len__"))
-        self.__data["starts"] = SpynnakerRangedList(
-            n_neurons, starts,
-            use_list_as_value=not hasattr(starts[0], "__len__"))
-        self.__data["durations"] = SpynnakerRangedList(
-            n_neurons, durations,
-            use_list_as_value=not hasattr(durations[0], "__len__"))
-        self.__data["time_to_spike"] = SpynnakerRangedList(
-            n_neurons, time_to_spike,
-            use_list_as_value=not hasattr(time_to_spike[0], "__len__"))
+            starts = numpy.array([0])
+        self.__data["starts"] = ScheduleStore(n_neurons, starts)
+        self.__data["durations"] = ScheduleStore(n_neurons, durations)
+
+        # Check that for each rate there is a start and duration
+        n_rates = self.__data["rates"].lengths()
+        if numpy.any(n_rates == 0):
+            raise Exception("Each neuron must have at least one rate")
+        if numpy.any(self.__data["starts"].lengths() != n_rates):
+            raise Exception("Each rate must have a start")
+        if numpy.any(numpy.isnan(self.__data["starts"].flat())):
+            raise Exception("Start must not be None")
+        if numpy.any(self.__data["durations"].lengths() != n_rates):
+            raise Exception("Each rate must have its own duration")
+
+        self.__data["time_to_spike"] = self.__data["rates"].zeros_like()
         self.__rng = numpy.random.RandomState(seed)
         self.__rate_change = numpy.zeros(n_neurons)
         self.__machine_time_step = None
@@ -294,37 +444,30 @@ class SpikeSourcePoissonVertex(
         # Prepare for recording, and to get spikes
         self.__spike_recorder = MultiSpikeRecorder()
 
-        all_rates = list(_flatten(self.__data["rates"]))
         self.__max_rate = max_rate
-        if max_rate is None and len(all_rates):
-            self.__max_rate = numpy.amax(all_rates)
-        elif max_rate is None:
-            self.__max_rate = 0
+        if max_rate is None:
+            self.__max_rate = self.__data["rates"].max()
 
     @property
     def rate(self):
         if self.__is_variable_rate:
             raise Exception("Get variable rate poisson rates with .rates")
-        return list(_flatten(self.__data["rates"]))
+        return list(self.__data["rates"].flat())
 
     @rate.setter
     def rate(self, rate):
         if self.__is_variable_rate:
             raise Exception("Cannot set rate of a variable rate poisson")
-        self.__rate_change = rate - numpy.array(
-            list(_flatten(self.__data["rates"])))
+        self.__rate_change = rate - self.__data["rates"].flat()
         # Normalise parameter
         if hasattr(rate, "__len__"):
             # Single rate per neuron for whole simulation
-            self.__data["rates"].set_value([numpy.array([r]) for r in rate])
+            self.__data["rates"].set_flat(
+                numpy.ones(len(rate), dtype="int64"), rate)
         else:
             # Single rate for all neurons for whole simulation
-            self.__data["rates"].set_value(
-                numpy.array([rate]), use_list_as_value=True)
-        all_rates = list(_flatten(self.__data["rates"]))
-        new_max = 0
-        if len(all_rates):
-            new_max = numpy.amax(all_rates)
+            self.__data["rates"].set_value(numpy.array([rate]))
+        new_max = self.__data["rates"].max()
         if self.__max_rate is None:
             self.__max_rate = new_max
         # Setting record forces reset so OK to go over if not recording
@@ -348,11 +491,11 @@ class SpikeSourcePoissonVertex(
         # Normalise parameter
         if hasattr(start, "__len__"):
             # Single start per neuron for whole simulation
-            self.__data["starts"].set_value([numpy.array([s]) for s in start])
+            self.__data["starts"].set_flat(
+                numpy.ones(len(start), dtype="int64"), start)
         else:
             # Single start for all neurons for whole simulation
-            self.__data["starts"].set_value(
-                numpy.array([start]), use_list_as_value=True)
+            self.__data["starts"].set_value(numpy.array([start]))
 
     @property
     def duration(self):
@@ -368,12 +511,11 @@ class SpikeSourcePoissonVertex(
         # Normalise parameter
         if hasattr(duration, "__len__"):
             # Single duration per neuron for whole simulation
-            self.__data["durations"].set_value(
-                [numpy.array([d]) for d in duration])
+            self.__data["durations"].set_flat(
+                numpy.ones(len(duration), dtype="int64"), duration)
         else:
             # Single duration for all neurons for whole simulation
-            self.__data["durations"].set_value(
-                numpy.array([duration]), use_list_as_value=True)
+            self.__data["durations"].set_value(numpy.array([duration]))
 
     @property
     def rates(self):
@@ -501,8 +643,8 @@ class SpikeSourcePoissonVertex(
 
         :param vertex_slice:
         """
-        n_rates = sum(len(self.__data["rates"][i]) for i in range(
-            vertex_slice.lo_atom, vertex_slice.hi_atom + 1))
+        n_rates = self.__data["rates"].n_values(
+            vertex_slice.lo_atom, vertex_slice.hi_atom)
         return ((vertex_slice.n_atoms * PARAMS_WORDS_PER_NEURON) +
                 (n_rates * PARAMS_WORDS_PER_RATE)) * BYTES_PER_WORD
 
@@ -607,9 +749,8 @@ class SpikeSourcePoissonVertex(
         self.__n_data_specs += 1
 
         # Write the number of microseconds between sending spikes
-        all_rates = numpy.fromiter(_flatten(self.__data["rates"]), numpy.float)
-        # Note we have to do this per rate, as the whole array is not numpy
-        max_rates = numpy.array([numpy.max(r) for r in self.__data["rates"]])
+        all_rates = self.__data["rates"].flat()
+        max_rates = self.__data["rates"].max_per_neuron()
         total_mean_rate = numpy.sum(all_rates)
         if total_mean_rate > 0:
             max_spikes = numpy.sum(scipy.stats.poisson.ppf(
@@ -685,82 +826,15 @@ class SpikeSourcePoissonVertex(
         spec.switch_write_focus(_REGIONS.RATES_REGION.value)
 
         # For each source, write the number of rates, followed by the rate data
-        for i in range(vertex_slice.lo_atom, vertex_slice.hi_atom + 1):
-
-            # Convert start times to start time steps
-            starts = self.__data["starts"][i].astype("float")
-            starts_scaled = self._convert_ms_to_n_timesteps(
-                starts, machine_time_step)
-
-            # Convert durations to end time steps
-            durations = self.__data["durations"][i].astype("float")
-            ends_scaled = numpy.zeros(len(durations), dtype="uint32")
-            none_positions = numpy.isnan(durations)
-            positions = numpy.invert(none_positions)
-            ends_scaled[none_positions] = 0xFFFFFFFF
-            ends_scaled[positions] = self._convert_ms_to_n_timesteps(
-                starts[positions] + durations[positions], machine_time_step)
-
-            # Convert start times to next steps, adding max uint to end
-            next_scaled = numpy.append(starts_scaled[1:], 0xFFFFFFFF)
-
-            # Compute the spikes per tick for each atom
-            rates = self.__data["rates"][i].astype("float")
-            spikes_per_tick = (
-                rates * (float(machine_time_step) / MICROSECONDS_PER_SECOND))
-
-            # Determine which sources are fast and which are slow
-            is_fast_source = spikes_per_tick >= SLOW_RATE_PER_TICK_CUTOFF
-            is_faster_source = spikes_per_tick >= FAST_RATE_PER_TICK_CUTOFF
-
-            # Compute the e^-(spikes_per_tick) for fast sources to allow fast
-            # computation of the Poisson distribution to get the number of
-            # spikes per timestep
-            exp_minus_lambda = numpy.zeros(len(spikes_per_tick), dtype="float")
-            exp_minus_lambda[is_fast_source] = numpy.exp(
-                -1.0 * spikes_per_tick[is_fast_source])
-
-            # Compute sqrt(lambda) for "faster" sources to allow Gaussian
-            # approximation of the Poisson distribution to get the number of
-            # spikes per timestep
-            sqrt_lambda = numpy.zeros(len(spikes_per_tick), dtype="float")
-            sqrt_lambda[is_faster_source] = numpy.sqrt(
-                spikes_per_tick[is_faster_source])
-
-            # Compute the inter-spike-interval for slow sources to get the
-            # average number of timesteps between spikes
-            isi_val = numpy.zeros(len(spikes_per_tick), dtype="uint32")
-            elements = numpy.logical_not(
-                is_fast_source) & (spikes_per_tick > 0)
-            isi_val[elements] = (1.0 / spikes_per_tick[elements]).astype(int)
-
-            # Get the time to spike value
-            time_to_spike = self.__data["time_to_spike"][i]
-            if self.__rate_change[i]:
-                time_to_spike = numpy.array([0.0])
-
-            # Merge the arrays as parameters per atom
-            data = numpy.dstack((
-                starts_scaled.astype("uint32"),
-                ends_scaled.astype("uint32"),
-                next_scaled.astype("uint32"),
-                is_fast_source.astype("uint32"),
-                DataType.U032.encode_as_numpy_int_array(exp_minus_lambda),
-                DataType.S1615.encode_as_numpy_int_array(sqrt_lambda),
-                isi_val.astype("uint32"),
-                time_to_spike.astype("uint32")
-            ))[0].flatten()
-
-            # Find the index to start at
-            index = 0
-            while (ends_scaled[index] < first_machine_time_step and
-                   (index + 1) < len(ends_scaled)):
-                index += 1
-
-            # Write the values to the spec
-            spec.write_value(len(self.__data["rates"][i]))
-            spec.write_value(index)
-            spec.write_array(data)
+        atoms = (vertex_slice.lo_atom, vertex_slice.hi_atom)
+        spec.write_array(_poisson_rate_data(
+            self.__data["rates"].lengths(*atoms),
+            self.__data["rates"].flat(*atoms),
+            self.__data["starts"].flat(*atoms),
+            self.__data["durations"].flat(*atoms),
+            self.__data["time_to_spike"].flat(*atoms),
+            self.__rate_change[atoms[0]:atoms[1] + 1] != 0,
+            machine_time_step, first_machine_time_step))
 
     @staticmethod
     def _convert_ms_to_n_timesteps(value, machine_time_step):
@@ -878,43 +952,16 @@ class SpikeSourcePoissonVertex(
             placement.x, placement.y,
             poisson_rate_region_sdram_address, size_of_region)
 
-        # For each atom, read the number of rates and the rate parameters
-        offset = 0
-        for i in range(vertex_slice.lo_atom, vertex_slice.hi_atom + 1):
-            n_values = struct.unpack_from("<I", byte_array, offset)[0]
-            offset += 4
-
-            # Skip reading the index, as it will be recalculated on data write
-            offset += 4
-
-            (_start, _end, _next, is_fast_source, exp_minus_lambda,
-             sqrt_lambda, isi, time_to_next_spike) = _PoissonStruct.read_data(
-                 byte_array, offset, n_values)
-            offset += _PoissonStruct.get_size_in_whole_words(n_values) * 4
-
-            # Work out the spikes per tick depending on if the source is
-            # slow (isi), fast (exp) or faster (sqrt)
-            is_fast_source = is_fast_source == 1.0
-            spikes_per_tick = numpy.zeros(len(is_fast_source), dtype="float")
-            spikes_per_tick[is_fast_source] = numpy.log(
-                exp_minus_lambda[is_fast_source]) * -1.0
-            is_faster_source = sqrt_lambda > 0
-            # pylint: disable=assignment-from-no-return
-            spikes_per_tick[is_faster_source] = numpy.square(
-                sqrt_lambda[is_faster_source])
-            slow_elements = isi > 0
-            spikes_per_tick[slow_elements] = 1.0 / isi[slow_elements]
-
-            # Convert spikes per tick to rates
-            self.__data["rates"].set_value_by_id(
-                i,
-                spikes_per_tick *
-                (MICROSECONDS_PER_SECOND / float(self.__machine_time_step)))
-
-            # Store the updated time until next spike so that it can be
-            # rewritten when the parameters are loaded
-            self.__data["time_to_spike"].set_value_by_id(
-                i, time_to_next_spike)
+        # Read the rates and times to spike of all the atoms at once
+        n_rates, rates, time_to_next_spike = _read_poisson_rate_data(
+            byte_array, vertex_slice.n_atoms, self.__machine_time_step)
+
+        # Store the updated rates and time until next spike so that they can
+        # be rewritten when the parameters are loaded
+        self.__data["rates"].set_neurons(
+            vertex_slice.lo_atom, n_rates, rates)
+        self.__data["time_to_spike"].set_neurons(
+            vertex_slice.lo_atom, n_rates, time_to_next_spike)
 
     @inject_items({
         "machine_time_step": "MachineTimeStep",
@@ -994,6 +1041,15 @@ class SpikeSourcePoissonVertex(
             SpikeSourcePoissonVertex.SPIKE_RECORDING_REGION_ID,
             placements, graph_mapper, self, machine_time_step)
 
+    @overrides(AbstractSpikeRecordable.iter_spikes)
+    def iter_spikes(
+            self, placements, graph_mapper, buffer_manager, machine_time_step,
+            order=None):
+        return self.__spike_recorder.iter_spikes(
+            self.label, buffer_manager,
+            SpikeSourcePoissonVertex.SPIKE_RECORDING_REGION_ID,
+            placements, graph_mapper, self, machine_time_step, order)
+
     @overrides(AbstractProvidesOutgoingPartitionConstraints.
                get_outgoing_partition_constraints)
     def get_outgoing_partition_constraints(self, partition):
@@ -0,0 +1,149 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+
+
+def _neuron_times(times):
+    """ Get the spike times of a neuron as an array of milliseconds
+
+    :param times: The times, as a list, array, neo SpikeTrain or PyNN\
+        Sequence
+    :rtype: ~numpy.ndarray
+    """
+    if hasattr(times, "rescale"):
+        # A neo SpikeTrain (or other quantities array) knows its units
+        times = times.rescale("ms").magnitude
+    return numpy.asarray(getattr(times, "value", times), dtype="float")
+
+
+class SpikeTrains(object):
+    """ The spike times of each of a number of neurons, stored as a single\
+        flat array of the times of all the neurons, one after the other,\
+        plus an array of the offset of each neuron in it (in the style of the\
+        row pointers of a CSR sparse matrix).  This can be used anywhere a\
+        list of arrays of times, one per neuron, can be used.
+    """
+
+    __slots__ = [
+        # The times of all the neurons, one after the other
+        "__times",
+        # The index of the start of each neuron in the times, plus the end
+        "__offsets"]
+
+    def __init__(self, times, offsets):
+        """
+        :param ~numpy.ndarray times:
+            The times of all the neurons, one after the other
+        :param ~numpy.ndarray offsets:
+            The index of the first time of each neuron, plus the number of\
+            times at the end
+        """
+        self.__times = numpy.asarray(times)
+        self.__offsets = numpy.asarray(offsets, dtype="int64")
+
+    @classmethod
+    def from_lists(cls, spike_times):
+        """ Make spike trains from the times of each neuron
+
+        :param spike_times: The times of each neuron, in milliseconds
+        :type spike_times: list(list(float) or ~numpy.ndarray or\
+            ~neo.core.SpikeTrain)
+        :rtype: SpikeTrains
+        """
+        times = [_neuron_times(neuron_times) for neuron_times in spike_times]
+        offsets = numpy.zeros(len(times) + 1, dtype="int64")
+        numpy.cumsum([len(neuron_times) for neuron_times in times],
+                     out=offsets[1:])
+        return cls(numpy.concatenate(times + [numpy.zeros(0)]), offsets)
+
+    @classmethod
+    def from_ids_and_times(cls, n_neurons, ids, times):
+        """ Make spike trains from the neuron id and time of each spike
+
+        :param int n_neurons: The number of neurons
+        :param ~numpy.ndarray ids: The id of the neuron of each spike
+        :param ~numpy.ndarray times: The time of each spike, in milliseconds
+        :rtype: SpikeTrains
+        """
+        ids = numpy.asarray(ids, dtype="int64")
+        times = numpy.asarray(times, dtype="float")
+        order = numpy.lexsort((times, ids))
+        offsets = numpy.zeros(n_neurons + 1, dtype="int64")
+        numpy.cumsum(numpy.bincount(ids, minlength=n_neurons),
+                     out=offsets[1:])
+        return cls(times[order], offsets)
+
+    @property
+    def times(self):
+        """ The times of all the neurons, one after the other
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__times[self.__offsets[0]:self.__offsets[-1]]
+
+    @property
+    def n_spikes(self):
+        """ The number of spikes of each neuron
+
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.diff(self.__offsets)
+
+    def as_ticks(self, time_step):
+        """ Convert times in milliseconds to the time step at which each\
+            spike is to be sent
+
+        :param int time_step: The time step in microseconds
+        :rtype: SpikeTrains
+        """
+        return SpikeTrains(numpy.ceil(
+            numpy.floor(self.times * 1000.0) / time_step).astype("int64"),
+            self.__offsets - self.__offsets[0])
+
+    def window(self, start, end):
+        """ Get the spikes within a window of time
+
+        :param start: The time of the first spike to include
+        :param end: The time after the last spike to include
+        :rtype: SpikeTrains
+        """
+        times = self.times
+        in_window = (start <= times) & (times < end)
+        neurons = numpy.repeat(numpy.arange(len(self)), self.n_spikes)
+        offsets = numpy.zeros(len(self) + 1, dtype="int64")
+        numpy.cumsum(numpy.bincount(
+            neurons[in_window], minlength=len(self)), out=offsets[1:])
+        return SpikeTrains(times[in_window], offsets)
+
+    def __len__(self):
+        return len(self.__offsets) - 1
+
+    def __getitem__(self, neuron):
+        if isinstance(neuron, slice):
+            start, stop, step = neuron.indices(len(self))
+            if step != 1:
+                raise IndexError("Spike trains can only be sliced in order")
+            return SpikeTrains(
+                self.__times, self.__offsets[start:max(start, stop) + 1])
+        if neuron < 0:
+            neuron += len(self)
+        if not 0 <= neuron < len(self):
+            raise IndexError("Neuron {} is out of range".format(neuron))
+        return self.__times[self.__offsets[neuron]:self.__offsets[neuron + 1]]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
@@ -45,6 +45,24 @@ class DelayBlock(object):
         word_id, bit_id = divmod(source_id, 32)
         self.__delay_block[int(stage - 1)][word_id] |= (1 << bit_id)
 
+    def add_delays(self, source_ids, stages):
+        """ Add the delays of many connections at once, merging them with\
+            any delays already added
+
+        :param ~numpy.ndarray source_ids: The source of each connection
+        :param ~numpy.ndarray stages: The delay stage of each connection
+        """
+        # Each (stage, source) pair only needs setting once
+        n_sources = self.__delay_block.shape[1] * 32
+        bits = numpy.unique(
+            (numpy.asarray(stages).astype("int64") - 1) * n_sources +
+            numpy.asarray(source_ids, dtype="int64"))
+        rows, sources = numpy.divmod(bits, n_sources)
+        word_ids, bit_ids = numpy.divmod(sources, 32)
+        numpy.bitwise_or.at(
+            self.__delay_block, (rows, word_ids),
+            numpy.left_shift(1, bit_ids).astype("uint32"))
+
     @property
     def delay_block(self):
         """
@@ -16,6 +16,7 @@
 from collections import defaultdict
 import logging
 import math
+import threading
 from spinn_utilities.overrides import overrides
 from pacman.executor.injection_decorator import inject_items
 from pacman.model.constraints.key_allocator_constraints import (
@@ -72,7 +73,8 @@ class DelayExtensionVertex(
         "__time_scale_factor",
         "__delay_generator_data",
         "__n_subvertices",
-        "__n_data_specs"]
+        "__n_data_specs",
+        "__delay_lock"]
 
     def __init__(self, n_neurons, delay_per_stage, source_vertex,
                  machine_time_step, time_scale_factor, constraints=None,
@@ -104,6 +106,10 @@ class DelayExtensionVertex(
         # Dictionary of vertex_slice -> delay block for data specification
         self.__delay_blocks = dict()
 
+        # Delays can be added by the data specifications of several vertices
+        # at once
+        self.__delay_lock = threading.Lock()
+
         self.add_constraint(
             SameAtomsAsVertexConstraint(source_vertex))
 
@@ -153,11 +159,12 @@ class DelayExtensionVertex(
         """ Add delayed connections for a given vertex slice
         """
         key = (vertex_slice.lo_atom, vertex_slice.hi_atom)
-        if key not in self.__delay_blocks:
-            self.__delay_blocks[key] = DelayBlock(
-                self.__n_delay_stages, self.__delay_per_stage, vertex_slice)
-        for (source_id, stage) in zip(source_ids, stages):
-            self.__delay_blocks[key].add_delay(source_id, stage)
+        with self.__delay_lock:
+            if key not in self.__delay_blocks:
+                self.__delay_blocks[key] = DelayBlock(
+                    self.__n_delay_stages, self.__delay_per_stage,
+                    vertex_slice)
+            self.__delay_blocks[key].add_delays(source_ids, stages)
 
     def add_generator_data(
             self, max_row_n_synapses, max_delayed_row_n_synapses,
@@ -167,12 +174,13 @@ class DelayExtensionVertex(
         """ Add delays for a connection to be generated
         """
         key = (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
-        self.__delay_generator_data[key].append(
-            DelayGeneratorData(
-                max_row_n_synapses, max_delayed_row_n_synapses,
-                pre_slices, pre_slice_index, post_slices, post_slice_index,
-                pre_vertex_slice, post_vertex_slice,
-                synapse_information, max_stage, machine_time_step))
+        with self.__delay_lock:
+            self.__delay_generator_data[key].append(
+                DelayGeneratorData(
+                    max_row_n_synapses, max_delayed_row_n_synapses,
+                    pre_slices, pre_slice_index, post_slices,
+                    post_slice_index, pre_vertex_slice, post_vertex_slice,
+                    synapse_information, max_stage, machine_time_step))
 
     @inject_items({
         "machine_graph": "MemoryMachineGraph",
@@ -13,11 +13,42 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from six import itervalues
+from spinn_utilities.overrides import overrides
+from spinn_utilities.progress_bar import ProgressBar
+from spinn_storage_handlers.abstract_classes import AbstractDataWriter
+from data_specification import DataSpecificationGenerator
+from data_specification.utility_calls import get_report_writer
+from spinn_front_end_common.abstract_models import (
+    AbstractRewritesDataSpecification, AbstractGeneratesDataSpecification)
+from spinn_front_end_common.interface.ds import DataSpecificationTargets
 from spinn_front_end_common.interface.interface_functions import (
     GraphDataSpecificationWriter)
+from spinn_front_end_common.utilities import (
+    globals_variables, helpful_functions)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spynnaker.pyNN.models.utility_models.delays import DelayExtensionVertex
 
 
+class _SpecBuffer(AbstractDataWriter):
+    """ Holds a data specification in memory until it can be stored
+    """
+
+    __slots__ = ["data"]
+
+    def __init__(self):
+        self.data = bytearray()
+
+    @overrides(AbstractDataWriter.write)
+    def write(self, data):
+        self.data += data
+
+    def close(self):
+        pass
+
+
 class SpynnakerDataSpecificationWriter(
         GraphDataSpecificationWriter):
     """ Executes data specification generation for sPyNNaker
@@ -41,9 +72,136 @@ class SpynnakerDataSpecificationWriter(
                 delay_extensions.append(placement)
             else:
                 placement_order.append(placement)
-        placement_order.extend(delay_extensions)
 
+        n_threads = helpful_functions.read_config_int(
+            globals_variables.get_simulator().config, "Simulation",
+            "n_data_specification_threads")
+        if n_threads is not None and n_threads > 1:
+            # The delay extensions are given their delays by the vertices
+            # that they delay spikes to, so must be generated after them
+            return self.__generate_in_parallel(
+                [placement_order, delay_extensions], placements, hostname,
+                report_default_directory, write_text_specs, machine,
+                data_n_timesteps, graph_mapper, n_threads)
+
+        placement_order.extend(delay_extensions)
         return super(SpynnakerDataSpecificationWriter, self).__call__(
             placements, hostname, report_default_directory, write_text_specs,
             machine, data_n_timesteps, graph_mapper,
             placement_order)
+
+    def __generate_in_parallel(
+            self, phases, placements, hostname, report_default_directory,
+            write_text_specs, machine, data_n_timesteps, graph_mapper,
+            n_threads):
+        """ Generate the data specifications using a pool of threads, one\
+            phase of placements after the other.  The specifications are\
+            stored in the targets in placement order.
+        """
+        # pylint: disable=too-many-arguments, too-many-locals
+        # pylint: disable=attribute-defined-outside-init
+        self._machine = machine
+        self._hostname = hostname
+        self._report_dir = report_default_directory
+        self._write_text = write_text_specs
+        targets = DataSpecificationTargets(machine, self._report_dir)
+
+        progress = ProgressBar(
+            placements.n_placements, "Generating data specifications")
+        vertices_to_reset = list()
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            for phase in phases:
+                # The machine vertices of an application vertex share its
+                # state, so they are generated one after the other
+                groups = OrderedDict()
+                for placement in phase:
+                    groups.setdefault(
+                        graph_mapper.get_application_vertex(placement.vertex),
+                        list()).append(placement)
+                futures = [
+                    executor.submit(self.__generate_specs, group, graph_mapper)
+                    for group in itervalues(groups)]
+                for future in futures:
+                    for placement, vertex, data, region_sizes in \
+                            future.result():
+                        progress.update()
+                        if vertex is None:
+                            continue
+                        with targets.create_data_spec(
+                                placement.x, placement.y,
+                                placement.p) as data_writer:
+                            data_writer.write(data)
+                        self.__add_sdram_usage(
+                            placement, region_sizes, data_n_timesteps)
+                        if isinstance(
+                                vertex, AbstractRewritesDataSpecification):
+                            vertices_to_reset.append(vertex)
+        progress.end()
+
+        # Ensure that the vertices know their regions have been reloaded
+        for vertex in vertices_to_reset:
+            vertex.mark_regions_reloaded()
+
+        return targets
+
+    def __generate_specs(self, placements, graph_mapper):
+        """ Generate the data specifications of some placements in memory
+
+        :return: For each placement, the placement, the vertex that\
+            generated the specification (or None if none did), the\
+            specification and the sizes of its regions
+        :rtype: list(tuple(~pacman.model.placements.Placement,\
+            ~pacman.model.graphs.AbstractVertex, bytearray, list(int)))
+        """
+        specs = list()
+        for placement in placements:
+            vertex = placement.vertex
+            if not isinstance(vertex, AbstractGeneratesDataSpecification):
+                vertex = graph_mapper.get_application_vertex(vertex)
+            if not isinstance(vertex, AbstractGeneratesDataSpecification):
+                specs.append((placement, None, None, None))
+                continue
+            spec_data = _SpecBuffer()
+            report_writer = get_report_writer(
+                placement.x, placement.y, placement.p, self._hostname,
+                self._report_dir, self._write_text)
+            spec = DataSpecificationGenerator(spec_data, report_writer)
+            vertex.generate_data_specification(spec, placement)
+            specs.append(
+                (placement, vertex, spec_data.data, spec.region_sizes))
+        return specs
+
+    def __add_sdram_usage(self, placement, region_sizes, data_n_timesteps):
+        """ Add the SDRAM used by a placement to that of its chip, checking\
+            that the chip has enough
+
+        .. note::
+            This repeats the check that the base class does while it\
+            generates each specification, which is private to it, and\
+            updates the same fields of the base class.  It is tied to the\
+            GraphDataSpecificationWriter of SpiNNFrontEndCommon 1!5.1, so\
+            must be kept in step with it.
+        """
+        x, y = placement.x, placement.y
+        self._region_sizes[placement.vertex] = region_sizes
+        self._vertices_by_chip[x, y].append(placement.vertex)
+        self._sdram_usage[x, y] += sum(region_sizes)
+        if self._sdram_usage[x, y] <= self._machine.get_chip_at(
+                x, y).sdram.size:
+            return
+
+        # creating the error message which contains the memory usage of
+        #  what each core within the chip uses and its original
+        # estimate.
+        memory_usage = "\n".join((
+            "    {}: {} (total={}, estimated={})".format(
+                vert, self._region_sizes[vert],
+                sum(self._region_sizes[vert]),
+                vert.resources_required.sdram.get_total_sdram(
+                    data_n_timesteps))
+            for vert in self._vertices_by_chip[x, y]))
+
+        raise ConfigurationException(
+            "Too much SDRAM has been used on {}, {}.  Vertices and"
+            " their usage on that chip is as follows:\n{}".format(
+                x, y, memory_usage))
@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
 from spinn_utilities.ranged.range_dictionary import RangeDictionary
 from .spynnaker_ranged_list import SpynnakerRangedList
 
@@ -32,3 +33,63 @@ class SpynnakerRangeDictionary(RangeDictionary):
         :rtype: SpynnakerRangedList
         """
         return SpynnakerRangedList(size, value, key)
+
+    def get_dirty(self, slice_start, slice_stop):
+        """ Get which elements of a range of each list have changed since\
+            they were last marked clean.  Lists that do not track changes\
+            are always considered changed.
+
+        :param int slice_start: Start of the range
+        :param int slice_stop: Exclusive end of the range
+        :rtype: dict(str, ~numpy.ndarray(bool))
+        """
+        dirty = dict()
+        for key in self.keys():
+            value_list = self.get_list(key)
+            if isinstance(value_list, SpynnakerRangedList):
+                dirty[key] = value_list.get_dirty(slice_start, slice_stop)
+            else:
+                dirty[key] = numpy.ones(slice_stop - slice_start, dtype="bool")
+        return dirty
+
+    def set_dirty(self, slice_start, dirty):
+        """ Set which elements of a range of each list have changed, as\
+            previously returned by :py:meth:`get_dirty`
+
+        :param int slice_start: Start of the range
+        :param dict(str, ~numpy.ndarray(bool)) dirty:
+            Which elements of each list have changed
+        """
+        for key, key_dirty in dirty.items():
+            value_list = self.get_list(key)
+            if isinstance(value_list, SpynnakerRangedList):
+                value_list.set_dirty(slice_start, key_dirty)
+
+    def get_dirty_ranges(self, slice_start, slice_stop):
+        """ Get the ranges of elements in which any list has changed since\
+            they were last marked clean
+
+        :param int slice_start: Start of the range
+        :param int slice_stop: Exclusive end of the range
+        :return: The start and exclusive end of each range of changes
+        :rtype: list(tuple(int, int))
+        """
+        dirty = numpy.zeros(slice_stop - slice_start, dtype="bool")
+        for key_dirty in self.get_dirty(slice_start, slice_stop).values():
+            dirty |= key_dirty
+        edges = numpy.flatnonzero(numpy.diff(numpy.concatenate((
+            [False], dirty, [False])).astype("int8")))
+        return [(slice_start + int(start), slice_start + int(stop))
+                for start, stop in zip(edges[0::2], edges[1::2])]
+
+    def mark_clean(self, slice_start, slice_stop):
+        """ Mark a range of elements of every list as matching what is on\
+            the machine
+
+        :param int slice_start: Start of the range
+        :param int slice_stop: Exclusive end of the range
+        """
+        for key in self.keys():
+            value_list = self.get_list(key)
+            if isinstance(value_list, SpynnakerRangedList):
+                value_list.mark_clean(slice_start, slice_stop)
@@ -13,12 +13,105 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
 from pyNN.random import RandomDistribution
 from spinn_utilities.overrides import overrides
 from spinn_utilities.ranged.ranged_list import RangedList
 
 
 class SpynnakerRangedList(RangedList):
+    """ A ranged list that also keeps track of which of its elements have\
+        been changed, so that only the changed elements need be written to\
+        the machine again
+    """
+
+    __slots__ = [
+        # Which elements have changed since last marked clean, or None if
+        # none have
+        "__dirty",
+        # The number of changes made to the list
+        "__n_changes"]
+
+    def __init__(
+            self, size=None, value=None, key=None, use_list_as_value=False):
+        """
+        :param size: Fixed length of the list
+        :param value: value to given to all elements in the list
+        :param key: The dict key this list covers.
+        :param use_list_as_value: True if the value *is* a list
+        """
+        self.__dirty = None
+        self.__n_changes = 0
+        super(SpynnakerRangedList, self).__init__(
+            size, value, key, use_list_as_value)
+
+    def __mark_dirty(self, slice_start, slice_stop):
+        if self.__dirty is None:
+            self.__dirty = numpy.zeros(len(self), dtype="bool")
+        self.__dirty[slice_start:slice_stop] = True
+        self.__n_changes += 1
+
+    @property
+    def n_changes(self):
+        """ The number of changes that have been made to the list; if this\
+            is the same at two points, the values have not changed between\
+            them
+
+        :rtype: int
+        """
+        return self.__n_changes
+
+    def get_dirty(self, slice_start, slice_stop):
+        """ Get which elements of a range have changed since they were last\
+            marked clean
+
+        :param int slice_start: Start of the range
+        :param int slice_stop: Exclusive end of the range
+        :rtype: ~numpy.ndarray(bool)
+        """
+        if self.__dirty is None:
+            return numpy.zeros(slice_stop - slice_start, dtype="bool")
+        return self.__dirty[slice_start:slice_stop].copy()
+
+    def set_dirty(self, slice_start, dirty):
+        """ Set which elements of a range have changed, as previously\
+            returned by :py:meth:`get_dirty`
+
+        :param int slice_start: Start of the range
+        :param ~numpy.ndarray(bool) dirty: Which elements have changed
+        """
+        if self.__dirty is None:
+            if not numpy.any(dirty):
+                return
+            self.__dirty = numpy.zeros(len(self), dtype="bool")
+        self.__dirty[slice_start:slice_start + len(dirty)] = dirty
+
+    def mark_clean(self, slice_start, slice_stop):
+        """ Mark a range of elements as matching what is on the machine
+
+        :param int slice_start: Start of the range
+        :param int slice_stop: Exclusive end of the range
+        """
+        if self.__dirty is not None:
+            self.__dirty[slice_start:slice_stop] = False
+
+    @overrides(RangedList.set_value)
+    def set_value(self, value, use_list_as_value=False):
+        super(SpynnakerRangedList, self).set_value(value, use_list_as_value)
+        self.__mark_dirty(0, len(self))
+
+    @overrides(RangedList.set_value_by_id)
+    def set_value_by_id(self, id, value):  # @ReservedAssignment
+        # pylint: disable=redefined-builtin
+        super(SpynnakerRangedList, self).set_value_by_id(id, value)
+        self.__mark_dirty(id, id + 1)
+
+    @overrides(RangedList.set_value_by_slice)
+    def set_value_by_slice(
+            self, slice_start, slice_stop, value, use_list_as_value=False):
+        super(SpynnakerRangedList, self).set_value_by_slice(
+            slice_start, slice_stop, value, use_list_as_value)
+        self.__mark_dirty(slice_start, slice_stop)
 
     @staticmethod
     @overrides(RangedList.is_list)
@@ -19,6 +19,7 @@ utility class containing simple helper methods
 import os
 import logging
 import math
+from itertools import islice
 import numpy
 from pyNN.random import RandomDistribution
 from scipy.stats import binom
@@ -32,6 +33,13 @@ from spynnaker.pyNN.utilities.random_stats import (
 
 MAX_RATE = 2 ** 32 - 1  # To allow a unit32_t to be used to store the rate
 
+# The maximum number of random keys to generate at once when selecting
+# without replacement
+_MAX_SELECTION_KEYS = 2 ** 22
+
+# The number of lines of a file of values to parse at once
+_LINES_PER_CHUNK = 2 ** 16
+
 STATS_BY_NAME = {
     'binomial': RandomStatsBinomialImpl(),
     'gamma': RandomStatsGammaImpl(),
@@ -106,11 +114,125 @@ def convert_to(value, data_type):
         data_type.struct_encoding)
 
 
+def _is_exact_in_floats(values, data_type):
+    """ Determine if encoding the values in double precision gives exactly\
+        the same integers as encoding each value as a decimal does, other\
+        than where the scaled value is exactly half way between two integers
+
+    :param ~numpy.ndarray values: The values to encode
+    :param ~data_specification.enums.DataType data_type:
+        The data type to encode as
+    :rtype: bool
+    """
+    # Integer types are truncated; scaled types are multiplied by a power of
+    # two, which is exact in floats.  The shortest decimal representation of
+    # a float is closer to it than any other float, so it only rounds
+    # differently when the scaled float is exactly half way
+    scale = int(data_type.scale)
+    return (
+        data_type.size <= 4 and
+        numpy.dtype(data_type.struct_encoding).kind in "iu" and
+        (scale & (scale - 1)) == 0 and
+        (values.dtype == numpy.float64 or values.dtype.kind in "iu") and
+        # This also excludes NaN, which can't be encoded
+        bool(numpy.all((values >= float(data_type.min)) &
+                       (values <= float(data_type.max)))))
+
+
+def convert_to_array(values, data_type):
+    """ Convert an array of values to a given data type, giving exactly the\
+        same result as calling :py:func:`convert_to` on each value
+
+    :param values: The values to convert
+    :type values: list(float) or ~numpy.ndarray
+    :param ~data_specification.enums.DataType data_type:
+        The data type to convert to
+    :return: The converted data
+    :rtype: ~numpy.ndarray
+    """
+    values = numpy.asarray(values)
+    if not _is_exact_in_floats(values, data_type):
+        return numpy.array(
+            [convert_to(v, data_type) for v in values.flat],
+            dtype=data_type.struct_encoding).reshape(values.shape)
+    if data_type.scale == 1:
+        return numpy.trunc(values).astype("int64").astype(
+            data_type.struct_encoding)
+    scaled = values.astype("float64") * float(data_type.scale)
+    encoded = numpy.round(scaled).astype("int64").astype(
+        data_type.struct_encoding)
+
+    # Values half way between two integers depend on the decimal
+    # representation of the value, and on the rounding of the version of
+    # Python, so are converted as convert_to does
+    ties = numpy.abs(scaled - numpy.trunc(scaled)) == 0.5
+    if numpy.any(ties):
+        encoded[ties] = [convert_to(v, data_type) for v in values[ties]]
+    return encoded
+
+
+def _parse_lines(lines, n_columns, split_value):
+    """ Parse the first columns of some lines of values, falling back to\
+        evaluating each value if any are expressions rather than numbers
+
+    :param list(str) lines: The lines to parse
+    :param int n_columns: The number of columns to read
+    :param str split_value: The pattern separating the columns
+    :return: A row of values per line
+    :rtype: ~numpy.ndarray
+    """
+    try:
+        return numpy.loadtxt(
+            lines, delimiter=split_value, comments="#",
+            usecols=range(n_columns), ndmin=2)
+    except ValueError:
+        evaluator = SafeEval()
+        return numpy.array([
+            [float(evaluator.eval(value))
+             for value in line.split(split_value)[:n_columns]]
+            for line in lines], dtype="float").reshape(-1, n_columns)
+
+
+def _iter_columns(file_path, n_columns, split_value, names):
+    """ Read the first columns of a file of values a chunk at a time.\
+        Files ending ``.npy`` hold an array with a column per value, and\
+        files ending ``.npz`` an array per column; anything else is text\
+        with a line per row.
+
+    :param str file_path: The path of the file
+    :param int n_columns: The number of columns to read
+    :param str split_value: The pattern separating the columns of text
+    :param list(str) names: The name of each column in a ``.npz`` file
+    :return: A row of values per line, a chunk of lines at a time
+    :rtype: iterable(~numpy.ndarray)
+    """
+    if file_path.endswith(".npz"):
+        with numpy.load(file_path) as data:
+            yield numpy.column_stack(
+                [data[name] for name in names]).astype("float")
+        return
+    if file_path.endswith(".npy"):
+        yield numpy.load(file_path)[:, :n_columns].astype("float")
+        return
+    with open(file_path, 'r') as f:
+        while True:
+            lines = list(islice(f, _LINES_PER_CHUNK))
+            if not lines:
+                return
+            lines = [line for line in lines
+                     if not line.startswith('#') and line.strip()]
+            if lines:
+                yield _parse_lines(lines, n_columns, split_value)
+
+
 def read_in_data_from_file(
         file_path, min_atom, max_atom, min_time, max_time, extra=False):
     """ Read in a file of data values where the values are in a format of:
         <time>\t<atom ID>\t<data value>
 
+    The file can also be a ``.npy`` file of an array with these columns, or\
+    a ``.npz`` file with arrays called ``times``, ``ids`` and ``values``.
+
     :param str file_path: absolute path to a file containing the data
     :param int min_atom: min neuron ID to which neurons to read in
     :param int max_atom: max neuron ID to which neurons to read in
@@ -118,34 +240,29 @@ def read_in_data_from_file(
     :type min_time: float or int
     :param max_time: max time slot to read neurons values of.
     :type max_time: float or int
+    :param bool extra: Whether each line has an extra value, which is ignored
     :return: a numpy array of (time stamp, atom ID, data value)
     :rtype: ~numpy.ndarray(tuple(float, int, float))
     """
-    times = list()
-    atom_ids = list()
-    data_items = list()
-    evaluator = SafeEval()
-    with open(file_path, 'r') as f:
-        for line in f.readlines():
-            if line.startswith('#'):
-                continue
-            if extra:
-                time, neuron_id, data_value, extra = line.split("\t")
-            else:
-                time, neuron_id, data_value = line.split("\t")
-            time = float(evaluator.eval(time))
-            neuron_id = int(evaluator.eval(neuron_id))
-            data_value = float(evaluator.eval(data_value))
-            if (min_atom <= neuron_id < max_atom and
-                    min_time <= time < max_time):
-                times.append(time)
-                atom_ids.append(neuron_id)
-                data_items.append(data_value)
-            else:
-                print("failed to enter {}:{}".format(neuron_id, time))
-
-    result = numpy.dstack((atom_ids, times, data_items))[0]
-    return result[numpy.lexsort((times, atom_ids))]
+    # pylint: disable=too-many-arguments, unused-argument
+    chunks = list()
+    n_failed = 0
+    for values in _iter_columns(
+            file_path, 3, "\t", ["times", "ids", "values"]):
+        times = values[:, 0]
+        atom_ids = numpy.trunc(values[:, 1])
+        in_range = ((min_atom <= atom_ids) & (atom_ids < max_atom) &
+                    (min_time <= times) & (times < max_time))
+        n_failed += len(in_range) - numpy.count_nonzero(in_range)
+        chunks.append(numpy.column_stack(
+            (atom_ids, times, values[:, 2]))[in_range])
+    if n_failed:
+        logger.warning(
+            "%d values in %s were outside of the atoms and times requested",
+            n_failed, file_path)
+
+    result = numpy.concatenate(chunks) if chunks else numpy.zeros((0, 3))
+    return result[numpy.lexsort((result[:, 1], result[:, 0]))]
 
 
 def read_spikes_from_file(file_path, min_atom=0, max_atom=float('inf'),
@@ -153,6 +270,9 @@ def read_spikes_from_file(file_path, min_atom=0, max_atom=float('inf'),
     """ Read spikes from a file formatted as:
         <time>\t<neuron ID>
 
+    The file can also be a ``.npy`` file of an array with these columns, or\
+    a ``.npz`` file with arrays called ``times`` and ``ids``.
+
     :param str file_path: absolute path to a file containing spike values
     :param min_atom: min neuron ID to which neurons to read in
     :type min_atom: int or float
@@ -164,8 +284,8 @@ def read_spikes_from_file(file_path, min_atom=0, max_atom=float('inf'),
     :type max_time: float or int
     :param str split_value: the pattern to split by
     :return:
-        a numpy array with max_atom elements each of which is a list of\
-        spike times.
+        a numpy array of (neuron ID, spike time), sorted by neuron ID and\
+        then time
     :rtype: numpy.ndarray(int, int)
     """
     # pylint: disable=too-many-arguments
@@ -181,22 +301,17 @@ def read_spikes_from_file(file_path, min_atom=0, max_atom=float('inf'),
     if max_time is None:
         max_time = float('inf')
 
-    data = []
-    with open(file_path, 'r') as f_source:
-        read_data = f_source.readlines()
+    chunks = list()
+    for values in _iter_columns(
+            file_path, 2, split_value, ["times", "ids"]):
+        times = values[:, 0]
+        neuron_ids = values[:, 1]
+        in_range = ((min_atom <= neuron_ids) & (neuron_ids < max_atom) &
+                    (min_time <= times) & (times < max_time))
+        chunks.append(numpy.column_stack((neuron_ids, times))[in_range])
 
-    evaluator = SafeEval()
-    for line in read_data:
-        if line.startswith('#'):
-            continue
-        values = line.split(split_value)
-        time = float(evaluator.eval(values[0]))
-        neuron_id = float(evaluator.eval(values[1]))
-        if (min_atom <= neuron_id < max_atom and
-                min_time <= time < max_time):
-            data.append([neuron_id, time])
-    data.sort()
-    return numpy.array(data)
+    data = numpy.concatenate(chunks) if chunks else numpy.zeros((0, 2))
+    return data[numpy.lexsort((data[:, 1], data[:, 0]))]
 
 
 def get_probable_maximum_selected(
@@ -209,6 +324,46 @@ def get_probable_maximum_selected(
     return binom.ppf(prob, n_trials, selection_prob)
 
 
+def random_selections(
+        rng, n_rows, n_values, n_selected, with_replacement=False,
+        exclude_row_index=False):
+    """ Select n_selected values at random from range(n_values) for each\
+        of n_rows rows, all at once
+
+    :param rng: The random number generator to use
+    :type rng: ~pyNN.random.NumpyRNG
+    :param int n_rows: The number of rows to make selections for
+    :param int n_values: The number of values to select from
+    :param int n_selected: The number of values to select for each row
+    :param bool with_replacement:
+        Whether a value can be selected more than once in a row
+    :param bool exclude_row_index:
+        Whether the value equal to the index of the row is excluded from\
+        the selection of that row
+    :return: The selected values, one row per row
+    :rtype: ~numpy.ndarray
+    """
+    n_choices = n_values - 1 if exclude_row_index else n_values
+    if with_replacement:
+        selected = rng.randint(0, n_choices, (n_rows, n_selected))
+    else:
+        # The values with the smallest n_selected of a row of random keys
+        # are a random selection; do a few rows at a time to limit memory
+        selected = numpy.zeros((n_rows, n_selected), dtype="int64")
+        if n_selected:
+            rows_per_chunk = max(1, _MAX_SELECTION_KEYS // max(n_choices, 1))
+            for start in range(0, n_rows, rows_per_chunk):
+                end = min(start + rows_per_chunk, n_rows)
+                keys = rng.random_sample((end - start, n_choices))
+                selected[start:end] = numpy.argpartition(
+                    keys, n_selected - 1, axis=1)[:, :n_selected]
+
+    # Skip over the index of the row by moving values at or above it up one
+    if exclude_row_index:
+        selected += selected >= numpy.arange(n_rows).reshape(-1, 1)
+    return selected
+
+
 def get_probability_within_range(dist, lower, upper):
     """ Get the probability that a value will fall within the given range for\
         a given RandomDistribution
@@ -0,0 +1,86 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import struct
+from spynnaker.pyNN.models.neuron.master_pop_table import (
+    MasterPopTableAsBinarySearch)
+
+
+class MockTransceiverCountingReads(object):
+
+    def __init__(self, data_to_read):
+        self._data_to_read = data_to_read
+        self.n_reads = 0
+
+    def read_memory(self, x, y, base_address, length):
+        self.n_reads += 1
+        return self._data_to_read[base_address:base_address + length]
+
+
+def _make_table():
+    # Three entries, sorted by key, each with a mask of 0xFFFFFF00
+    entries = [(0x100, 0, 1), (0x200, 1, 2), (0x400, 3, 1)]
+    addresses = [
+        # An indirect entry at 0x10 (scaled by 16) with row length 5
+        (1 << 8) | 5,
+        # A single entry at 0x20 with row length 1
+        0x80000000 | (0x20 << 8) | 1,
+        # An indirect entry at 0x30 (scaled by 16) with row length 255
+        (3 << 8) | 255,
+        # An indirect entry at 0x0 with row length 7
+        7]
+    data = bytearray(struct.pack("<II", len(entries), len(addresses)))
+    for key, start, count in entries:
+        data.extend(struct.pack("<IIHH", key, 0xFFFFFF00, start, count))
+    for address in addresses:
+        data.extend(struct.pack("<I", address))
+    return data
+
+
+def test_extract_synaptic_matrix_data_location():
+    table = MasterPopTableAsBinarySearch()
+    txrx = MockTransceiverCountingReads(_make_table())
+
+    assert table.extract_synaptic_matrix_data_location(
+        0x105, 0, txrx, 0, 0) == [(5, 0x10, False)]
+    assert table.extract_synaptic_matrix_data_location(
+        0x2FF, 0, txrx, 0, 0) == [(1, 0x20, True), (255, 0x30, False)]
+    assert table.extract_synaptic_matrix_data_location(
+        0x400, 0, txrx, 0, 0) == [(7, 0, False)]
+
+    # Keys outside of the entries are not found
+    assert table.extract_synaptic_matrix_data_location(
+        0x50, 0, txrx, 0, 0) == []
+    assert table.extract_synaptic_matrix_data_location(
+        0x300, 0, txrx, 0, 0) == []
+    assert table.extract_synaptic_matrix_data_location(
+        0x500, 0, txrx, 0, 0) == []
+
+
+def test_table_read_once_until_cleared():
+    table = MasterPopTableAsBinarySearch()
+    txrx = MockTransceiverCountingReads(_make_table())
+    for key in (0x100, 0x200, 0x400, 0x100):
+        table.extract_synaptic_matrix_data_location(key, 0, txrx, 0, 0)
+    n_reads = txrx.n_reads
+
+    # A second chip has its own table
+    table.extract_synaptic_matrix_data_location(0x100, 0, txrx, 1, 0)
+    assert txrx.n_reads == 2 * n_reads
+
+    # Clearing the cache makes the table be read again
+    table.clear_cache()
+    table.extract_synaptic_matrix_data_location(0x100, 0, txrx, 0, 0)
+    assert txrx.n_reads == 3 * n_reads
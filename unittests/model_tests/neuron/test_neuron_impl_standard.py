@@ -0,0 +1,55 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from pacman.executor.injection_decorator import injection_context
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neuron.builds import (
+    IFCondExpBase, IFCurrExpBase, IzkCurrExpBase)
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangeDictionary
+
+
+@pytest.mark.parametrize("model", [
+    IFCurrExpBase(), IzkCurrExpBase(), IFCondExpBase()])
+def test_data_by_ranges_updates_data(model):
+    # pylint: disable=protected-access
+    neuron_impl = model._model
+    parameters = SpynnakerRangeDictionary(100)
+    state_variables = SpynnakerRangeDictionary(100)
+    neuron_impl.add_parameters(parameters)
+    neuron_impl.add_state_variables(state_variables)
+    vertex_slice = Slice(20, 79)
+
+    with injection_context({"MachineTimeStep": 1000}):
+        data = bytearray(neuron_impl.get_data(
+            parameters, state_variables, vertex_slice).tobytes())
+        parameters.mark_clean(0, 100)
+        state_variables.mark_clean(0, 100)
+
+        # Change some neurons in the slice, and one outside it
+        parameters["i_offset"].set_value_by_slice(25, 30, 1.5)
+        state_variables["v"].set_value_by_id(50, -55.0)
+        state_variables["v"].set_value_by_id(5, -55.0)
+        ranges = sorted(
+            parameters.get_dirty_ranges(20, 80) +
+            state_variables.get_dirty_ranges(20, 80))
+        assert ranges == [(25, 30), (50, 51)]
+
+        # Writing just the changes gives the same data as writing it all
+        for offset, changed in neuron_impl.get_data_by_ranges(
+                parameters, state_variables, vertex_slice, ranges):
+            data[offset:offset + len(changed)] = changed
+        assert bytes(data) == neuron_impl.get_data(
+            parameters, state_variables, vertex_slice).tobytes()
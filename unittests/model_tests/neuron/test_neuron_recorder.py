@@ -12,11 +12,18 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import numpy
+import pytest
 from data_specification.enums import DataType
 from unittests.mocks import MockSimulator
 from pacman.model.graphs.common import Slice
+from pacman.model.placements import Placement
 from spinn_front_end_common.utilities import globals_variables
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spynnaker.pyNN.models.common import NeuronRecorder
+from spynnaker.pyNN.models.common import neuron_recorder, recording_export
+from spynnaker.pyNN.models.common.recording_utils import (
+    decode_spike_bits, fill_missing_rows, merge_spike_chunks)
 from spynnaker.pyNN.utilities.spynnaker_failed_state import (
     SpynnakerFailedState)
 
@@ -67,3 +74,266 @@ def test_recording_variables():
     nr.set_recording("gsyn_inh", True)
     assert(["v", "gsyn_inh"] == nr.recording_variables)
     assert([0, 2] == nr.recorded_region_ids)
+
+
+class _MockVertex(object):
+    def __init__(self, vertex_slice):
+        self.vertex_slice = vertex_slice
+
+
+class _MockGraphMapper(object):
+    def __init__(self, vertices):
+        self._vertices = vertices
+
+    def get_machine_vertices(self, application_vertex):
+        return self._vertices
+
+    def get_slice(self, vertex):
+        return vertex.vertex_slice
+
+
+class _MockPlacements(object):
+    def get_placement_of_vertex(self, vertex):
+        return Placement(vertex, 0, 0, 1)
+
+
+class _MockBufferManager(object):
+    def __init__(self, data):
+        self._data = data
+
+    def get_data_by_placement(self, placement, region):
+        return self._data[placement.vertex], False
+
+
+def _recorded_rows(times, values):
+    # A timestamp followed by the S1615 values of the neurons, for each time
+    rows = numpy.zeros((len(times), values.shape[1] + 1), dtype="<i4")
+    rows[:, 0] = times
+    rows[:, 1:] = numpy.round(values * float(DataType.S1615.scale))
+    return bytearray(rows.tobytes())
+
+
+def test_get_matrix_data():
+    MockSimulator.setup()
+    nr = NeuronRecorder(["v"], {"v": DataType.S1615}, [], 30)
+    indexes = [1, 2, 12, 25, 26, 27]
+    nr.set_recording("v", True, indexes=indexes)
+    vertices = [_MockVertex(Slice(0, 9)), _MockVertex(Slice(10, 19)),
+                _MockVertex(Slice(20, 29))]
+    n_steps = 5
+    expected = numpy.arange(
+        n_steps * len(indexes), dtype="float64").reshape(
+            n_steps, len(indexes)) / 4.0
+    data = {vertices[0]: _recorded_rows(range(n_steps), expected[:, 0:2]),
+            vertices[1]: _recorded_rows(range(n_steps), expected[:, 2:3]),
+            vertices[2]: _recorded_rows(range(n_steps), expected[:, 3:6])}
+    args = ("pop", _MockBufferManager(data), 0, _MockPlacements(),
+            _MockGraphMapper(vertices), None, "v", n_steps)
+
+    matrix, ids, _ = nr.get_matrix_data(*args)
+    assert list(ids) == indexes
+    assert numpy.array_equal(matrix, expected)
+
+    # The data can be written into an array provided
+    out = numpy.zeros((n_steps, len(indexes)))
+    matrix, ids, _ = nr.get_matrix_data(*args, out=out)
+    assert matrix is out
+    assert numpy.array_equal(out, expected)
+
+    # Rows missing from a core are filled with NaN
+    data[vertices[1]] = _recorded_rows(
+        [0, 1, 3, 4], expected[[0, 1, 3, 4], 2:3])
+    matrix, ids, _ = nr.get_matrix_data(*args)
+    assert numpy.isnan(matrix[2, 2])
+    matrix[2, 2] = expected[2, 2]
+    assert numpy.array_equal(matrix, expected)
+
+
+def test_fill_missing_rows():
+    # Recorded every 2 steps, with 4 missing, 6 duplicated, and a time
+    # that is beyond the end of the run
+    times = numpy.array([0, 2, 6, 6, 8, 12])
+    data = numpy.arange(12, dtype="float64").reshape(6, 2)
+    filled, n_duplicates, n_missing = fill_missing_rows(times, data, 5, 2)
+    assert n_duplicates == 1
+    assert n_missing == 1
+    assert numpy.array_equal(filled[[0, 1, 3, 4]], data[[0, 1, 2, 4]])
+    assert numpy.all(numpy.isnan(filled[2]))
+
+    # Integer data can be filled with an integer
+    filled, n_duplicates, n_missing = fill_missing_rows(
+        times, data.astype("int32"), 7, 2, fill_value=-1)
+    assert filled.dtype == numpy.dtype("int32")
+    assert n_missing == 2
+    assert numpy.array_equal(filled[[2, 5]], numpy.full((2, 2), -1))
+    assert numpy.array_equal(filled[6], data[5])
+
+
+def _reference_decode(spike_words, n_neurons):
+    # The original byteswap and fliplr decoding
+    spikes = spike_words.byteswap().view("uint8")
+    bits = numpy.fliplr(numpy.unpackbits(spikes).reshape(
+        (-1, 32))).reshape((len(spike_words), -1))
+    times, neurons = numpy.where(bits == 1)
+    keep = neurons < n_neurons
+    return times[keep], neurons[keep]
+
+
+def test_decode_spike_bits():
+    rng = numpy.random.RandomState(3)
+    spike_words = rng.randint(0, 2 ** 31, (20, 3)).astype("<u4")
+    for n_neurons in (96, 70, 1):
+        times, neurons = decode_spike_bits(
+            spike_words.view("uint8"), n_neurons)
+        expected_times, expected_neurons = _reference_decode(
+            spike_words, n_neurons)
+        assert numpy.array_equal(times, expected_times)
+        assert numpy.array_equal(neurons, expected_neurons)
+
+
+def _spike_rows(times, neurons, n_words):
+    # A timestamp followed by the bitfield of the neurons spiking at it
+    rows = numpy.zeros((len(times), n_words + 1), dtype="<u4")
+    rows[:, 0] = times
+    for row, spiking in zip(rows, neurons):
+        for neuron in spiking:
+            row[1 + neuron // 32] |= 1 << (neuron % 32)
+    return bytearray(rows.tobytes())
+
+
+def test_get_spikes_indexed():
+    nr = NeuronRecorder([], {}, ["spikes"], 80)
+    indexes = [1, 5, 39, 40, 41, 77]
+    nr.set_recording("spikes", True, indexes=indexes)
+    vertices = [_MockVertex(Slice(0, 39)), _MockVertex(Slice(40, 79))]
+
+    # The local indices are into the recorded neurons of each core
+    data = {vertices[0]: _spike_rows([0, 1, 2], [[0, 2], [], [1]], 1),
+            vertices[1]: _spike_rows([0, 1, 2], [[], [0, 1, 2], [2]], 1)}
+    spikes = nr.get_spikes(
+        "pop", _MockBufferManager(data), 0, _MockPlacements(),
+        _MockGraphMapper(vertices), None, "spikes", 1000)
+    assert numpy.array_equal(spikes, [
+        [1, 0], [5, 2], [39, 0], [40, 1], [41, 1], [77, 1], [77, 2]])
+
+
+def _random_core_chunks(rng, lo_atom, n_atoms, n_times):
+    # Spikes in time order, split into chunks at random points; some chunks
+    # split the spikes of a single time
+    times = numpy.sort(rng.randint(0, n_times, 50)).astype("float64")
+    ids = rng.randint(lo_atom, lo_atom + n_atoms, 50)
+    splits = numpy.sort(rng.randint(0, 50, 4))
+    return list(zip(numpy.split(ids, splits), numpy.split(times, splits)))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_merge_spike_chunks(seed):
+    rng = numpy.random.RandomState(seed)
+    cores = [_random_core_chunks(rng, i * 10, 10, 20) for i in range(4)]
+    cores.append([])
+    all_ids = numpy.concatenate([ids for core in cores for ids, _ in core])
+    all_times = numpy.concatenate(
+        [times for core in cores for _, times in core])
+    order = numpy.lexsort((all_ids, all_times))
+
+    chunks = list(merge_spike_chunks(cores))
+    ids = numpy.concatenate([chunk[0] for chunk in chunks])
+    times = numpy.concatenate([chunk[1] for chunk in chunks])
+    assert numpy.array_equal(ids, all_ids[order])
+    assert numpy.array_equal(times, all_times[order])
+
+
+def test_merge_spike_chunks_holds_a_chunk_per_core():
+    # Count the spikes taken from each core and the spikes of each core
+    # that have been merged, to find how many are held at each point
+    rng = numpy.random.RandomState(3)
+    n_cores = 4
+    chunk_size = 5
+    taken = numpy.zeros(n_cores, dtype="int64")
+    merged = numpy.zeros(n_cores, dtype="int64")
+
+    def core_chunks(core):
+        times = numpy.sort(rng.randint(0, 1000, 200)).astype("float64")
+        ids = rng.randint(core * 10, (core + 1) * 10, 200)
+        for start in range(0, 200, chunk_size):
+            end = start + chunk_size
+            taken[core] += len(ids[start:end])
+            yield ids[start:end], times[start:end]
+
+    n_chunks = 0
+    for ids, _ in merge_spike_chunks(
+            [core_chunks(core) for core in range(n_cores)]):
+        n_chunks += 1
+        merged += numpy.bincount(ids // 10, minlength=n_cores)
+        # Spikes at the same time are few here, so only a chunk is needed
+        # to find where it is safe to stop
+        assert numpy.all(taken - merged <= 2 * chunk_size)
+    assert numpy.all(merged == 200)
+    assert n_chunks > 10
+
+
+def test_iter_spikes(monkeypatch):
+    monkeypatch.setattr(neuron_recorder, "_SPIKE_ROWS_PER_CHUNK", 2)
+    nr = NeuronRecorder([], {}, ["spikes"], 80)
+    nr.set_recording("spikes", True)
+    vertices = [_MockVertex(Slice(0, 39)), _MockVertex(Slice(40, 79))]
+    data = {vertices[0]: _spike_rows(
+                [0, 1, 2, 3], [[0, 35], [], [1], [0]], 2),
+            vertices[1]: _spike_rows(
+                [0, 1, 2, 3], [[], [0, 1, 2], [2], [39]], 2)}
+    args = ("pop", _MockBufferManager(data), 0, _MockPlacements(),
+            _MockGraphMapper(vertices), None, "spikes", 1000)
+    expected = nr.get_spikes(*args)
+
+    # Each core is split into chunks of two recorded times
+    chunks = list(nr.iter_spikes(*args))
+    assert len(chunks) == 4
+    for order, keys in (("id", (1, 0)), ("time", (0, 1))):
+        chunks = list(nr.iter_spikes(*args, order=order))
+        spikes = numpy.column_stack((
+            numpy.concatenate([chunk[0] for chunk in chunks]),
+            numpy.concatenate([chunk[1] for chunk in chunks])))
+        assert numpy.array_equal(
+            spikes, expected[numpy.lexsort(expected[:, keys].T)])
+
+    with pytest.raises(ConfigurationException):
+        nr.iter_spikes(*args, order="size")
+
+
+def test_export_and_load(tmpdir):
+    MockSimulator.setup()
+    directory = str(tmpdir)
+    nr = NeuronRecorder(["v"], {"v": DataType.S1615}, ["spikes"], 80)
+    nr.set_recording("v", True, indexes=[3, 50])
+    nr.set_recording("spikes", True)
+    vertices = [_MockVertex(Slice(0, 39)), _MockVertex(Slice(40, 79))]
+    expected = numpy.arange(8, dtype="float64").reshape(4, 2)
+    data = {vertices[0]: _recorded_rows(range(4), expected[:, 0:1]),
+            vertices[1]: _recorded_rows(range(4), expected[:, 1:2])}
+    spike_data = {
+        vertices[0]: _spike_rows([0, 1], [[0, 35], [2]], 2),
+        vertices[1]: _spike_rows([0, 1], [[], [0, 1]], 2)}
+    entries = {
+        "v": nr.export_matrix_data(
+            "pop", _MockBufferManager(data), 0, _MockPlacements(),
+            _MockGraphMapper(vertices), None, "v", 4, directory),
+        "spikes": recording_export.export_spikes(
+            nr.iter_spikes(
+                "pop", _MockBufferManager(spike_data), 1, _MockPlacements(),
+                _MockGraphMapper(vertices), None, "spikes", 1000),
+            directory, "spikes", 1.0)}
+    recording_export.write_index(directory, "pop", entries)
+
+    label, variables = recording_export.load_recording(directory)
+    assert label == "pop"
+    assert isinstance(variables["v"]["data"], numpy.memmap)
+    assert numpy.array_equal(variables["v"]["data"], expected)
+    assert variables["v"]["indexes"] == [3, 50]
+
+    # Each core with spikes has its own shard
+    shards = variables["spikes"]["shards"]
+    assert len(shards) == 2
+    assert numpy.array_equal(numpy.concatenate(
+        [ids for ids, _ in shards]), [0, 35, 2, 40, 41])
+    assert numpy.array_equal(numpy.concatenate(
+        [times for _, times in shards]), [0, 0, 1, 1, 1])
@@ -0,0 +1,165 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from pyNN.random import NumpyRNG, RandomDistribution
+from data_specification.enums import DataType
+from pacman.executor.injection_decorator import injection_context
+from pacman.model.graphs.common import Slice
+from spinn_utilities.helpful_functions import is_singleton
+from spinn_utilities.ranged.ranged_list import RangedList
+from spynnaker.pyNN.models.neuron.builds import (
+    IFCondExpBase, IFCurrExpBase, IzkCurrExpBase)
+from spynnaker.pyNN.models.neuron.implementations import Struct
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangeDictionary
+from spynnaker.pyNN.utilities.utility_calls import (
+    convert_to, convert_to_array)
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+
+_TYPES = [DataType.S1615, DataType.U032, DataType.S031, DataType.UINT32,
+          DataType.INT32, DataType.UINT16, DataType.INT8, DataType.U88]
+
+
+def _reference_get_data(self, values, offset=0, array_size=1):
+    # The original conversion of each value in turn
+    data = numpy.zeros(array_size, dtype=self.numpy_dtype)
+    for i, (values, data_type) in enumerate(zip(values, self.field_types)):
+        if is_singleton(values):
+            data["f" + str(i)] = convert_to(values, data_type)
+        elif not isinstance(values, RangedList):
+            data["f" + str(i)] = [
+                convert_to(v, data_type)
+                for v in values[offset:(offset + array_size)]]
+        else:
+            for start, end, value in values.iter_ranges_by_slice(
+                    offset, offset + array_size):
+                if isinstance(value, RandomDistribution):
+                    data_value = [convert_to(v, data_type)
+                                  for v in value.next(end - start)]
+                else:
+                    data_value = convert_to(value, data_type)
+                data["f" + str(i)][start - offset:end - offset] = data_value
+    overflow = (array_size * self.numpy_dtype.itemsize) % BYTES_PER_WORD
+    if overflow != 0:
+        data = numpy.pad(
+            data.view("uint8"), (0, BYTES_PER_WORD - overflow), "constant")
+    return data.view("uint32")
+
+
+def _edge_values(data_type):
+    scale = float(data_type.scale)
+    low = float(data_type.min)
+    high = float(data_type.max)
+    return numpy.array([
+        low, high, 0.0, 0.5 / scale, 1.5 / scale, 2.5 / scale, -0.5 / scale,
+        -1.5 / scale, 0.1, -0.1, 1.0 / 3.0, (low + high) / 2.0,
+        high + 1.0, low - 1.0, 1e6, -1e6])
+
+
+def _ties(rng, data_type):
+    # Values that are half way between two integers when scaled, many of
+    # which have a shortest decimal representation that is not
+    scale = float(data_type.scale)
+    low = float(data_type.min)
+    high = float(data_type.max)
+    halves = 2 * rng.randint(
+        int(low * scale), int(high * scale), 1000, dtype="int64") + 1
+    return numpy.clip(halves / (2.0 * scale), low, high)
+
+
+@pytest.mark.parametrize("data_type", _TYPES)
+def test_convert_to_array_matches_convert_to(data_type):
+    rng = numpy.random.RandomState(0)
+    low = float(data_type.min)
+    high = float(data_type.max)
+    for values in [
+            _edge_values(data_type), rng.uniform(low, high, 1000),
+            rng.uniform(low, high, 1000).round(3),
+            rng.uniform(low, high, 10).astype("float32"),
+            numpy.arange(-5, 5), _ties(rng, data_type), []]:
+        expected = numpy.array(
+            [convert_to(v, data_type) for v in values],
+            dtype=data_type.struct_encoding)
+        actual = convert_to_array(values, data_type)
+        assert actual.dtype == expected.dtype
+        assert numpy.array_equal(actual, expected)
+
+
+def _values(rng, n_neurons, seed):
+    ranged = RangedList(n_neurons, 1.5)
+    ranged[3:n_neurons // 2] = -0.25
+    ranged[n_neurons // 2:] = RandomDistribution(
+        "uniform", (-10.0, 10.0), rng=NumpyRNG(seed=seed))
+    per_neuron = RangedList(n_neurons, 0.0)
+    per_neuron.set_value(rng.uniform(0, 100, n_neurons).round(2))
+    return [
+        ranged, per_neuron, list(rng.uniform(0, 1, n_neurons)),
+        rng.randint(0, 1000, n_neurons), 7, 0.1, -3.3, 0x12345]
+
+
+@pytest.mark.parametrize("offset, array_size", [(0, 50), (7, 20), (0, 1)])
+def test_get_data_matches_reference(offset, array_size):
+    struct = Struct([
+        DataType.S1615, DataType.S1615, DataType.U032, DataType.UINT32,
+        DataType.UINT8, DataType.S1615, DataType.INT16, DataType.UINT32])
+    expected = _reference_get_data(
+        struct, _values(numpy.random.RandomState(1), 50, 2),
+        offset, array_size)
+    actual = struct.get_data(
+        _values(numpy.random.RandomState(1), 50, 2), offset, array_size)
+    assert actual.dtype == expected.dtype
+    assert numpy.array_equal(actual, expected)
+
+
+def _holders(model, n_neurons, seed):
+    # pylint: disable=protected-access
+    neuron_impl = model._model
+    parameters = SpynnakerRangeDictionary(n_neurons)
+    state_variables = SpynnakerRangeDictionary(n_neurons)
+    neuron_impl.add_parameters(parameters)
+    neuron_impl.add_state_variables(state_variables)
+
+    # Give every neuron its own values, as a PyNN script might
+    rng = numpy.random.RandomState(seed)
+    for holder in (parameters, state_variables):
+        for key in holder.keys():
+            value = holder[key].get_single_value_all()
+            holder[key] = value * rng.uniform(0.9, 1.1, n_neurons)
+    state_variables["v"] = RandomDistribution(
+        "uniform", (-70.0, -60.0), rng=NumpyRNG(seed=seed))
+    return neuron_impl, parameters, state_variables
+
+
+@pytest.mark.parametrize("model", [
+    IFCurrExpBase(), IzkCurrExpBase(), IFCondExpBase()])
+def test_build_data_matches_reference(model, monkeypatch):
+    # A core's worth of neurons with individual parameters must encode to
+    # exactly the same bytes as the original conversion
+    n_neurons = 255
+    vertex_slice = Slice(0, n_neurons - 1)
+    with injection_context({"MachineTimeStep": 1000}):
+        neuron_impl, parameters, state_variables = _holders(
+            model, n_neurons, 3)
+        actual = neuron_impl.get_data(
+            parameters, state_variables, vertex_slice)
+
+        neuron_impl, parameters, state_variables = _holders(
+            model, n_neurons, 3)
+        monkeypatch.setattr(Struct, "get_data", _reference_get_data)
+        expected = neuron_impl.get_data(
+            parameters, state_variables, vertex_slice)
+
+    assert numpy.array_equal(actual, expected)
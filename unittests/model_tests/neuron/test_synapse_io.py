@@ -13,10 +13,16 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
 import pytest
+from pacman.model.graphs.common import Slice
 from spynnaker.pyNN.exceptions import SynapseRowTooBigException
 from spynnaker.pyNN.models.neural_projections import (
     ProjectionApplicationEdge, SynapseInformation)
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    AbstractSynapseDynamics)
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     SynapseDynamicsStatic, SynapseDynamicsSTDP)
 from spynnaker.pyNN.models.neuron.master_pop_table import (
@@ -69,3 +75,151 @@ def test_get_max_row_length(dynamics_class, timing, weight, size, exception,
         actual_size = io._get_max_row_length(
             size, dynamics, population_table, in_edge, size)
         assert actual_size == max_size
+
+
+def _random_connections(n_rows, post_vertex_slice, n_connections,
+                        max_delay):
+    rng = numpy.random.RandomState(0)
+    connections = numpy.zeros(
+        n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = rng.randint(0, n_rows, n_connections)
+    connections["target"] = rng.randint(
+        post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1,
+        n_connections)
+    connections["weight"] = rng.randint(0, 1000, n_connections)
+    connections["delay"] = rng.randint(1, max_delay, n_connections)
+    connections["synapse_type"] = rng.randint(0, 2, n_connections)
+    return connections
+
+
+def _reference_row_data(synapse_dynamics, connections, row_indices, n_rows,
+                        post_vertex_slice):
+    # Join the rows with one concatenate per row, as originally done
+    if isinstance(synapse_dynamics, SynapseDynamicsStatic):
+        ff_data, ff_size = synapse_dynamics.get_static_synaptic_data(
+            connections, row_indices, n_rows, post_vertex_slice, 2)
+        fp_data = pp_data = [numpy.zeros(0, dtype="uint32")] * n_rows
+        fp_size = pp_size = [numpy.zeros(1, dtype="uint32")] * n_rows
+    else:
+        ff_data = [numpy.zeros(0, dtype="uint32")] * n_rows
+        ff_size = [numpy.zeros(1, dtype="uint32")] * n_rows
+        fp_data, pp_data, fp_size, pp_size = \
+            synapse_dynamics.get_plastic_synaptic_data(
+                connections, row_indices, n_rows, post_vertex_slice, 2)
+    ff_data, fp_data, pp_data = list(ff_data), list(fp_data), list(pp_data)
+    lengths = [pp_data[i].size + fp_data[i].size + ff_data[i].size
+               for i in range(n_rows)]
+    padding = [numpy.zeros(max(lengths) - length, dtype="uint32")
+               for length in lengths]
+    return numpy.concatenate([numpy.concatenate(items) for items in zip(
+        pp_size, pp_data, ff_size, fp_size, ff_data, fp_data, padding)])
+
+
+@pytest.mark.parametrize("plastic,pad_to_length", [
+    (False, None), (False, 20), (True, None), (True, 7)])
+def test_row_data_matches_reference(plastic, pad_to_length):
+    MockSimulator.setup()
+    if plastic:
+        dynamics = SynapseDynamicsSTDP(
+            TimingDependenceSpikePair(), WeightDependenceAdditive(),
+            pad_to_length=pad_to_length)
+    else:
+        dynamics = SynapseDynamicsStatic(pad_to_length=pad_to_length)
+    n_rows = 50
+    post_vertex_slice = Slice(100, 199)
+    connections = _random_connections(n_rows, post_vertex_slice, 400, 16)
+    row_indices = connections["source"]
+
+    max_row_length, row_data = \
+        SynapseIORowBased._get_max_row_length_and_row_data(
+            connections, row_indices, n_rows, post_vertex_slice, 2,
+            MasterPopTableAsBinarySearch(), dynamics)
+    expected = _reference_row_data(
+        dynamics, connections, row_indices, n_rows, post_vertex_slice)
+    assert row_data.size == n_rows * (max_row_length + 3)
+    assert row_data.dtype == expected.dtype
+    assert row_data.tobytes() == expected.tobytes()
+
+
+class _MockConnector(object):
+
+    def __init__(self, connections):
+        self._connections = connections
+
+    def create_synaptic_block(self, *args):
+        return self._connections.copy()
+
+
+def _get_and_read_synapses(dynamics, connections, pre_slice, post_slice):
+    synapse_info = SynapseInformation(
+        _MockConnector(connections), None, None, False, False, None,
+        dynamics, 0)
+    io = SynapseIORowBased()
+    row_data, max_row_length, delayed_row_data, max_delayed_row_length, \
+        _, _ = io.get_synapses(
+            synapse_info, None, None, None, None, pre_slice, post_slice, 3,
+            MasterPopTableAsBinarySearch(), 2, {0: 1.0}, 1000, None, None)
+    return io.read_synapses(
+        synapse_info, pre_slice, post_slice, max_row_length,
+        max_delayed_row_length, 2, {0: 1.0}, row_data.tobytes(),
+        delayed_row_data.tobytes(), 1000)
+
+
+@pytest.mark.parametrize("plastic", [False, True])
+def test_read_synapses_round_trip(plastic):
+    MockSimulator.setup()
+    if plastic:
+        dynamics = SynapseDynamicsSTDP(
+            TimingDependenceSpikePair(), WeightDependenceAdditive())
+    else:
+        dynamics = SynapseDynamicsStatic()
+    pre_slice = Slice(0, 99)
+    post_slice = Slice(100, 199)
+    connections = _random_connections(100, post_slice, 2000, 64)
+    read = _get_and_read_synapses(
+        dynamics, connections, pre_slice, post_slice)
+
+    expected = numpy.zeros(
+        connections.size,
+        dtype=AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
+    for name in ("source", "target", "weight", "delay"):
+        expected[name] = connections[name]
+    assert numpy.array_equal(numpy.sort(read), numpy.sort(expected))
+
+
+def _reference_read_static(row_data, pre_slice, post_slice):
+    # Decode rows one at a time, as originally done
+    n_rows = row_data.shape[0]
+    ff_size = row_data[:, 1]
+    ff_data = [row_data[row, 3:3 + ff_size[row]] for row in range(n_rows)]
+    data = numpy.concatenate(ff_data)
+    connections = numpy.zeros(
+        data.size, dtype=AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
+    connections["source"] = numpy.concatenate(
+        [numpy.repeat(i, ff_size[i]) for i in range(n_rows)])
+    connections["source"] += pre_slice.lo_atom
+    connections["target"] = (data & 0x7F) + post_slice.lo_atom
+    connections["weight"] = (data >> 16) & 0xFFFF
+    connections["delay"] = (data >> 8) & 0xF
+    connections["delay"][connections["delay"] == 0] = 16
+    return connections
+
+
+def test_read_static_large_block():
+    # Decoding a large block must give the same answer as decoding it row
+    # by row
+    MockSimulator.setup()
+    dynamics = SynapseDynamicsStatic()
+    pre_slice = Slice(0, 9999)
+    post_slice = Slice(0, 99)
+    connections = _random_connections(10000, post_slice, 200000, 16)
+    io = SynapseIORowBased()
+    max_row_length, row_data = io._get_max_row_length_and_row_data(
+        connections, connections["source"], pre_slice.n_atoms, post_slice,
+        2, MasterPopTableAsBinarySearch(), dynamics)
+    row_data = row_data.reshape(pre_slice.n_atoms, -1)
+
+    expected = _reference_read_static(row_data, pre_slice, post_slice)
+    read = io._read_static_data(
+        dynamics, pre_slice, post_slice, 2, row_data, None)[0]
+    assert numpy.array_equal(read, expected)
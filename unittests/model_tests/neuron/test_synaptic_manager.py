@@ -17,6 +17,8 @@ import os
 import struct
 import tempfile
 import unittest
+import numpy
+from pyNN.random import RandomDistribution
 import spinn_utilities.conf_loader as conf_loader
 from spinn_utilities.overrides import overrides
 from spinn_machine import SDRAM
@@ -26,17 +28,22 @@ from pacman.model.graphs.common import GraphMapper, Slice
 from pacman.model.graphs.machine import MachineGraph, SimpleMachineVertex
 from pacman.model.routing_info import (
     RoutingInfo, PartitionRoutingInfo, BaseKeyAndMask)
-from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.graphs.application import (
+    ApplicationGraph, ApplicationVertex)
 from spinn_storage_handlers import FileDataWriter, FileDataReader
 from data_specification import (
     DataSpecificationGenerator, DataSpecificationExecutor)
 from spynnaker.pyNN.models.neuron import SynapticManager
+from spynnaker.pyNN.models.neuron.synaptic_manager import (
+    _synaptic_block_digest)
 from spynnaker.pyNN.abstract_spinnaker_common import AbstractSpiNNakerCommon
 import spynnaker.pyNN.abstract_spinnaker_common as abstract_spinnaker_common
 from spynnaker.pyNN.models.neural_projections import (
     ProjectionApplicationEdge, ProjectionMachineEdge, SynapseInformation)
 from spynnaker.pyNN.models.neural_projections.connectors import (
-    AbstractGenerateConnectorOnMachine, AllToAllConnector, OneToOneConnector)
+    AbstractGenerateConnectorOnMachine, AllToAllConnector,
+    FixedNumberPreConnector, FixedProbabilityConnector, FromListConnector,
+    OneToOneConnector)
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     SynapseDynamicsStatic, SynapseDynamicsStructuralSTDP,
     SynapseDynamicsSTDP, SynapseDynamicsStructuralStatic)
@@ -69,6 +76,9 @@ class MockMasterPopulationTable(object):
             self, key, master_pop_table_address, transceiver, x, y):
         return self._key_to_entry_map[key]
 
+    def clear_cache(self):
+        pass
+
 
 class MockTransceiverRawData(object):
 
@@ -557,5 +567,113 @@ class TestSynapticManager(unittest.TestCase):
         synaptic_manager.synapse_dynamics = stdp_struct
 
 
+def test_synaptic_block_digest():
+    def digest(weights, delays, weight_scales=(16.0, 16.0), connector=None):
+        synapse_info = SynapseInformation(
+            connector or AllToAllConnector(), None, None, False, False, None,
+            SynapseDynamicsStatic(), 0, weights, delays)
+        return _synaptic_block_digest(
+            synapse_info, 0, 2, numpy.array(weight_scales), 1000)
+
+    weights = numpy.arange(10.0)
+    assert digest(weights, 1.0) == digest(weights.copy(), 1.0)
+    assert digest(weights, 1.0) != digest(weights * 2, 1.0)
+    assert digest(weights, 1.0) != digest(weights, 2.0)
+    assert digest(weights, 1.0) != digest(weights, 1.0, (32.0, 16.0))
+    assert digest(weights, 1.0) == digest(weights, 1.0, (16.0, 32.0))
+
+    uniform = RandomDistribution("uniform", low=0.0, high=1.0)
+    assert digest(uniform, 1.0) == digest(
+        RandomDistribution("uniform", low=0.0, high=1.0), 1.0)
+    assert digest(uniform, 1.0) != digest(
+        RandomDistribution("uniform", low=0.0, high=2.0), 1.0)
+
+    # Connectors of the same type differ by their parameters
+    assert digest(weights, 1.0, connector=AllToAllConnector(False)) != \
+        digest(weights, 1.0, connector=AllToAllConnector(True))
+    assert digest(
+        weights, 1.0, connector=FixedProbabilityConnector(0.1)) == digest(
+            weights, 1.0, connector=FixedProbabilityConnector(0.1))
+    assert digest(
+        weights, 1.0, connector=FixedProbabilityConnector(0.1)) != digest(
+            weights, 1.0, connector=FixedProbabilityConnector(0.2))
+    assert digest(
+        weights, 1.0, connector=FixedNumberPreConnector(3)) != digest(
+            weights, 1.0, connector=FixedNumberPreConnector(4))
+    assert digest(weights, 1.0, connector=FromListConnector(
+        [(0, 0), (1, 1)])) != digest(weights, 1.0, connector=FromListConnector(
+            [(0, 0), (1, 2)]))
+
+
+class CountingAllToAllConnector(AllToAllConnector):
+    """ Counts how many times the statistics of the connector are used
+    """
+
+    def __init__(self):
+        super(CountingAllToAllConnector, self).__init__()
+        self.n_calls = 0
+
+    def get_n_connections_to_post_vertex_maximum(self, synapse_info):
+        self.n_calls += 1
+        return super(CountingAllToAllConnector, self).\
+            get_n_connections_to_post_vertex_maximum(synapse_info)
+
+
+def test_ring_buffer_shifts_reuse_projection_stats():
+    MockSimulator.setup()
+    default_config_paths = os.path.join(
+        os.path.dirname(abstract_spinnaker_common.__file__),
+        AbstractSpiNNakerCommon.CONFIG_FILE_NAME)
+    config = conf_loader.load_config(
+        AbstractSpiNNakerCommon.CONFIG_FILE_NAME, default_config_paths)
+    post_vertex = SimpleApplicationVertex(10)
+    graph = ApplicationGraph("Test")
+    graph.add_vertex(post_vertex)
+
+    def add_projection(weights, synapse_type):
+        pre_vertex = SimpleApplicationVertex(5)
+        connector = CountingAllToAllConnector()
+        synapse_info = SynapseInformation(
+            connector, pre_vertex, post_vertex, False, False, None,
+            SynapseDynamicsStatic(), synapse_type, weights, 1.0)
+        connector.set_projection_information(1000, synapse_info)
+        graph.add_vertex(pre_vertex)
+        graph.add_edge(ProjectionApplicationEdge(
+            pre_vertex, post_vertex, synapse_info), "Test")
+        return connector
+
+    def shifts(synaptic_manager):
+        # pylint: disable=protected-access
+        return synaptic_manager._get_ring_buffer_to_input_left_shifts(
+            post_vertex, graph, 1000, 1.0)
+
+    synaptic_manager = SynapticManager(
+        n_synapse_types=2, ring_buffer_sigma=5.0, spikes_per_second=100.0,
+        config=config)
+    first = add_projection(2.5, 0)
+    add_projection(RandomDistribution("uniform", low=0.0, high=8.0), 1)
+    first_shifts = shifts(synaptic_manager)
+    assert first.n_calls == 1
+
+    # Recomputing only looks at the new projections
+    last = add_projection(20.0, 1)
+    new_shifts = shifts(synaptic_manager)
+    assert first.n_calls == 1
+    assert last.n_calls == 1
+
+    # The result is the same as if nothing were kept
+    fresh = SynapticManager(
+        n_synapse_types=2, ring_buffer_sigma=5.0, spikes_per_second=100.0,
+        config=config)
+    assert shifts(fresh) == new_shifts
+    assert new_shifts != first_shifts
+
+    # Changing the rate assumed of the sources examines them again
+    n_calls = first.n_calls
+    synaptic_manager.spikes_per_second = 200.0
+    shifts(synaptic_manager)
+    assert first.n_calls == n_calls + 1
+
+
 if __name__ == "__main__":
     unittest.main()
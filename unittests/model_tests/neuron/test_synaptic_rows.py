@@ -0,0 +1,102 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    SynapseDynamicsStatic, SynapticRows)
+
+
+def _reference_rows(connection_row_indices, n_rows, data):
+    # The original mask-per-row implementation
+    return [
+        data[connection_row_indices == i].reshape(-1)
+        for i in range(n_rows)]
+
+
+def _reference_pad(rows, n_bytes):
+    return [
+        numpy.concatenate((
+            row, numpy.zeros(max(n_bytes - row.size, 0), dtype="uint8")))
+        for row in rows]
+
+
+def _reference_words(rows):
+    return [numpy.pad(
+        row, (0, (4 - (row.size % 4)) & 0x3), mode="constant",
+        constant_values=0).view("uint32") for row in rows]
+
+
+def _random_block(n_rows, n_connections, n_bytes, seed):
+    rng = numpy.random.RandomState(seed)
+    indices = rng.randint(0, n_rows, n_connections)
+    data = rng.randint(0, 256, (n_connections, n_bytes)).astype("uint8")
+    return indices, data
+
+
+@pytest.mark.parametrize(
+    "n_rows,n_connections,n_bytes",
+    [(1, 0, 4), (10, 0, 2), (10, 1, 2), (20, 100, 4), (100, 37, 6)])
+def test_from_connections(n_rows, n_connections, n_bytes):
+    indices, data = _random_block(n_rows, n_connections, n_bytes, 42)
+    rows = SynapticRows.from_connections(indices, n_rows, data)
+    expected = _reference_rows(indices, n_rows, data)
+    assert len(rows) == n_rows
+    for row, expected_row in zip(rows, expected):
+        assert numpy.array_equal(row, expected_row)
+    for i in range(n_rows):
+        assert numpy.array_equal(rows[i], expected[i])
+
+
+@pytest.mark.parametrize("n_bytes,pad_to", [(2, 0), (2, 5), (6, 3)])
+def test_pad_and_words(n_bytes, pad_to):
+    indices, data = _random_block(30, 80, n_bytes, 7)
+    rows = SynapticRows.from_connections(indices, 30, data)
+    expected = _reference_rows(indices, 30, data)
+
+    padded = rows.pad(numpy.maximum(rows.lengths, n_bytes * pad_to))
+    expected = _reference_pad(expected, n_bytes * pad_to)
+    for row, expected_row in zip(padded, expected):
+        assert numpy.array_equal(row, expected_row)
+
+    words = SynapseDynamicsStatic().get_words(padded)
+    expected = _reference_words(expected)
+    for row, expected_row in zip(words, expected):
+        assert row.dtype == expected_row.dtype
+        assert numpy.array_equal(row, expected_row)
+
+
+def test_pad_prefix():
+    indices, data = _random_block(5, 20, 4, 3)
+    rows = SynapticRows.from_connections(indices, 5, data)
+    headed = rows.pad(rows.lengths + 8, prefix=8)
+    for row, original in zip(headed, rows):
+        assert numpy.array_equal(row[:8], numpy.zeros(8, dtype="uint8"))
+        assert numpy.array_equal(row[8:], original)
+
+
+def test_bucketing_large_block():
+    # A single core's worth of connections must be grouped exactly as the
+    # original implementation did
+    n_rows = 1000
+    indices, data = _random_block(n_rows, 100000, 4, 11)
+
+    expected = _reference_rows(indices, n_rows, data)
+    rows = SynapticRows.from_connections(indices, n_rows, data)
+
+    assert numpy.array_equal(
+        rows.data, numpy.concatenate(expected))
+    assert numpy.array_equal(
+        rows.lengths, [row.size for row in expected])
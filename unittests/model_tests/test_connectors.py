@@ -15,13 +15,21 @@
 
 from __future__ import print_function
 import functools
+import math
 import numpy
 import pytest
 import random
+from pyNN.random import NumpyRNG
+from pyNN.space import Grid2D, Space
 from pacman.model.graphs.common import Slice
 from spynnaker.pyNN.models.neural_projections.connectors import (
+    AllToAllConnector, DistanceDependentProbabilityConnector,
     FixedNumberPreConnector, FixedNumberPostConnector,
     FixedProbabilityConnector, IndexBasedProbabilityConnector)
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    distance_dependent_probability_connector)
+from spynnaker.pyNN.utilities import utility_calls
+from spynnaker.pyNN.utilities.utility_calls import random_selections
 from unittests.mocks import MockSimulator, MockPopulation, MockSynapseInfo
 
 
@@ -178,3 +186,182 @@ def test_connectors(
             print(max_delay, matrix_max_delay, synaptic_block["delay"])
     print(connector, n_pre, n_post, n_in_slice, max_row_length,
           max_source, max_col_length, max_target)
+
+
+@pytest.mark.parametrize("with_replacement", [True, False])
+@pytest.mark.parametrize("exclude_row_index", [True, False])
+def test_random_selections(with_replacement, exclude_row_index):
+    n_values = 1000
+    n_selected = 100
+    selected = random_selections(
+        NumpyRNG(seed=42), n_values, n_values, n_selected, with_replacement,
+        exclude_row_index)
+    assert selected.shape == (n_values, n_selected)
+    assert selected.min() >= 0
+    assert selected.max() < n_values
+    if exclude_row_index:
+        assert not numpy.any(
+            selected == numpy.arange(n_values).reshape(-1, 1))
+    if not with_replacement:
+        assert numpy.all(numpy.diff(numpy.sort(selected, axis=1)) > 0)
+
+    # Each value is expected to be selected 100 times overall; allow five
+    # standard deviations either way
+    counts = numpy.bincount(selected.reshape(-1), minlength=n_values)
+    assert numpy.all(numpy.abs(counts - 100) < 50)
+
+
+@pytest.mark.parametrize("with_replacement", [True, False])
+@pytest.mark.parametrize("connector_type", [
+    FixedNumberPreConnector, FixedNumberPostConnector])
+def test_fixed_number_blocks(connector_type, with_replacement):
+    MockSimulator.setup()
+    n_neurons = 50
+    n = 7
+    population = MockPopulation(n_neurons, "Self")
+    synapse_info = MockSynapseInfo(population, population, 5, 5)
+    connector = connector_type(
+        n, allow_self_connections=False, with_replacement=with_replacement,
+        rng=NumpyRNG(seed=1))
+    connector.set_projection_information(
+        machine_time_step=1000, synapse_info=synapse_info)
+
+    slices = [Slice(i, min(i + 19, n_neurons - 1))
+              for i in range(0, n_neurons, 20)]
+    blocks = [
+        connector.create_synaptic_block(
+            slices, pre_index, slices, post_index, pre_slice, post_slice, 0,
+            synapse_info)
+        for pre_index, pre_slice in enumerate(slices)
+        for post_index, post_slice in enumerate(slices)]
+    block = numpy.concatenate(blocks)
+
+    # Every neuron has exactly n connections on the fixed side, and none
+    # connect to themselves
+    fixed = "target" if connector_type is FixedNumberPreConnector \
+        else "source"
+    assert numpy.array_equal(
+        numpy.bincount(block[fixed], minlength=n_neurons),
+        numpy.repeat(n, n_neurons))
+    assert not numpy.any(block["source"] == block["target"])
+    if not with_replacement:
+        pairs = set(zip(block["source"], block["target"]))
+        assert len(pairs) == len(block)
+
+
+class MockPositionedPopulation(MockPopulation):
+
+    def __init__(self, size, label):
+        super(MockPositionedPopulation, self).__init__(size, label)
+        self.positions = Grid2D(dx=2.0, dy=3.0).generate_positions(size)
+
+
+@pytest.mark.parametrize("weights,expected", [
+    ("d", lambda diff: numpy.sqrt(numpy.sum(diff ** 2, axis=0))),
+    ("2 * d[0] + d[1]",
+     lambda diff: 2 * numpy.abs(diff[0]) + numpy.abs(diff[1])),
+    (lambda d: numpy.sqrt(numpy.sum(d ** 2, axis=0)) + 1.0,
+     lambda diff: numpy.sqrt(numpy.sum(diff ** 2, axis=0)) + 1.0)],
+    ids=["distance", "expanded", "callable"])
+@pytest.mark.parametrize("connector_type", [
+    AllToAllConnector, functools.partial(FixedProbabilityConnector, 0.5)],
+    ids=["AllToAll", "FixedProbability"])
+def test_distance_dependent_values(connector_type, weights, expected):
+    MockSimulator.setup()
+    pre = MockPositionedPopulation(36, "Pre")
+    post = MockPositionedPopulation(25, "Post")
+    synapse_info = MockSynapseInfo(pre, post, weights, 1.0)
+    connector = connector_type()
+    connector.set_space(Space())
+    connector.set_projection_information(
+        machine_time_step=1000, synapse_info=synapse_info)
+
+    pre_slices = [Slice(0, 9), Slice(10, 35)]
+    post_slices = [Slice(0, 19), Slice(20, 24)]
+    for pre_index, pre_slice in enumerate(pre_slices):
+        for post_index, post_slice in enumerate(post_slices):
+            block = connector.create_synaptic_block(
+                pre_slices, pre_index, post_slices, post_index, pre_slice,
+                post_slice, 0, synapse_info)
+            diff = (pre.positions[:, block["source"]] -
+                    post.positions[:, block["target"]])
+            assert numpy.allclose(block["weight"], expected(diff))
+
+
+def test_distance_dependent_probability_blocks(monkeypatch):
+    # Work out maxima over several small blocks, and keep only a few
+    monkeypatch.setattr(
+        distance_dependent_probability_connector,
+        "_MAX_PROBABILITIES_PER_BLOCK", 50)
+    monkeypatch.setattr(
+        distance_dependent_probability_connector, "_N_CACHED_BLOCKS", 2)
+    MockSimulator.setup()
+    pre = MockPositionedPopulation(36, "Pre")
+    post = MockPositionedPopulation(25, "Post")
+    synapse_info = MockSynapseInfo(pre, post, 1.0, 1.0)
+    expression = "exp(-d / 5.0)"
+    pre_slices = [Slice(0, 9), Slice(10, 35)]
+    post_slices = [Slice(0, 19), Slice(20, 24)]
+
+    # The probabilities of the whole projection at once
+    space = Space()
+    d = space.distances(pre.positions.T, post.positions.T).reshape(36, 25)
+    all_probs = numpy.exp(-d / 5.0)
+
+    connector = DistanceDependentProbabilityConnector(
+        expression, rng=NumpyRNG(seed=5))
+    connector.set_space(space)
+    connector.set_projection_information(
+        machine_time_step=1000, synapse_info=synapse_info)
+    rng = NumpyRNG(seed=5)
+    for post_index, post_slice in enumerate(post_slices):
+        assert connector.get_n_connections_from_pre_vertex_maximum(
+            post_slice, synapse_info) == int(math.ceil(
+                utility_calls.get_probable_maximum_selected(
+                    36 * 25, post_slice.n_atoms,
+                    numpy.amax(all_probs[:, post_slice.as_slice]))))
+        for pre_index, pre_slice in enumerate(pre_slices):
+            block = connector.create_synaptic_block(
+                pre_slices, pre_index, post_slices, post_index, pre_slice,
+                post_slice, 0, synapse_info)
+
+            # The same random numbers give the same connections
+            items = rng.next(pre_slice.n_atoms * post_slice.n_atoms)
+            ids = numpy.where(items < all_probs[
+                pre_slice.as_slice, post_slice.as_slice].reshape(-1))[0]
+            assert numpy.array_equal(
+                block["source"], ids // post_slice.n_atoms + pre_slice.lo_atom)
+            assert numpy.array_equal(
+                block["target"], ids % post_slice.n_atoms + post_slice.lo_atom)
+
+    assert connector.get_n_connections_to_post_vertex_maximum(
+        synapse_info) == utility_calls.get_probable_maximum_selected(
+            36 * 25, 25, numpy.amax(all_probs))
+
+
+@pytest.mark.parametrize("connector_type, n_neurons, neurons", [
+    (FixedNumberPreConnector, "__n_pre", "__pre_neurons"),
+    (FixedNumberPostConnector, "__n_post", "__post_neurons")])
+def test_identifying_parameters(connector_type, n_neurons, neurons):
+    MockSimulator.setup()
+    connector = connector_type(2, rng=NumpyRNG(42))
+    synapse_info = MockSynapseInfo(
+        MockPopulation(10, "Pre"), MockPopulation(10, "Post"), 5, 1)
+    connector.set_projection_information(1000, synapse_info)
+    parameters = [
+        (name, repr(value))
+        for name, value in connector.get_identifying_parameters()]
+    names = [name for name, _ in parameters]
+    assert connector_type.__name__ + n_neurons in names
+    assert "AbstractConnector_weights" in names
+    assert connector_type.__name__ + neurons not in names
+
+    # Making connections only fills in the derived slots
+    pre_slices = [Slice(0, 4), Slice(5, 9)]
+    post_slices = [Slice(0, 4), Slice(5, 9)]
+    connector.create_synaptic_block(
+        pre_slices, 0, post_slices, 0, pre_slices[0], post_slices[0], 0,
+        synapse_info)
+    assert parameters == [
+        (name, repr(value))
+        for name, value in connector.get_identifying_parameters()]
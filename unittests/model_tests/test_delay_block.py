@@ -0,0 +1,42 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.utility_models.delays.delay_block import (
+    DelayBlock)
+
+
+@pytest.mark.parametrize("n_atoms", [1, 31, 32, 100])
+def test_add_delays_matches_add_delay(n_atoms):
+    rng = numpy.random.RandomState(n_atoms)
+    vertex_slice = Slice(0, n_atoms - 1)
+    expected = DelayBlock(8, 16, vertex_slice)
+    actual = DelayBlock(8, 16, vertex_slice)
+
+    # Add delays in several calls, with repeats, to check they are merged
+    for _ in range(3):
+        source_ids = rng.randint(0, n_atoms, 500)
+        stages = rng.randint(1, 9, 500)
+        for source_id, stage in zip(source_ids, stages):
+            expected.add_delay(source_id, stage)
+        actual.add_delays(source_ids, stages)
+        assert numpy.array_equal(actual.delay_block, expected.delay_block)
+    assert actual.delay_block.dtype == numpy.dtype("uint32")
+
+    # Adding no delays changes nothing
+    actual.add_delays(numpy.zeros(0, dtype="uint32"), numpy.zeros(0))
+    assert numpy.array_equal(actual.delay_block, expected.delay_block)
@@ -0,0 +1,99 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    KernelConnector)
+
+
+def _reference_compute_statistics(
+        connector, pre_vertex_slice, post_vertex_slice):
+    # The original loop over every pair of pre- and post-vertices
+    # pylint: disable=protected-access
+    post_as_pre_r, post_as_pre_c = connector.post_as_pre(post_vertex_slice)
+    hh, hw = connector._hlf_k_h, connector._hlf_k_w
+    all_pre_ids = []
+    all_post_ids = []
+    all_delays = []
+    all_weights = []
+    post_lo = post_vertex_slice.lo_atom
+    for pre_idx in range(
+            pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom + 1):
+        pre_r, pre_c = divmod(pre_idx, connector._pre_w)
+        for post_idx in range(
+                post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1):
+            r = post_as_pre_r[post_idx - post_lo]
+            c = post_as_pre_c[post_idx - post_lo]
+            if not (0 <= r < connector._common_h and
+                    0 <= c < connector._common_w):
+                continue
+            r, c = connector.pre_as_post((r, c))
+            kr = hh - (r - pre_r)
+            kc = hw - (c - pre_c)
+            if 0 <= kr < connector._kernel_h and 0 <= kc < connector._kernel_w:
+                all_pre_ids.append(pre_idx)
+                all_post_ids.append(post_idx)
+                all_delays.append(connector._krn_delays[kr, kc])
+                all_weights.append(connector._krn_weights[kr, kc])
+    return (len(all_pre_ids), numpy.array(all_post_ids, dtype='uint32'),
+            numpy.array(all_pre_ids, dtype='uint32'),
+            numpy.array(all_delays), numpy.array(all_weights))
+
+
+def _random_connector(rng):
+    shape_pre = tuple(rng.randint(1, 12, 2))
+    shape_kernel = tuple(rng.randint(1, 6, 2))
+    pre_steps = tuple(rng.randint(1, 3, 2))
+    pre_starts = tuple(rng.randint(0, 3, 2))
+    post_steps = tuple(rng.randint(1, 3, 2))
+    post_starts = tuple(rng.randint(0, 3, 2))
+    shape_post = tuple(numpy.maximum(
+        (numpy.array(shape_pre) - numpy.array(post_starts) - 1) //
+        numpy.array(post_steps) + 1, 1))
+    weights = rng.uniform(-1.0, 1.0, shape_kernel)
+    delays = rng.randint(1, 16, shape_kernel).astype("float")
+    connector = KernelConnector(
+        shape_pre, shape_post, shape_kernel, weights, delays, None,
+        pre_steps, pre_starts, post_steps, post_starts, safe=True,
+        verbose=False)
+    n_pre = shape_pre[0] * shape_pre[1]
+    n_post = shape_post[0] * shape_post[1]
+    return connector, n_pre, n_post
+
+
+def _random_slice(rng, n_atoms):
+    lo_atom = rng.randint(0, n_atoms)
+    return Slice(lo_atom, rng.randint(lo_atom, n_atoms))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_compute_statistics_matches_reference(seed):
+    rng = numpy.random.RandomState(seed)
+    connector, n_pre, n_post = _random_connector(rng)
+    for pre_vertex_slice, post_vertex_slice in [
+            (Slice(0, n_pre - 1), Slice(0, n_post - 1)),
+            (_random_slice(rng, n_pre), _random_slice(rng, n_post)),
+            (_random_slice(rng, n_pre), _random_slice(rng, n_post))]:
+        expected = _reference_compute_statistics(
+            connector, pre_vertex_slice, post_vertex_slice)
+        actual = connector.compute_statistics(
+            None, None, pre_vertex_slice, post_vertex_slice)
+        assert actual[0] == expected[0]
+        for values, expected_values in zip(actual[1:], expected[1:]):
+            assert numpy.array_equal(values, expected_values)
+        assert actual[1].dtype == expected[1].dtype
+        assert actual[2].dtype == expected[2].dtype
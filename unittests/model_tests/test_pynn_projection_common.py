@@ -0,0 +1,197 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import configparser
+import threading
+import time
+import numpy
+import pytest
+from spinn_machine.virtual_machine import virtual_machine
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import ResourceContainer
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
+from spynnaker.pyNN.models.pynn_projection_common import (
+    PyNNProjectionCommon)
+
+# pylint: disable=protected-access
+
+# A machine of three boards, and chips on each of them
+_MACHINE = virtual_machine(12, 12)
+_CHIPS = [(0, 0), (1, 0), (4, 8), (5, 9), (8, 4), (0, 1), (9, 5), (4, 9)]
+
+
+class _MachineEdge(object):
+
+    def __init__(self, index):
+        self.index = index
+        self.post_vertex = SimpleMachineVertex(ResourceContainer())
+
+
+class _Vertex(object):
+
+    def __init__(self, label, events):
+        self.label = label
+        self.n_atoms = len(_CHIPS)
+        self.__events = events
+        self.__lock = threading.Lock()
+        self.__boards_reading = set()
+        self.overlapping_reads = list()
+        self.time_out_configurations = list()
+
+    def get_connections_from_machine(
+            self, transceiver, placement, edge, graph_mapper, routing_infos,
+            synapse_information, machine_time_step, using_extra_monitor_cores,
+            placements=None, monitor_api=None, monitor_cores=None,
+            handle_time_out_configuration=True, fixed_routes=None,
+            extra_monitor=None):
+        # pylint: disable=too-many-arguments
+        chip = _MACHINE.get_chip_at(placement.x, placement.y)
+        board = (chip.nearest_ethernet_x, chip.nearest_ethernet_y)
+        with self.__lock:
+            if board in self.__boards_reading:
+                self.overlapping_reads.append(board)
+            self.__boards_reading.add(board)
+            self.time_out_configurations.append(
+                handle_time_out_configuration)
+            self.__events.append(("read", edge.index))
+
+        # Make the first edges the slowest to read
+        time.sleep(0.01 * (len(_CHIPS) - edge.index))
+        with self.__lock:
+            self.__boards_reading.remove(board)
+
+        connections = numpy.zeros(
+            2, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+        connections["source"] = edge.index
+        connections["target"] = [0, 1]
+        return connections
+
+
+class _Receiver(object):
+
+    def __init__(self, events):
+        self.__events = events
+
+    def load_system_routing_tables(self, transceiver, monitors, placements):
+        self.__events.append("load_system_routing_tables")
+
+    def set_cores_for_data_streaming(self, transceiver, monitors, placements):
+        self.__events.append("set_cores_for_data_streaming")
+
+    def unset_cores_for_data_streaming(
+            self, transceiver, monitors, placements):
+        self.__events.append("unset_cores_for_data_streaming")
+
+    def load_application_routing_tables(
+            self, transceiver, monitors, placements):
+        self.__events.append("load_application_routing_tables")
+
+
+class _GraphMapper(object):
+
+    def __init__(self, machine_edges):
+        self.__machine_edges = machine_edges
+
+    def get_machine_edges(self, app_edge):
+        return self.__machine_edges
+
+
+class _Control(object):
+
+    def __init__(self, n_threads, using_monitors, events):
+        self.machine = _MACHINE
+        self.transceiver = None
+        self.config = configparser.RawConfigParser()
+        self.config.add_section("Simulation")
+        self.config.set(
+            "Simulation", "n_projection_extraction_threads", str(n_threads))
+        machine_edges = [_MachineEdge(i) for i in range(len(_CHIPS))]
+        self.graph_mapper = _GraphMapper(machine_edges)
+        self.placements = Placements()
+        for edge, (x, y) in zip(machine_edges, _CHIPS):
+            self.placements.add_placement(
+                Placement(edge.post_vertex, x, y, 1))
+        self.routing_infos = None
+        self.machine_time_step = 1000
+        self.fixed_routes = None
+        self.has_ran = True
+        self.__outputs = dict()
+        if using_monitors:
+            self.__outputs = {
+                "UsingAdvancedMonitorSupport": True,
+                "MemoryExtraMonitorVertices": ["monitors"],
+                "MemoryMCGatherVertexToEthernetConnectedChipMapping": {
+                    (chip.x, chip.y): _Receiver(events)
+                    for chip in self.machine.ethernet_connected_chips},
+                "MemoryExtraMonitorToChipMapping": {
+                    (chip.x, chip.y): "monitor"
+                    for chip in self.machine.chips}}
+
+    def get_generated_output(self, name):
+        return self.__outputs.get(name)
+
+
+class _ApplicationEdge(object):
+
+    def __init__(self, events):
+        self.pre_vertex = _Vertex("pre", events)
+        self.post_vertex = _Vertex("post", events)
+        self.label = "edge"
+
+
+def _read_connections(n_threads, using_monitors):
+    events = list()
+    projection = PyNNProjectionCommon.__new__(PyNNProjectionCommon)
+    projection._PyNNProjectionCommon__spinnaker_control = _Control(
+        n_threads, using_monitors, events)
+    projection._PyNNProjectionCommon__projection_edge = _ApplicationEdge(
+        events)
+    projection._PyNNProjectionCommon__synapse_information = None
+    projection._PyNNProjectionCommon__virtual_connection_list = None
+    holder = projection._get_synaptic_data(True, ["source", "target"])
+    post_vertex = projection._PyNNProjectionCommon__projection_edge\
+        .post_vertex
+    return holder, post_vertex, events
+
+
+@pytest.mark.parametrize("using_monitors", [False, True])
+def test_parallel_matches_serial(using_monitors):
+    serial, _, _ = _read_connections(1, using_monitors)
+    parallel, post_vertex, events = _read_connections(3, using_monitors)
+
+    # The connections are added in the order of the edges
+    assert [connections["source"][0]
+            for connections in parallel.connections] == list(
+                range(len(_CHIPS)))
+    assert list(serial) == list(parallel)
+
+    # Each board is read by one thread at a time
+    assert not post_vertex.overlapping_reads
+    assert len(post_vertex.time_out_configurations) == len(_CHIPS)
+
+    # The monitors are set up once, around all the reads
+    assert not any(post_vertex.time_out_configurations)
+    reads = [("read", i) for i in range(len(_CHIPS))]
+    if using_monitors:
+        assert events[:2] == [
+            "load_system_routing_tables", "set_cores_for_data_streaming"]
+        assert events[-2:] == [
+            "unset_cores_for_data_streaming",
+            "load_application_routing_tables"]
+        assert sorted(events[2:-2]) == reads
+    else:
+        assert sorted(events) == reads
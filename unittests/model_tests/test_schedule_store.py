@@ -0,0 +1,102 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from spynnaker.pyNN.models.spike_source.schedule_store import ScheduleStore
+
+
+def test_shared_values():
+    store = ScheduleStore(4, numpy.array([1.0, 5.0]))
+    assert store.is_shared
+    assert len(store) == 4
+    assert numpy.array_equal(store[3], [1.0, 5.0])
+    assert numpy.array_equal(store.lengths(1, 2), [2, 2])
+    assert store.n_values(1, 3) == 6
+    assert numpy.array_equal(store.flat(2, 3), [1.0, 5.0, 1.0, 5.0])
+    assert store.max() == 5.0
+    assert numpy.array_equal(store.max_per_neuron(), [5.0] * 4)
+    assert store.nbytes == 16
+
+
+def test_per_neuron_values():
+    values = [numpy.array([1.0]), numpy.array([2.0, 8.0, 3.0]),
+              numpy.array([]), numpy.array([4.0, 5.0])]
+    store = ScheduleStore(4, values)
+    assert not store.is_shared
+    for expected, actual in zip(values, store):
+        assert numpy.array_equal(expected, actual)
+    assert numpy.array_equal(store[-1], [4.0, 5.0])
+    assert numpy.array_equal(store.lengths(), [1, 3, 0, 2])
+    assert store.n_values(1, 2) == 3
+    assert numpy.array_equal(store.flat(1, 3), [2.0, 8.0, 3.0, 4.0, 5.0])
+    assert store.max() == 8.0
+    assert [len(v) for v in store[1:3]] == [3, 0]
+    assert numpy.array_equal(store.max_per_neuron(), [1.0, 8.0, 0.0, 5.0])
+    with pytest.raises(IndexError):
+        store[4]  # pylint: disable=pointless-statement
+
+
+def test_none_is_nan():
+    store = ScheduleStore(2, numpy.array([None, 10]))
+    assert numpy.isnan(store[0][0])
+    assert store[0][1] == 10.0
+
+
+def test_set_neurons():
+    store = ScheduleStore(5, numpy.array([7.0]))
+
+    # Setting the shared values leaves the store shared
+    store.set_neurons(1, [1, 1], [7.0, 7.0])
+    assert store.is_shared
+
+    # Setting values of the same length updates in place
+    store.set_neurons(1, [1, 1], [2.0, 3.0])
+    assert not store.is_shared
+    assert numpy.array_equal(store.flat(), [7.0, 2.0, 3.0, 7.0, 7.0])
+
+    # Setting values of a different length moves the later neurons
+    store.set_neurons(2, [3, 0], [4.0, 5.0, 6.0])
+    assert numpy.array_equal(store.lengths(), [1, 1, 3, 0, 1])
+    assert numpy.array_equal(store[2], [4.0, 5.0, 6.0])
+    assert numpy.array_equal(store[4], [7.0])
+    assert numpy.array_equal(store.max_per_neuron()[[0, 1, 2, 4]],
+                             [7.0, 2.0, 6.0, 7.0])
+
+
+def test_zeros_like():
+    store = ScheduleStore(3, [numpy.array([1.0, 2.0]), numpy.array([3.0]),
+                              numpy.array([4.0, 5.0, 6.0])])
+    zeros = store.zeros_like()
+    assert numpy.array_equal(zeros.lengths(), store.lengths())
+    assert not numpy.any(zeros.flat())
+    assert numpy.array_equal(
+        ScheduleStore(3, numpy.array([1.0])).zeros_like().flat(), [0, 0, 0])
+
+
+def test_one_per_neuron_required():
+    with pytest.raises(Exception):
+        ScheduleStore(3, [numpy.array([1.0]), numpy.array([2.0])])
+
+
+def test_values_are_read_only():
+    for values in (numpy.array([1.0, 2.0]),
+                   [numpy.array([1.0]), numpy.array([2.0, 3.0])]):
+        store = ScheduleStore(2, values)
+        with pytest.raises(ValueError):
+            store[0][0] = 99.0
+        with pytest.raises(ValueError):
+            store.flat()[0] = 99.0
+        assert store[0][0] == 1.0
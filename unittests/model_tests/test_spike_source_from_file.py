@@ -0,0 +1,44 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from spynnaker.pyNN.models.spike_source.spike_source_from_file import (
+    SpikeSourceFromFile)
+
+
+def _reference_subsample(spike_array, start, stop, step):
+    # Keep the first spike of each interval with enough spikes in it
+    result = dict()
+    for neuron, times in spike_array.items():
+        by_interval = dict()
+        for time in sorted(t for t in times if start <= t < stop):
+            by_interval.setdefault((time - start) // step, []).append(time)
+        result[neuron] = [
+            by_interval[interval][0] for interval in sorted(by_interval)
+            if len(by_interval[interval]) >= max(step // 2, 1)]
+    return result
+
+
+@pytest.mark.parametrize("step", [1, 2, 5, 10])
+def test_subsample_spikes_by_time(step):
+    rng = numpy.random.RandomState(step)
+    spike_array = {
+        neuron: list(rng.randint(0, 200, rng.randint(0, 100)) * 0.5)
+        for neuron in range(0, 20, 2)}
+    # pylint: disable=protected-access
+    assert SpikeSourceFromFile._subsample_spikes_by_time(
+        spike_array, 10, 90, step) == _reference_subsample(
+            spike_array, 10, 90, step)
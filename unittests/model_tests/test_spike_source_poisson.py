@@ -0,0 +1,182 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import struct
+import numpy
+import pytest
+from data_specification.enums import DataType
+from spynnaker.pyNN.models.spike_source import spike_source_poisson_vertex
+from spynnaker.pyNN.models.spike_source.spike_source_poisson_vertex import (
+    SLOW_RATE_PER_TICK_CUTOFF, FAST_RATE_PER_TICK_CUTOFF,
+    SpikeSourcePoissonVertex)
+from spynnaker.pyNN.models.spike_source.schedule_store import ScheduleStore
+from unittests.mocks import MockSimulator
+
+
+def _reference_rate_data(
+        rates, starts, durations, time_to_spike, rate_changed,
+        machine_time_step, first_machine_time_step):
+    # The original loop over each source
+    # pylint: disable=protected-access
+    convert = SpikeSourcePoissonVertex._convert_ms_to_n_timesteps
+    data = list()
+    for i in range(len(rates)):
+        starts_scaled = convert(starts[i], machine_time_step)
+        ends_scaled = numpy.zeros(len(durations[i]), dtype="uint32")
+        none_positions = numpy.isnan(durations[i])
+        positions = numpy.invert(none_positions)
+        ends_scaled[none_positions] = 0xFFFFFFFF
+        ends_scaled[positions] = convert(
+            starts[i][positions] + durations[i][positions],
+            machine_time_step)
+        next_scaled = numpy.append(starts_scaled[1:], 0xFFFFFFFF)
+        spikes_per_tick = rates[i] * (machine_time_step / 1000000.0)
+        is_fast_source = spikes_per_tick >= SLOW_RATE_PER_TICK_CUTOFF
+        is_faster_source = spikes_per_tick >= FAST_RATE_PER_TICK_CUTOFF
+        exp_minus_lambda = numpy.zeros(len(spikes_per_tick))
+        exp_minus_lambda[is_fast_source] = numpy.exp(
+            -1.0 * spikes_per_tick[is_fast_source])
+        sqrt_lambda = numpy.zeros(len(spikes_per_tick))
+        sqrt_lambda[is_faster_source] = numpy.sqrt(
+            spikes_per_tick[is_faster_source])
+        isi_val = numpy.zeros(len(spikes_per_tick), dtype="uint32")
+        elements = numpy.logical_not(
+            is_fast_source) & (spikes_per_tick > 0)
+        isi_val[elements] = (1.0 / spikes_per_tick[elements]).astype(int)
+        tts = time_to_spike[i]
+        if rate_changed[i]:
+            tts = numpy.array([0.0])
+        index = 0
+        while (ends_scaled[index] < first_machine_time_step and
+               (index + 1) < len(ends_scaled)):
+            index += 1
+        data.extend([len(rates[i]), index])
+        data.extend(numpy.dstack((
+            starts_scaled.astype("uint32"), ends_scaled.astype("uint32"),
+            next_scaled.astype("uint32"), is_fast_source.astype("uint32"),
+            DataType.U032.encode_as_numpy_int_array(exp_minus_lambda),
+            DataType.S1615.encode_as_numpy_int_array(sqrt_lambda),
+            isi_val.astype("uint32"), tts.astype("uint32")))[0].flatten())
+    return numpy.array(data, dtype="uint32")
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_poisson_rate_data_matches_reference(seed):
+    rng = numpy.random.RandomState(seed)
+    n_sources = rng.randint(1, 20)
+
+    # Even seeds have schedules of rates; odd seeds have one rate per source
+    # which might have been changed
+    variable = seed % 2 == 0
+    n_rates = [rng.randint(1, 6) if variable else 1
+               for _ in range(n_sources)]
+    rates = [rng.choice([0, 0.5, 5, 50, 500, 20000], n) for n in n_rates]
+    starts = [numpy.sort(rng.uniform(0, 1000, n)).round() for n in n_rates]
+    durations = [numpy.where(
+        rng.rand(n) < 0.3, numpy.nan, rng.uniform(1, 300, n).round())
+        for n in n_rates]
+    time_to_spike = [rng.randint(0, 50, n) for n in n_rates]
+    rate_changed = (rng.rand(n_sources) < 0.5) & (not variable)
+    machine_time_step = rng.choice([100, 1000])
+    first_machine_time_step = rng.randint(0, 15000)
+
+    # pylint: disable=protected-access
+    assert numpy.array_equal(
+        spike_source_poisson_vertex._poisson_rate_data(
+            n_rates, numpy.concatenate(rates), numpy.concatenate(starts),
+            numpy.concatenate(durations), numpy.concatenate(time_to_spike),
+            rate_changed, machine_time_step, first_machine_time_step),
+        _reference_rate_data(
+            rates, starts, durations, time_to_spike, rate_changed,
+            machine_time_step, first_machine_time_step))
+
+
+def test_poisson_rate_data_needs_rates():
+    # pylint: disable=protected-access
+    with pytest.raises(Exception):
+        spike_source_poisson_vertex._poisson_rate_data(
+            [1, 0, 1], numpy.array([5.0, 10.0]), numpy.zeros(2),
+            numpy.full(2, numpy.nan), numpy.zeros(2),
+            numpy.zeros(3, dtype="bool"), 1000, 0)
+
+
+@pytest.mark.parametrize("rates, starts, message", [
+    ([[1.0], 5.0, [2.0]], None, "must be a list"),
+    ([[1.0], [], [2.0]], [[0.0], [], [0.0]], "at least one rate")])
+def test_rates_are_checked(rates, starts, message):
+    MockSimulator.setup()
+    with pytest.raises(Exception, match=message):
+        SpikeSourcePoissonVertex(
+            3, None, "test", None, 100, None, rates=rates, starts=starts)
+
+
+def _reference_read(byte_array, n_sources, machine_time_step):
+    # The original read of each source in turn
+    # pylint: disable=protected-access
+    poisson_struct = spike_source_poisson_vertex._PoissonStruct
+    offset = 0
+    rates = list()
+    times_to_spike = list()
+    for _ in range(n_sources):
+        n_values = struct.unpack_from("<I", byte_array, offset)[0]
+        offset += 8
+        (_, _, _, is_fast_source, exp_minus_lambda, sqrt_lambda, isi,
+         time_to_next_spike) = poisson_struct.read_data(
+             byte_array, offset, n_values)
+        offset += poisson_struct.get_size_in_whole_words(n_values) * 4
+        is_fast_source = is_fast_source == 1.0
+        spikes_per_tick = numpy.zeros(len(is_fast_source))
+        spikes_per_tick[is_fast_source] = numpy.log(
+            exp_minus_lambda[is_fast_source]) * -1.0
+        is_faster_source = sqrt_lambda > 0
+        spikes_per_tick[is_faster_source] = numpy.square(
+            sqrt_lambda[is_faster_source])
+        slow_elements = isi > 0
+        spikes_per_tick[slow_elements] = 1.0 / isi[slow_elements]
+        rates.append(spikes_per_tick * (1000000.0 / machine_time_step))
+        times_to_spike.append(time_to_next_spike)
+    return rates, times_to_spike
+
+
+@pytest.mark.parametrize("n_rates", [[1] * 7, [3] * 5, [2, 1, 4, 1]])
+def test_read_poisson_rate_data(n_rates):
+    rng = numpy.random.RandomState(len(n_rates))
+    rates = [rng.choice([0, 0.5, 5, 50, 500, 20000], n) for n in n_rates]
+    starts = [numpy.arange(n) * 100.0 for n in n_rates]
+    durations = [numpy.full(n, numpy.nan) for n in n_rates]
+    time_to_spike = [rng.randint(0, 3, n) for n in n_rates]
+
+    # pylint: disable=protected-access
+    byte_array = bytearray(spike_source_poisson_vertex._poisson_rate_data(
+        n_rates, numpy.concatenate(rates), numpy.concatenate(starts),
+        numpy.concatenate(durations), numpy.concatenate(time_to_spike),
+        numpy.zeros(len(n_rates), dtype="bool"), 1000, 0).tobytes())
+    read_n_rates, read_rates, read_time_to_spike = \
+        spike_source_poisson_vertex._read_poisson_rate_data(
+            byte_array, len(n_rates), 1000)
+    expected_rates, expected_time_to_spike = _reference_read(
+        byte_array, len(n_rates), 1000)
+    assert numpy.array_equal(read_n_rates, n_rates)
+    assert numpy.array_equal(read_rates, numpy.concatenate(expected_rates))
+    assert numpy.array_equal(
+        read_time_to_spike, numpy.concatenate(expected_time_to_spike))
+
+    # The values of each source are set in a store after an offset
+    store = ScheduleStore(len(n_rates) + 3, numpy.array([7.0]))
+    store.set_neurons(2, read_n_rates, read_rates)
+    for i, expected in enumerate(expected_rates):
+        assert numpy.array_equal(store[i + 2], expected)
+    assert numpy.array_equal(store[0], [7.0])
+    assert numpy.array_equal(store[len(n_rates) + 2], [7.0])
@@ -0,0 +1,86 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from spynnaker.pyNN.models.spike_source.spike_trains import SpikeTrains
+
+
+def _random_lists(rng, n_neurons):
+    return [numpy.sort(rng.randint(0, 1000, rng.choice([0, 0, 1, 5]))) / 4.0
+            for _ in range(n_neurons)]
+
+
+def test_from_lists():
+    spike_times = [[1.0, 2.5], [], numpy.array([3.0]), [0.5, 7.0, 9.0]]
+    trains = SpikeTrains.from_lists(spike_times)
+    assert len(trains) == 4
+    for expected, actual in zip(spike_times, trains):
+        assert numpy.array_equal(expected, actual)
+    assert numpy.array_equal(trains[-1], [0.5, 7.0, 9.0])
+    assert numpy.array_equal(trains.n_spikes, [2, 0, 1, 3])
+    assert numpy.array_equal(
+        trains.times, [1.0, 2.5, 3.0, 0.5, 7.0, 9.0])
+    with pytest.raises(IndexError):
+        trains[4]  # pylint: disable=pointless-statement
+    assert len(SpikeTrains.from_lists([])) == 0
+
+
+def test_from_ids_and_times():
+    rng = numpy.random.RandomState(1)
+    spike_times = _random_lists(rng, 30)
+    ids = numpy.repeat(numpy.arange(30), [len(t) for t in spike_times])
+    times = numpy.concatenate(spike_times)
+    order = rng.permutation(len(ids))
+    trains = SpikeTrains.from_ids_and_times(30, ids[order], times[order])
+    for expected, actual in zip(spike_times, trains):
+        assert numpy.array_equal(expected, actual)
+
+
+@pytest.mark.parametrize("time_step", [100, 1000])
+def test_as_ticks(time_step):
+    rng = numpy.random.RandomState(time_step)
+    spike_times = _random_lists(rng, 50)
+    ticks = SpikeTrains.from_lists(spike_times).as_ticks(time_step)
+    for times, neuron_ticks in zip(spike_times, ticks):
+        assert numpy.array_equal(neuron_ticks, numpy.ceil(
+            numpy.floor(times * 1000.0) / time_step).astype("int64"))
+        assert neuron_ticks.dtype == numpy.dtype("int64")
+
+
+def test_slice_and_window():
+    rng = numpy.random.RandomState(2)
+    spike_times = _random_lists(rng, 40)
+    trains = SpikeTrains.from_lists(spike_times)
+
+    part = trains[10:25]
+    assert len(part) == 15
+    for expected, actual in zip(spike_times[10:25], part):
+        assert numpy.array_equal(expected, actual)
+    assert numpy.array_equal(
+        part.times, numpy.concatenate(spike_times[10:25]))
+    assert len(trains[30:20]) == 0
+
+    # A window of a slice
+    window = part.window(50.0, 150.0)
+    assert len(window) == 15
+    for expected, actual in zip(spike_times[10:25], window):
+        assert numpy.array_equal(
+            expected[(50.0 <= expected) & (expected < 150.0)], actual)
+
+    # The ticks of a slice
+    ticks = part.as_ticks(1000)
+    for expected, actual in zip(spike_times[10:25], ticks):
+        assert numpy.array_equal(numpy.ceil(expected), actual)
@@ -0,0 +1,181 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import pytest
+from spinn_utilities.overrides import overrides
+from spinn_machine.virtual_machine import virtual_machine
+from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.graphs.common import GraphMapper, Slice
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import ResourceContainer
+from spinn_front_end_common.abstract_models import (
+    AbstractGeneratesDataSpecification, AbstractRewritesDataSpecification)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.overridden_pacman_functions.\
+    spynnaker_data_specification_writer import (
+        SpynnakerDataSpecificationWriter)
+from unittests.mocks import MockSimulator
+
+
+def _write_spec(spec, placement, size):
+    spec.reserve_memory_region(0, size)
+    spec.reserve_memory_region(1, placement.p * 4 + 4)
+    spec.switch_write_focus(0)
+    spec.write_value(placement.x)
+    spec.write_value(placement.y)
+    spec.write_value(placement.p)
+    spec.end_specification()
+
+
+class _SpecMachineVertex(
+        SimpleMachineVertex, AbstractGeneratesDataSpecification):
+    """ A machine vertex that writes its own specification
+    """
+
+    def __init__(self, size):
+        super(_SpecMachineVertex, self).__init__(ResourceContainer())
+        self.__size = size
+
+    @overrides(AbstractGeneratesDataSpecification.generate_data_specification)
+    def generate_data_specification(self, spec, placement):
+        _write_spec(spec, placement, self.__size)
+
+
+class _AppVertex(ApplicationVertex):
+
+    def __init__(self, n_atoms):
+        super(_AppVertex, self).__init__()
+        self._n_atoms = n_atoms
+
+    @property
+    @overrides(ApplicationVertex.n_atoms)
+    def n_atoms(self):
+        return self._n_atoms
+
+    @overrides(ApplicationVertex.create_machine_vertex)
+    def create_machine_vertex(
+            self, vertex_slice, resources_required, label=None,
+            constraints=None):
+        return SimpleMachineVertex(resources_required, label, constraints)
+
+    @overrides(ApplicationVertex.get_resources_used_by_atoms)
+    def get_resources_used_by_atoms(self, vertex_slice):
+        return ResourceContainer()
+
+
+class _SpecAppVertex(
+        _AppVertex, AbstractGeneratesDataSpecification,
+        AbstractRewritesDataSpecification):
+    """ An application vertex that writes the specifications of its machine\
+        vertices, counting the times its regions are marked as reloaded
+    """
+
+    def __init__(self, n_atoms):
+        super(_SpecAppVertex, self).__init__(n_atoms)
+        self.n_reloaded = 0
+
+    @overrides(AbstractGeneratesDataSpecification.generate_data_specification)
+    def generate_data_specification(self, spec, placement):
+        _write_spec(spec, placement, 64)
+
+    @overrides(AbstractRewritesDataSpecification.regenerate_data_specification)
+    def regenerate_data_specification(self, spec, placement):
+        pass
+
+    @overrides(AbstractRewritesDataSpecification.
+               requires_memory_regions_to_be_reloaded)
+    def requires_memory_regions_to_be_reloaded(self):
+        return False
+
+    @overrides(AbstractRewritesDataSpecification.mark_regions_reloaded)
+    def mark_regions_reloaded(self):
+        self.n_reloaded += 1
+
+
+def _graph(machine_vertex_size):
+    # The cores of an application vertex writing its specifications share a
+    # chip with the cores of a vertex that does not write any; the cores of
+    # a vertex writing its specifications at the machine level are on
+    # another chip
+    placements = Placements()
+    graph_mapper = GraphMapper()
+    app_vertices = [_SpecAppVertex(8), _AppVertex(4), _AppVertex(6)]
+    for i in range(4):
+        for j, app_vertex in enumerate(app_vertices):
+            if i >= app_vertex.n_atoms // 2:
+                continue
+            if isinstance(app_vertex, _SpecAppVertex):
+                vertex = SimpleMachineVertex(ResourceContainer())
+            elif app_vertex.n_atoms == 4:
+                vertex = _SpecMachineVertex(machine_vertex_size)
+            else:
+                vertex = SimpleMachineVertex(ResourceContainer())
+            graph_mapper.add_vertex_mapping(
+                vertex, Slice(i * 2, i * 2 + 1), app_vertex)
+            placements.add_placement(
+                Placement(vertex, j % 2, 0, i * 3 + j + 1))
+    return placements, graph_mapper, app_vertices[0]
+
+
+def _run_writer(directory, n_threads, machine_vertex_size=128):
+    simulator = MockSimulator.setup()
+    simulator.config["Simulation"]["n_data_specification_threads"] = str(
+        n_threads)
+    placements, graph_mapper, spec_app_vertex = _graph(machine_vertex_size)
+    os.mkdir(directory)
+    writer = SpynnakerDataSpecificationWriter()
+    targets = writer(
+        placements, "localhost", directory, False, virtual_machine(2, 2), 10,
+        graph_mapper)
+    return writer, targets, spec_app_vertex
+
+
+def _chip_region_sizes(writer):
+    # pylint: disable=protected-access
+    return {
+        chip: sorted(writer._region_sizes[vertex] for vertex in vertices)
+        for chip, vertices in writer._vertices_by_chip.items()}
+
+
+def test_parallel_matches_serial(tmpdir):
+    # pylint: disable=protected-access
+    serial, serial_targets, serial_vertex = _run_writer(
+        os.path.join(str(tmpdir), "serial"), 1)
+    parallel, parallel_targets, parallel_vertex = _run_writer(
+        os.path.join(str(tmpdir), "parallel"), 2)
+
+    # The same cores have the same specifications
+    specs = {core: bytes(reader.read())
+             for core, reader in serial_targets.items()}
+    assert len(specs) == 6
+    assert specs == {core: bytes(reader.read())
+                     for core, reader in parallel_targets.items()}
+
+    # The SDRAM of each chip is accounted for in the same way
+    assert dict(serial._sdram_usage) == dict(parallel._sdram_usage)
+    assert len(serial._region_sizes) == len(parallel._region_sizes) == 6
+    assert _chip_region_sizes(serial) == _chip_region_sizes(parallel)
+
+    # Every generated core of a rewriting vertex marks it as reloaded
+    assert serial_vertex.n_reloaded == parallel_vertex.n_reloaded == 4
+
+
+@pytest.mark.parametrize("n_threads", [1, 2])
+def test_too_much_sdram(tmpdir, n_threads):
+    # Two machine vertices on a chip of 117MB, each using 64MB
+    with pytest.raises(ConfigurationException, match="Too much SDRAM"):
+        _run_writer(str(tmpdir.join("specs")), n_threads, 64 * 1024 * 1024)
@@ -15,8 +15,11 @@
 
 import pytest
 import numpy
+from pacman.executor.injection_decorator import injection_context
+from pacman.model.graphs.common import Slice
 from spynnaker.pyNN.models.neuron import (
     AbstractPopulationVertex, AbstractPyNNNeuronModelStandard)
+from spynnaker.pyNN.models.neuron.builds import IFCurrExpBase
 from spynnaker.pyNN.models.neuron.synapse_types import AbstractSynapseType
 from spynnaker.pyNN.models.neuron.neuron_models import AbstractNeuronModel
 from spynnaker.pyNN.models.defaults import default_initial_values, defaults
@@ -159,3 +162,86 @@ def test_initial_values():
     assert "bar" in initial_values
     initial_values = neuron.get_initial_values(selector=3)
     assert {"foo": [1], "bar": [11]} == initial_values
+
+
+class _MockSpec(object):
+    """ Records the data written to a data specification
+    """
+
+    def __init__(self):
+        self.data = list()
+
+    def comment(self, comment):
+        pass
+
+    def switch_write_focus(self, region):
+        pass
+
+    def write_value(self, data):
+        self.data.append(numpy.array([data], dtype="uint32"))
+
+    def write_array(self, array_values):
+        self.data.append(numpy.asarray(array_values, dtype="uint32"))
+
+
+def _write_neuron_parameters(vertex, vertex_slice):
+    # pylint: disable=protected-access
+    spec = _MockSpec()
+    with injection_context({"MachineTimeStep": 1000}):
+        vertex._write_neuron_parameters(spec, None, vertex_slice, 1000, 1)
+    # Skip the random back off, which changes with each write
+    return bytearray(numpy.concatenate(spec.data)[1:].tobytes())
+
+
+def _get_changes(vertex, vertex_slice):
+    # pylint: disable=protected-access
+    with injection_context({"MachineTimeStep": 1000}):
+        return vertex._get_changed_neuron_parameters(vertex_slice)
+
+
+def _vertex(vertex_slice):
+    vertex = IFCurrExpBase().create_vertex(10, "Test", None, None, None, None)
+    vertex.create_machine_vertex(vertex_slice, None)
+    return vertex
+
+
+def test_rewrite_changed_neurons():
+    MockSimulator.setup()
+    vertex_slice = Slice(2, 9)
+    vertex = _vertex(vertex_slice)
+    data = _write_neuron_parameters(vertex, vertex_slice)
+    assert _get_changes(vertex, vertex_slice) == []
+
+    # Writing just the changes gives the same data as rewriting it all
+    vertex.set_value_by_selector([0, 4, 5], "i_offset", 2.0)
+    vertex.set_value_by_selector(8, "tau_m", 15.0)
+    assert vertex.requires_memory_regions_to_be_reloaded()
+    changes = _get_changes(vertex, vertex_slice)
+    assert changes
+    for offset, changed in changes:
+        # The data written doesn't include the random back off
+        offset -= 4
+        data[offset:offset + len(changed)] = changed
+    assert data == _write_neuron_parameters(vertex, vertex_slice)
+    assert _get_changes(vertex, vertex_slice) == []
+
+    # After a reset, everything is rewritten
+    vertex.reset_to_first_timestep()
+    assert _get_changes(vertex, vertex_slice) is None
+
+
+def test_reset_copies_only_changed_state():
+    # pylint: disable=protected-access
+    MockSimulator.setup()
+    vertex_slice = Slice(0, 9)
+    vertex = _vertex(vertex_slice)
+    _write_neuron_parameters(vertex, vertex_slice)
+    v_list = vertex._state_variables.get_list("v")
+    isyn_list = vertex._state_variables.get_list("isyn_exc")
+    isyn_list.set_value_by_id(3, 1.5)
+
+    vertex.reset_to_first_timestep()
+    _write_neuron_parameters(vertex, vertex_slice)
+    assert vertex._state_variables.get_list("v") is v_list
+    assert vertex._state_variables.get_list("isyn_exc") is not isyn_list
+    assert list(vertex.get_initial_value("isyn_exc")) == [0.0] * 10
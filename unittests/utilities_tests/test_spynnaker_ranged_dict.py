@@ -0,0 +1,75 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spynnaker.pyNN.utilities.ranged import (
+    SpynnakerRangeDictionary, SpynnakerRangedList)
+
+
+def _clean_dict():
+    ranged_dict = SpynnakerRangeDictionary(20)
+    ranged_dict["a"] = 1.0
+    ranged_dict["b"] = 2.0
+    ranged_dict.mark_clean(0, 20)
+    return ranged_dict
+
+
+def test_new_list_is_dirty():
+    ranged_list = SpynnakerRangedList(10, 1.0)
+    assert numpy.all(ranged_list.get_dirty(0, 10))
+    ranged_list.mark_clean(2, 10)
+    assert numpy.array_equal(
+        ranged_list.get_dirty(0, 4), [True, True, False, False])
+
+
+def test_dirty_ranges():
+    ranged_dict = _clean_dict()
+    assert ranged_dict.get_dirty_ranges(0, 20) == []
+
+    ranged_dict["a"].set_value_by_slice(3, 6, 5.0)
+    ranged_dict["b"].set_value_by_id(6, 7.0)
+    ranged_dict["b"].set_value_by_selector([10, 12], [1.0, 3.0])
+    assert ranged_dict.get_dirty_ranges(0, 20) == [
+        (3, 7), (10, 11), (12, 13)]
+    assert ranged_dict.get_dirty_ranges(4, 11) == [(4, 7), (10, 11)]
+
+    ranged_dict.mark_clean(0, 11)
+    assert ranged_dict.get_dirty_ranges(0, 20) == [(12, 13)]
+
+    ranged_dict.set_value("a", 4.0)
+    assert ranged_dict.get_dirty_ranges(0, 20) == [(0, 20)]
+
+
+def test_n_changes():
+    ranged_dict = _clean_dict()
+    ranged_list = ranged_dict.get_list("a")
+    n_changes = ranged_list.n_changes
+    ranged_dict.mark_clean(0, 20)
+    ranged_dict.get_dirty_ranges(0, 20)
+    assert ranged_list.n_changes == n_changes
+    ranged_list[5] = 3.0
+    assert ranged_list.n_changes > n_changes
+
+
+def test_restore_dirty():
+    ranged_dict = _clean_dict()
+    ranged_dict["a"].set_value_by_id(4, 5.0)
+    dirty = ranged_dict.get_dirty(0, 10)
+
+    # Values read from the machine don't count as changes
+    ranged_dict["a"].set_value_by_slice(0, 10, 8.0)
+    ranged_dict["b"].set_value_by_slice(0, 10, 8.0)
+    ranged_dict.set_dirty(0, dirty)
+    assert ranged_dict.get_dirty_ranges(0, 20) == [(4, 5)]
@@ -0,0 +1,93 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import numpy
+import pytest
+from spinn_utilities.safe_eval import SafeEval
+from spynnaker.pyNN.utilities import utility_calls
+
+
+def _reference_read_spikes(file_path, min_atom, max_atom, min_time, max_time):
+    # The original line-by-line read
+    data = []
+    evaluator = SafeEval()
+    with open(file_path, 'r') as f_source:
+        for line in f_source.readlines():
+            if line.startswith('#'):
+                continue
+            values = line.split("\t")
+            time = float(evaluator.eval(values[0]))
+            neuron_id = float(evaluator.eval(values[1]))
+            if (min_atom <= neuron_id < max_atom and
+                    min_time <= time < max_time):
+                data.append([neuron_id, time])
+    data.sort()
+    return numpy.array(data)
+
+
+def _write_spikes(tmpdir, rng, n_spikes, expressions=False):
+    times = rng.randint(0, 1000, n_spikes) / 4.0
+    ids = rng.randint(0, 50, n_spikes)
+    path = os.path.join(str(tmpdir), "spikes.txt")
+    with open(path, "w") as f:
+        f.write("# time\tneuron\n")
+        for i, (time, neuron_id) in enumerate(zip(times, ids)):
+            if expressions and i % 7 == 0:
+                f.write("{}+0.5\t{}\n".format(time - 0.5, neuron_id))
+            else:
+                f.write("{}\t{}\n".format(time, neuron_id))
+    return path, times, ids
+
+
+@pytest.mark.parametrize("expressions", [False, True])
+def test_read_spikes_from_file(tmpdir, expressions):
+    rng = numpy.random.RandomState(3)
+    path, _, _ = _write_spikes(tmpdir, rng, 1000, expressions)
+    for limits in [(0, float('inf'), 0, float('inf')), (5, 30, 20.0, 200.5)]:
+        assert numpy.array_equal(
+            utility_calls.read_spikes_from_file(path, *limits),
+            _reference_read_spikes(path, *limits))
+
+
+def test_read_spikes_from_numpy_files(tmpdir):
+    rng = numpy.random.RandomState(4)
+    path, times, ids = _write_spikes(tmpdir, rng, 500)
+    expected = utility_calls.read_spikes_from_file(path, 3, 40, 10, 150)
+
+    npy_path = os.path.join(str(tmpdir), "spikes.npy")
+    numpy.save(npy_path, numpy.column_stack((times, ids)))
+    assert numpy.array_equal(
+        utility_calls.read_spikes_from_file(npy_path, 3, 40, 10, 150),
+        expected)
+
+    npz_path = os.path.join(str(tmpdir), "spikes.npz")
+    numpy.savez(npz_path, times=times, ids=ids)
+    assert numpy.array_equal(
+        utility_calls.read_spikes_from_file(npz_path, 3, 40, 10, 150),
+        expected)
+
+
+def test_read_in_data_from_file(tmpdir):
+    path = os.path.join(str(tmpdir), "gsyn.data")
+    with open(path, "w") as f:
+        f.write("# time\tneuron\tgsyn\textra\n")
+        f.write("1.0\t2\t0.5\tx\n")
+        f.write("0.0\t2\t0.25\tx\n")
+        f.write("0.0\t1\t1.5\tx\n")
+        f.write("0.0\t9\t2.5\tx\n")
+    assert numpy.array_equal(
+        utility_calls.read_in_data_from_file(path, 0, 5, 0, 10, True),
+        [[1, 0.0, 1.5], [2, 0.0, 0.25], [2, 1.0, 0.5]])